@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /benchmarks/dao_bulk.py                                                             #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday January 14th 2023 02:36:12 pm                                              #
+# Modified   : Saturday January 14th 2023 02:36:12 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Compares row-at-a-time and batched inserts and updates of TaskDTOs through the TaskDAO.
+
+Runs against the MySQL database configured for the current mode, and resets the task table
+before and after the run.
+
+Usage:
+    python -m benchmarks.dao_bulk --n 10000
+"""
+import argparse
+from datetime import datetime
+from time import perf_counter
+
+import recsys.containers
+from recsys.containers import Recsys
+from recsys.core.dal.dto import TaskDTO
+
+
+# ------------------------------------------------------------------------------------------------ #
+def build_dtos(n: int) -> list:
+    return [
+        TaskDTO(
+            id=None,
+            oid=f"task_bench_{i}",
+            name=f"task_bench_{i}",
+            description=f"Benchmark task {i}",
+            mode="test",
+            state="CREATED",
+            parent_id=1,
+            created=datetime.now(),
+            modified=None,
+        )
+        for i in range(n)
+    ]
+
+
+def timed(fn, *args) -> float:
+    start = perf_counter()
+    fn(*args)
+    return perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=10000, help="Number of TaskDTO rows.")
+    args = parser.parse_args()
+
+    container = Recsys()
+    container.init_resources()
+    container.wire(modules=[recsys.containers])
+    dba = container.dba.task()
+    dao = container.dal.task()
+
+    def create_each(dtos):
+        dao.begin()
+        for dto in dtos:
+            dao.create(dto)
+        dao.save()
+
+    def create_many(dtos):
+        dao.begin()
+        dao.create_many(dtos)
+        dao.save()
+
+    def update_each(dtos):
+        dao.begin()
+        for dto in dtos:
+            dao.update(dto)
+        dao.save()
+
+    def update_many(dtos):
+        dao.begin()
+        dao.update_many(dtos)
+        dao.save()
+
+    try:
+        dba.reset()
+        create_each_time = timed(create_each, build_dtos(args.n))
+        dba.reset()
+        dtos = build_dtos(args.n)
+        create_many_time = timed(create_many, dtos)
+        for dto in dtos:
+            dto.state = "COMPLETE"
+        update_each_time = timed(update_each, dtos)
+        update_many_time = timed(update_many, dtos)
+    finally:
+        dba.reset()
+        dao.close()
+
+    results = {"create": (create_each_time, create_many_time), "update": (update_each_time, update_many_time)}
+    print(f"\nTaskDAO throughput (rows per second), n = {args.n}")
+    print(f"{'Operation':<12}{'Per row':>14}{'Batched':>14}{'Speedup':>10}")
+    for operation, (each, many) in results.items():
+        print(f"{operation:<12}{args.n / each:>14.0f}{args.n / many:>14.0f}{each / many:>9.1f}x")
+
+
+# ------------------------------------------------------------------------------------------------ #
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /benchmarks/dao_prepared.py                                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday January 15th 2023 02:47:10 pm                                                #
+# Modified   : Sunday January 15th 2023 02:47:10 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Compares DAO create and read latency with per-call SQL command objects and prepared statements.
+
+The per-call path instantiates the DML command dataclass for every call, as the DAO did before
+prepared statements. Runs against a SQLite database in a temporary directory.
+
+Usage:
+    python -m benchmarks.dao_prepared --n 100000
+"""
+import os
+import shutil
+import logging
+import argparse
+import tempfile
+from datetime import datetime
+from time import perf_counter
+
+from recsys.core.dal.dao import TaskDAO
+from recsys.core.dal.dba import DBA
+from recsys.core.dal.dto import TaskDTO
+from recsys.core.dal.sql.task import TaskDDL, TaskDML
+from recsys.core.database.relational import Database, SQLiteConnection
+
+
+# ------------------------------------------------------------------------------------------------ #
+def build_dtos(n: int) -> list:
+    return [
+        TaskDTO(
+            id=None,
+            oid=f"task_bench_{i}",
+            name=f"task_bench_{i}",
+            description=f"Benchmark task {i}",
+            mode="test",
+            state="CREATED",
+            parent_id=1,
+            created=datetime.now(),
+            modified=None,
+        )
+        for i in range(n)
+    ]
+
+
+class PerCallTaskDAO(TaskDAO):
+    """TaskDAO that builds a SQL command object on every call, as the DAO did before."""
+
+    def create(self, dto: TaskDTO) -> TaskDTO:
+        cmd = self._dml.insert(dto)
+        dto.id = self._database.insert(cmd.sql, cmd.args)
+        msg = f"{self.__class__.__name__} inserted {self._entity.__name__}.{dto.id} - {dto.name} into the database."
+        self._logger.debug(msg)
+        return dto
+
+    def read(self, id: int) -> TaskDTO:
+        cmd = self._dml.select(id)
+        dto = self._database.select(cmd.sql, cmd.args, row_factory=self._mapper)
+        return dto if dto is not None else []
+
+
+def run(dao: TaskDAO, dba: DBA, n: int) -> dict:
+    """Returns the mean create and read latency in microseconds."""
+    dba.reset()
+    dtos = build_dtos(n)
+    dao.begin()
+    start = perf_counter()
+    for dto in dtos:
+        dao.create(dto)
+    create = perf_counter() - start
+    dao.save()
+
+    start = perf_counter()
+    for dto in dtos:
+        dao.read(dto.id)
+    read = perf_counter() - start
+
+    # Statement and argument preparation alone, without the round trip to the database.
+    start = perf_counter()
+    if isinstance(dao, PerCallTaskDAO):
+        for dto in dtos:
+            dao._dml.insert(dto).args
+    else:
+        for dto in dtos:
+            dao._database.prepare(dao._dml.insert).bind(dto)
+    bind = perf_counter() - start
+    return {"create": create / n * 1e6, "read": read / n * 1e6, "bind": bind / n * 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=100000, help="Number of operations of each kind.")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    directory = tempfile.mkdtemp()
+    try:
+        database = Database(connection=SQLiteConnection(location=os.path.join(directory, "recsys.sqlite3")))
+        dba = DBA(ddl=TaskDDL(), database=database)
+        per_call = run(PerCallTaskDAO(dml=TaskDML(), database=database), dba, args.n)
+        prepared = run(TaskDAO(dml=TaskDML(), database=database), dba, args.n)
+        database.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"\nTaskDAO latency per operation (microseconds), n = {args.n}")
+    print(f"{'Operation':<12}{'Per call':>14}{'Prepared':>14}{'Speedup':>10}")
+    for operation in per_call.keys():
+        speedup = per_call[operation] / prepared[operation]
+        print(f"{operation:<12}{per_call[operation]:>14.1f}{prepared[operation]:>14.1f}{speedup:>9.2f}x")
+
+
+# ------------------------------------------------------------------------------------------------ #
+if __name__ == "__main__":
+    main()
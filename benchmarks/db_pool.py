@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /benchmarks/db_pool.py                                                              #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday January 14th 2023 12:20:51 pm                                              #
+# Modified   : Saturday January 14th 2023 12:20:51 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Compares per-statement connect/disconnect against a pooled relational connection.
+
+MySQL isn't required: the connection is a SQLite stand-in whose connect sleeps for --latency
+milliseconds, modelling the TCP handshake and authentication round trips of a MySQL connect.
+
+Usage:
+    python -m benchmarks.db_pool --n 1000 --threads 4 --latency 5
+"""
+import os
+import shutil
+import sqlite3
+import argparse
+import tempfile
+import threading
+from time import perf_counter, sleep
+
+from recsys.core.database.base import Connection
+
+
+# ------------------------------------------------------------------------------------------------ #
+class SQLiteConnection(Connection):
+    """SQLite stand-in for a MySQL connection, with a simulated connect latency."""
+
+    def __init__(self, location: str, latency: float, pool_size: int = None) -> None:
+        super().__init__(pool_size=pool_size)
+        self._location = location
+        self._latency = latency
+
+    def begin(self) -> None:
+        self._connection.execute("BEGIN")
+        self._in_transaction = True
+
+    def _create(self):
+        sleep(self._latency)
+        return sqlite3.connect(self._location, timeout=30, check_same_thread=False)
+
+
+# ------------------------------------------------------------------------------------------------ #
+def run(location: str, n: int, threads: int, latency: float, pool_size: int = None) -> float:
+    """Runs n single row selects per thread and returns the mean latency in microseconds."""
+    connection = SQLiteConnection(location=location, latency=latency, pool_size=pool_size)
+
+    def work():
+        # Mirrors Database with autoclose: connect, execute, fetch and close per statement.
+        for i in range(n):
+            connection.open()
+            cursor = connection.cursor
+            cursor.execute("SELECT id, name FROM entity WHERE id = ?", (i % 100,))
+            cursor.fetchone()
+            cursor.close()
+            connection.close()
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    start = perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = perf_counter() - start
+    if connection.pool is not None:
+        connection.pool.close()
+    return elapsed / (n * threads) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=1000, help="Statements per thread.")
+    parser.add_argument("--threads", type=int, default=4, help="Number of threads.")
+    parser.add_argument("--latency", type=float, default=5, help="Simulated connect latency (ms).")
+    parser.add_argument("--pool-size", type=int, default=8, help="Maximum pooled connections.")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    location = os.path.join(directory, "pool.sqlite3")
+    try:
+        with sqlite3.connect(location) as cnx:
+            cnx.execute("CREATE TABLE entity (id INTEGER PRIMARY KEY, name TEXT)")
+            cnx.executemany("INSERT INTO entity VALUES (?, ?)", [(i, f"entity_{i}") for i in range(100)])
+        latency = args.latency / 1000
+        unpooled = run(location, args.n, args.threads, latency)
+        pooled = run(location, args.n, args.threads, latency, pool_size=args.pool_size)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"\nMean statement latency (microseconds), {args.threads} threads x {args.n} statements")
+    print(f"{'Connect per statement':<24}{unpooled:>14.1f}")
+    print(f"{'Pooled':<24}{pooled:>14.1f}{unpooled / pooled:>9.1f}x")
+
+
+# ------------------------------------------------------------------------------------------------ #
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /benchmarks/job_update.py                                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Tuesday January 17th 2023 10:14:32 am                                               #
+# Modified   : Tuesday January 17th 2023 10:14:32 am                                               #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Compares JobRepo updates that rewrite every task with updates that write only changed tasks.
+
+Each update flips the state of one task in a job, as an operator does on completion, and
+persists the job. The full path rewrites every task row, as JobRepo.update did before child
+change tracking. Runs against SQLite and object databases in a temporary directory.
+
+Usage:
+    python -m benchmarks.job_update --tasks 200 --n 200
+"""
+import os
+import shutil
+import logging
+import argparse
+import tempfile
+from time import perf_counter
+
+from dependency_injector import providers
+
+from recsys.containers import DALContainer
+from recsys.core.dal.cache import EntityCache
+from recsys.core.dal.dba import DBA
+from recsys.core.dal.sql.job import JobDDL
+from recsys.core.dal.sql.task import TaskDDL
+from recsys.core.database.object import ObjectDB, ObjectDBConnection
+from recsys.core.database.relational import Database, SQLiteConnection
+from recsys.core.entity.base import Entity
+from recsys.core.entity.job import Job
+from recsys.core.repo.context import Context
+from recsys.core.repo.job import JobRepo
+
+
+# ------------------------------------------------------------------------------------------------ #
+class FullJobRepo(JobRepo):
+    """JobRepo that rewrites every task on update, as the repository did before."""
+
+    def update(self, entity: Entity) -> None:
+        self._task_dao.update_many([task.as_dto() for task in entity.tasks.values()])
+        self._job_dao.update(dto=entity.as_dto())
+        self._oao.update(entity)
+        self._context.identity_map.clean(entity)
+
+
+def build_job(name: str, tasks: int) -> Job:
+    job = Job(name=name, description=f"Benchmark job with {tasks} tasks", mode="test")
+    for i in range(tasks):
+        job.add_task(job.create_task(name=f"{name}_task_{i}", description=f"Benchmark task {i}"))
+    return job
+
+
+def run(repo: JobRepo, context: Context, name: str, tasks: int, n: int) -> float:
+    """Returns the mean update latency in milliseconds."""
+    job = repo.add(build_job(name, tasks))
+    context.save()
+    names = list(job.tasks.keys())
+    start = perf_counter()
+    for i in range(n):
+        task = job.get_task(names[i % tasks])
+        task.state = "COMPLETE" if task.state != "COMPLETE" else "IN-PROGRESS"
+        job.update_task(task)
+        repo.update(job)
+        context.save()
+    return (perf_counter() - start) / n * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=200, help="Number of tasks in the job.")
+    parser.add_argument("--n", type=int, default=200, help="Number of updates.")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    directory = tempfile.mkdtemp()
+    try:
+        rdb = Database(connection=SQLiteConnection(location=os.path.join(directory, "recsys.sqlite3")))
+        odb = ObjectDB(connection=ObjectDBConnection(location=os.path.join(directory, "objects"), persistent=True))
+        for ddl in (JobDDL(), TaskDDL()):
+            DBA(ddl=ddl, database=rdb).reset()
+        dal = DALContainer(rdb=providers.Object(rdb), odb=providers.Object(odb),
+                           entity_cache=providers.Object(EntityCache()))
+        context = Context(dal)
+        full = run(FullJobRepo(context), context, "full", args.tasks, args.n)
+        partial = run(JobRepo(context), context, "partial", args.tasks, args.n)
+        context.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"\nJobRepo update latency (milliseconds), tasks = {args.tasks}, n = {args.n}")
+    print(f"{'Full':>10}{'Partial':>10}{'Speedup':>10}")
+    print(f"{full:>10.2f}{partial:>10.2f}{full / partial:>9.1f}x")
+
+
+# ------------------------------------------------------------------------------------------------ #
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /benchmarks/odb_backend.py                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday January 12th 2023 10:31:44 pm                                              #
+# Modified   : Thursday January 12th 2023 10:31:44 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Compares the latency of the shelve and SQLite object database backends.
+
+Usage:
+    python -m benchmarks.odb_backend --n 10000
+"""
+import os
+import shutil
+import argparse
+import tempfile
+
+from benchmarks.odb_cursor import build_files, run
+
+
+# ------------------------------------------------------------------------------------------------ #
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=10000, help="Number of entities.")
+    parser.add_argument("--per-call", action="store_true", help="Open and close the store on every call.")
+    args = parser.parse_args()
+
+    files = build_files(args.n)
+    persistent = not args.per_call
+    directory = tempfile.mkdtemp()
+    try:
+        shelve = run(os.path.join(directory, "shelve", "odb"), files, persistent=persistent, backend="shelve")
+        sqlite = run(os.path.join(directory, "sqlite", "odb"), files, persistent=persistent, backend="sqlite")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    mode = "persistent" if persistent else "open/close per call"
+    print(f"\nObject database latency per entity (microseconds), n = {args.n}, {mode}")
+    print(f"{'Operation':<24}{'Shelve':>14}{'SQLite':>14}{'Speedup':>10}")
+    for operation in shelve.keys():
+        speedup = shelve[operation] / sqlite[operation] if sqlite[operation] else float("nan")
+        print(f"{operation:<24}{shelve[operation]:>14.1f}{sqlite[operation]:>14.1f}{speedup:>9.1f}x")
+
+
+# ------------------------------------------------------------------------------------------------ #
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /benchmarks/odb_cursor.py                                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Wednesday January 11th 2023 08:15:02 pm                                             #
+# Modified   : Wednesday January 11th 2023 08:15:02 pm                                             #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Benchmarks per-entity latency of the object database with and without persistent cursors.
+
+Usage:
+    python -m benchmarks.odb_cursor --n 10000
+"""
+import os
+import shutil
+import argparse
+import tempfile
+from time import perf_counter
+
+from recsys.core.database.object import ObjectDBConnection, ObjectDB
+from recsys.core.entity.file import File
+
+
+# ------------------------------------------------------------------------------------------------ #
+def build_files(n: int) -> list:
+    """Creates n small File entities."""
+    return [File(name=f"file_{i}", datasource_id=1, stage="extract", uri=f"data/file_{i}.csv", mode="test") for i in range(n)]
+
+
+# ------------------------------------------------------------------------------------------------ #
+def timeit(func, entities: list) -> float:
+    """Returns the mean latency in microseconds per entity for func."""
+    start = perf_counter()
+    for entity in entities:
+        func(entity)
+    return (perf_counter() - start) / len(entities) * 1e6
+
+
+# ------------------------------------------------------------------------------------------------ #
+def run(location: str, files: list, persistent: bool, backend: str = "shelve") -> dict:
+    """Runs insert, select, update and transactional insert workloads against an object database."""
+    results = {}
+    db = ObjectDB(connection=ObjectDBConnection(location=location, persistent=persistent, backend=backend))
+    db.drop()
+
+    results["insert"] = timeit(db.insert, files)
+    results["select"] = timeit(lambda file: db.select(file.oid), files)
+    results["update"] = timeit(db.update, files)
+    db.close()
+
+    db.drop()
+    db.begin()
+    results["insert (transaction)"] = timeit(db.insert, files)
+    start = perf_counter()
+    db.save()
+    results["commit"] = (perf_counter() - start) / len(files) * 1e6
+    db.close()
+    db.drop()
+    return results
+
+
+# ------------------------------------------------------------------------------------------------ #
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=10000, help="Number of entities.")
+    args = parser.parse_args()
+
+    files = build_files(args.n)
+    directory = tempfile.mkdtemp()
+    try:
+        before = run(os.path.join(directory, "per_call", "odb"), files, persistent=False)
+        after = run(os.path.join(directory, "persistent", "odb"), files, persistent=True)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"\nObject database latency per entity (microseconds), n = {args.n}")
+    print(f"{'Operation':<24}{'Open/close per call':>22}{'Persistent':>14}{'Speedup':>10}")
+    for operation in before.keys():
+        speedup = before[operation] / after[operation] if after[operation] else float("nan")
+        print(f"{operation:<24}{before[operation]:>22.1f}{after[operation]:>14.1f}{speedup:>9.1f}x")
+
+
+# ------------------------------------------------------------------------------------------------ #
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /benchmarks/odb_serializer.py                                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday January 13th 2023 05:48:33 pm                                                #
+# Modified   : Friday January 13th 2023 05:48:33 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Compares object database serializers on MovieLens-sized datasets.
+
+Reports bytes on disk and write/read throughput of a Dataset holding a ratings DataFrame, stored
+in the SQLite backend with each serializer configuration. zstd and lz4 are included when their
+packages are installed.
+
+Usage:
+    python -m benchmarks.odb_serializer --rows 1000000
+"""
+import os
+import shutil
+import argparse
+import tempfile
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from recsys.core.database.backend import SQLiteBackend
+from recsys.core.database.serializer import Serializer, ZstdCodec, LZ4Codec
+from recsys.core.entity.dataset import Dataset
+
+
+# ------------------------------------------------------------------------------------------------ #
+def build_ratings(rows: int, seed: int = 55) -> pd.DataFrame:
+    """Creates a ratings DataFrame with the MovieLens schema."""
+    rng = np.random.default_rng(seed)
+    users = max(rows // 150, 1)
+    return pd.DataFrame(
+        {
+            "userId": np.sort(rng.integers(1, users + 1, rows)).astype("int32"),
+            "movieId": rng.integers(1, 60000, rows).astype("int32"),
+            "rating": (rng.integers(1, 11, rows) / 2).astype("float32"),
+            "timestamp": rng.integers(789652009, 1574327703, rows).astype("int64"),
+        }
+    )
+
+
+# ------------------------------------------------------------------------------------------------ #
+def configurations() -> dict:
+    """Returns the serializers to compare, keyed by label."""
+    serializers = {
+        "pickle 4": Serializer(protocol=4),
+        "pickle 5": Serializer(protocol=5),
+        "pickle 5 + zlib": Serializer(protocol=5, compression="zlib"),
+    }
+    if ZstdCodec.available():
+        serializers["pickle 5 + zstd"] = Serializer(protocol=5, compression="zstd")
+    if LZ4Codec.available():
+        serializers["pickle 5 + lz4"] = Serializer(protocol=5, compression="lz4")
+    return serializers
+
+
+# ------------------------------------------------------------------------------------------------ #
+def run(location: str, dataset: Dataset, serializer: Serializer, repeat: int) -> dict:
+    """Writes and reads the dataset repeat times, returning bytes on disk and throughput in MB/s."""
+    backend = SQLiteBackend(location=location, serializer=serializer)
+    backend.drop()
+    backend.open()
+    nbytes = dataset.get_dataframe().data.memory_usage(index=False).sum()
+
+    start = perf_counter()
+    for _ in range(repeat):
+        backend[dataset.oid] = dataset
+        backend.commit()
+    write = perf_counter() - start
+
+    start = perf_counter()
+    for _ in range(repeat):
+        backend[dataset.oid]
+    read = perf_counter() - start
+
+    backend.close()
+    size = os.path.getsize(backend.filepath)
+    backend.drop()
+    return {"bytes": size, "write": nbytes * repeat / write / 1e6, "read": nbytes * repeat / read / 1e6}
+
+
+# ------------------------------------------------------------------------------------------------ #
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000000, help="Number of ratings.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of writes and reads.")
+    args = parser.parse_args()
+
+    dataset = Dataset(name="ratings", datasource_id=1, stage="extract", mode="test", data=build_ratings(args.rows))
+    directory = tempfile.mkdtemp()
+    results = {}
+    try:
+        for label, serializer in configurations().items():
+            results[label] = run(os.path.join(directory, "odb"), dataset, serializer, args.repeat)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"\nSerializer comparison, {args.rows} ratings, {args.repeat} repeats")
+    print(f"{'Serializer':<20}{'Bytes on disk':>16}{'Write MB/s':>14}{'Read MB/s':>14}")
+    for label, result in results.items():
+        print(f"{label:<20}{result['bytes']:>16,}{result['write']:>14.1f}{result['read']:>14.1f}")
+
+
+# ------------------------------------------------------------------------------------------------ #
+if __name__ == "__main__":
+    main()
@@ -24,8 +24,9 @@ import dotenv
 from dependency_injector import containers, providers  # pragma: no cover
 
 from recsys.core.services.io import IOService
-from recsys.core.dal.dba import DBA, ODBA
+from recsys.core.dal.dba import DBA, ODBA, Migrator
 from recsys.core.dal.oao import OAO
+from recsys.core.dal.cache import EntityCache
 from recsys.core.dal.dao import FileDAO, DatasetDAO, DataFrameDAO, DataSourceDAO, DataSourceURLDAO
 from recsys.core.dal.dao import JobDAO, TaskDAO, ProfileDAO
 from recsys.core.dal.sql.file import FileDDL, FileDML
@@ -38,9 +39,10 @@ from recsys.core.dal.sql.task import TaskDDL, TaskDML
 from recsys.core.dal.sql.profile import ProfileDDL, ProfileDML
 from recsys.core.dal.sql.database import DatabaseDDL
 from recsys.core.dal.sql.odb import ObjectODL, ObjectOML
-from recsys.core.database.relational import Database, MySQLConnection, DatabaseConnection
+from recsys.core.database.relational import Database, MySQLConnection, DatabaseConnection, SQLiteConnection
 from recsys.core.database.object import ObjectDBConnection, ObjectDB
-from recsys.core.repo.context import Context
+from recsys.core.database.serializer import Serializer
+from recsys.core.repo.context import Context, ContextFactory
 from recsys.core.repo.uow import UnitOfWork
 
 
@@ -62,32 +64,67 @@ class ConnectionContainer(containers.DeclarativeContainer):
 
     config = providers.Configuration()
 
-    rdb_connection = providers.Factory(
-        DatabaseConnection,
-        connector=pymysql.connect,
+    rdb_connection = providers.Selector(
+        config.database.rdb.dialect,
+        mysql=providers.Factory(
+            DatabaseConnection,
+            connector=pymysql.connect,
+            pool_size=config.database.rdb.pool.size,
+            max_idle=config.database.rdb.pool.max_idle,
+            ping_interval=config.database.rdb.pool.ping_interval,
+        ),
+        sqlite=providers.Factory(
+            SQLiteConnection,
+            location=config.database.sqlite.location,
+            pool_size=config.database.rdb.pool.size,
+            max_idle=config.database.rdb.pool.max_idle,
+            ping_interval=config.database.rdb.pool.ping_interval,
+        ),
     )
 
-    dbms_connection = providers.Factory(
-        MySQLConnection,
-        connector=pymysql.connect,
+    dbms_connection = providers.Selector(
+        config.database.rdb.dialect,
+        mysql=providers.Factory(
+            MySQLConnection,
+            connector=pymysql.connect,
+        ),
+        sqlite=providers.Factory(
+            SQLiteConnection,
+            location=config.database.sqlite.location,
+        ),
+    )
+
+    serializer = providers.Singleton(
+        Serializer,
+        protocol=config.database.odb.serializer.protocol,
+        compression=config.database.odb.serializer.compression,
+        threshold=config.database.odb.serializer.threshold,
     )
 
     odb_connection = providers.Factory(
         ObjectDBConnection,
         location=config.database.shelve.location,
+        persistent=config.database.odb.persistent,
+        memory_map=config.database.odb.memory_map,
+        backend=config.database.odb.backend,
+        serializer=serializer,
     )
 
 
 # ------------------------------------------------------------------------------------------------ #
 class DatabaseContainer(containers.DeclarativeContainer):
 
+    config = providers.Configuration()
+
     rdb_connection = providers.Dependency()
     dbms_connection = providers.Dependency()
     odb_connection = providers.Dependency()
 
     rdb = providers.Singleton(
         Database,
-        connection=rdb_connection
+        connection=rdb_connection,
+        group_size=config.database.rdb.commit.group_size,
+        group_window=config.database.rdb.commit.group_window,
     )
 
     dbms = providers.Singleton(
@@ -100,12 +137,38 @@ class DatabaseContainer(containers.DeclarativeContainer):
         connection=odb_connection
     )
 
+    entity_cache = providers.Singleton(
+        EntityCache,
+        max_size=config.database.odb.entity_cache.max_size,
+        max_bytes=config.database.odb.entity_cache.max_bytes,
+    )
+
+    # Per-worker databases: each call opens new connections. See ContextFactory.
+    worker_rdb = providers.Factory(
+        Database,
+        connection=rdb_connection,
+        group_size=config.database.rdb.commit.group_size,
+        group_window=config.database.rdb.commit.group_window,
+    )
+
+    worker_odb = providers.Factory(
+        ObjectDB,
+        connection=odb_connection
+    )
+
+    worker_entity_cache = providers.Factory(
+        EntityCache,
+        max_size=config.database.odb.entity_cache.max_size,
+        max_bytes=config.database.odb.entity_cache.max_bytes,
+    )
+
 
 # ------------------------------------------------------------------------------------------------ #
 class DALContainer(containers.DeclarativeContainer):
 
     rdb = providers.Dependency()
     odb = providers.Dependency()
+    entity_cache = providers.Dependency()
 
     file = providers.Factory(FileDAO, dml=FileDML, database=rdb)
 
@@ -123,7 +186,7 @@ class DALContainer(containers.DeclarativeContainer):
 
     profile = providers.Factory(ProfileDAO, dml=ProfileDML, database=rdb)
 
-    object = providers.Factory(OAO, oml=ObjectOML, database=odb)
+    object = providers.Factory(OAO, oml=ObjectOML, database=odb, cache=entity_cache)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -151,6 +214,8 @@ class DBAContainer(containers.DeclarativeContainer):
 
     profile = providers.Factory(DBA, database=rdb, ddl=ProfileDDL)
 
+    migrator = providers.Factory(Migrator, database=rdb)
+
     object = providers.Factory(ODBA, database=odb, ddl=ObjectODL)
 
 
@@ -158,11 +223,24 @@ class DBAContainer(containers.DeclarativeContainer):
 class RepoContainer(containers.DeclarativeContainer):
 
     dal = providers.Dependency()
+    worker_rdb = providers.Dependency()
+    worker_odb = providers.Dependency()
+    worker_entity_cache = providers.Dependency()
 
     context = providers.Factory(Context, dal=dal)
 
     uow = providers.Factory(UnitOfWork, context=context)
 
+    context_factory = providers.Singleton(
+        ContextFactory,
+        dal=dal,
+        rdb=worker_rdb.provider,
+        odb=worker_odb.provider,
+        entity_cache=worker_entity_cache.provider,
+    )
+
+    worker_uow = providers.Factory(UnitOfWork, context=context_factory.provided.get_context.call())
+
 
 # ------------------------------------------------------------------------------------------------ #
 class Recsys(containers.DeclarativeContainer):
@@ -179,6 +257,7 @@ class Recsys(containers.DeclarativeContainer):
     connection = providers.Container(ConnectionContainer, config=config)
 
     database = providers.Container(DatabaseContainer,
+                                   config=config,
                                    rdb_connection=connection.rdb_connection,
                                    dbms_connection=connection.dbms_connection,
                                    odb_connection=connection.odb_connection
@@ -186,7 +265,8 @@ class Recsys(containers.DeclarativeContainer):
 
     dal = providers.Container(DALContainer,
                               rdb=database.rdb,
-                              odb=database.odb
+                              odb=database.odb,
+                              entity_cache=database.entity_cache
                               )
 
     dba = providers.Container(DBAContainer,
@@ -195,4 +275,9 @@ class Recsys(containers.DeclarativeContainer):
                               odb=database.odb
                               )
 
-    repo = providers.Container(RepoContainer, dal=dal)
+    repo = providers.Container(RepoContainer,
+                               dal=dal,
+                               worker_rdb=database.worker_rdb,
+                               worker_odb=database.worker_odb,
+                               worker_entity_cache=database.worker_entity_cache
+                               )
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /recsys/core/dal/cache.py                                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday January 13th 2023 07:12:40 am                                                #
+# Modified   : Friday January 13th 2023 07:12:40 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Entity Cache Module."""
+import threading
+from collections import OrderedDict
+from typing import Union
+
+from recsys.core.entity.base import Entity
+from recsys.core.entity.dataset import DataComponent
+from recsys.core.services.base import Service
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        ENTITY CACHE                                              #
+# ------------------------------------------------------------------------------------------------ #
+class EntityCache(Service):
+    """Bounded least-recently-used cache of deserialized entities keyed by oid.
+
+    Entities are evicted, least recently used first, once the cache holds more than max_size
+    entities or more than max_bytes. An entity's size is the length of its stored value, as
+    read from the object store. Datasets and DataFrames are not cached: their payloads load
+    lazily, after the entity is read, so their stored size doesn't bound the memory they hold.
+    Cached entities are shared by every reader, so callers that modify an entity must persist
+    it through update, which invalidates the entry.
+
+    Args:
+        max_size (int): Maximum number of entities held. Zero disables the cache. Default = 1024.
+        max_bytes (int): Maximum total size of the entities held, in bytes. Default = 64 MiB.
+    """
+
+    def __init__(self, max_size: int = 1024, max_bytes: int = 67108864) -> None:
+        super().__init__()
+        self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._entities = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0 and self._max_bytes > 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def stats(self) -> dict:
+        return {"size": len(self._entities), "nbytes": self._nbytes, "hits": self._hits, "misses": self._misses}
+
+    def get(self, oid: str) -> Union[Entity, None]:
+        """Returns the cached entity and marks it most recently used, or None on a miss."""
+        with self._lock:
+            try:
+                entity, _ = self._entities[oid]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._entities.move_to_end(oid)
+            self._hits += 1
+            return entity
+
+    def put(self, oid: str, entity: Entity, nbytes: int) -> None:
+        """Adds an entity of nbytes stored bytes, evicting least recently used entities to stay
+        within bounds."""
+        if not self.enabled or isinstance(entity, DataComponent) or nbytes > self._max_bytes:
+            return
+        with self._lock:
+            self._pop(oid)
+            self._entities[oid] = (entity, nbytes)
+            self._nbytes += nbytes
+            while len(self._entities) > self._max_size or self._nbytes > self._max_bytes:
+                evicted, (_, size) = self._entities.popitem(last=False)
+                self._nbytes -= size
+                msg = f"Evicted entity {evicted} from the entity cache."
+                self._logger.debug(msg)
+
+    def invalidate(self, oid: str) -> None:
+        """Removes an entity from the cache if present."""
+        with self._lock:
+            self._pop(oid)
+
+    def clear(self) -> None:
+        """Removes all entities. Hit and miss counters are preserved."""
+        with self._lock:
+            self._entities.clear()
+            self._nbytes = 0
+
+    def _pop(self, oid: str) -> None:
+        item = self._entities.pop(oid, None)
+        if item is not None:
+            self._nbytes -= item[1]
@@ -17,14 +17,16 @@
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 """Data Layer Services associated with Database construction."""
-from abc import ABC, abstractmethod
+from abc import ABC
 from collections import OrderedDict
-from typing import Dict, Tuple, List
+from typing import Dict, Iterator, List
 import logging
 import mysql.connector
+import pandas as pd
 
 from recsys.core.database.relational import Database
 from .dto import DTO, DataFrameDTO, DatasetDTO, ProfileDTO, TaskDTO, JobDTO, FileDTO, DataSourceDTO, DataSourceURLDTO
+from .mapper import RowMapper
 from .sql.base import DML
 from recsys.core.entity.base import Entity
 
@@ -40,21 +42,21 @@ class DAO(ABC):
     Args:
         database (Database): Relational database object.
         dml (DML, database: Database): The Data Manipulation Language for the database.
+        dto (type): The Data Transfer Object class rows are mapped to, by column name.
     """
 
-    def __init__(self, dml: DML, database: Database) -> None:
+    def __init__(self, dml: DML, database: Database, dto: type(DTO)) -> None:
         self._dml = dml
         self._entity = dml.entity
         self._database = database
+        self._mapper = RowMapper(dto)
         self._logger = logging.getLogger(
             f"{self.__module__}.{self.__class__.__name__}",
         )
 
     def __len__(self) -> int:
         """Returns the number of rows in the underlying table."""
-        cmd = self._dml.select_all()
-        results = self._database.select_all(cmd.sql, cmd.args)
-        return len(results)
+        return self.count()
 
     def begin(self) -> None:
         """Starts a transaction on the underlying database."""
@@ -80,12 +82,45 @@ class DAO(ABC):
 
         Returns: a dto with the assigned id
         """
-        cmd = self._dml.insert(dto)
-        dto.id = self._database.insert(cmd.sql, cmd.args)
+        statement = self._database.prepare(self._dml.insert)
+        dto.id = self._database.insert(statement.sql, statement.bind(dto))
         msg = f"{self.__class__.__name__} inserted {self._entity.__name__}.{dto.id} - {dto.name} into the database."
         self._logger.debug(msg)
         return dto
 
+    def create_many(self, dtos: List[DTO]) -> List[DTO]:
+        """Adds entity data transfer objects to the database in batched multi-row inserts.
+
+        Runs inside the caller's transaction, if one has been started.
+
+        Args:
+            dtos (List[DTO]): Entity data transfer objects.
+
+        Returns: the dtos, in order, with the assigned ids
+        """
+        if len(dtos) > 0:
+            statement = self._database.prepare(self._dml.insert)
+            ids = self._database.insert_many(statement.sql, [statement.bind(dto) for dto in dtos])
+            for dto, id in zip(dtos, ids):
+                dto.id = id
+            msg = f"{self.__class__.__name__} inserted {len(dtos)} {self._entity.__name__} entities into the database."
+            self._logger.debug(msg)
+        return dtos
+
+    def upsert(self, dto: DTO) -> DTO:
+        """Inserts an entity DTO, or updates the existing entity with the same name and mode.
+
+        Args:
+            dto (DTO): An entity data transfer object.
+
+        Returns: a dto with the assigned or existing id
+        """
+        statement = self._database.prepare(self._dml.upsert)
+        dto.id = self._database.insert(statement.sql, statement.bind(dto))
+        msg = f"{self.__class__.__name__} upserted {self._entity.__name__}.{dto.id} - {dto.name} into the database."
+        self._logger.debug(msg)
+        return dto
+
     def read(self, id: int) -> Entity:
         """Obtains an entity DTO with the designated id.
 
@@ -94,12 +129,9 @@ class DAO(ABC):
 
         Returns a DTO
         """
-        result = []
-        cmd = self._dml.select(id)
-        row = self._database.select(cmd.sql, cmd.args)
-        if row is not None:
-            result = self._row_to_dto(row)
-        return result
+        statement = self._database.prepare(self._dml.select)
+        dto = self._database.select(statement.sql, (id,), row_factory=self._mapper)
+        return dto if dto is not None else []
 
     def read_by_name_mode(self, name: str, mode: str) -> DTO:
         """Obtains an entity DTO with the designated name and mode.
@@ -109,22 +141,36 @@ class DAO(ABC):
 
         Returns a Data Transfer Object (DTO)
         """
-        result = []
-        cmd = self._dml.select_by_name_mode(name, mode)
-        row = self._database.select(cmd.sql, cmd.args)
-        if row is not None:
-            result = self._row_to_dto(row)
-        return result
+        statement = self._database.prepare(self._dml.select_by_name_mode)
+        dto = self._database.select(statement.sql, (name, mode), row_factory=self._mapper)
+        return dto if dto is not None else []
 
     def read_all(self) -> Dict[int, DTO]:
         """Returns a dictionary of all entity data transfere objects of the in the database."""
         result = {}
-        cmd = self._dml.select_all()
-        rows = self._database.select_all(cmd.sql, cmd.args)
-        if rows is not None:
-            result = self._rows_to_dict(rows)
+        statement = self._database.prepare(self._dml.select_all)
+        dtos = self._database.select_all(statement.sql, row_factory=self._mapper)
+        if dtos is not None:
+            result = self._to_dict(dtos)
         return result
 
+    def read_page(self, offset: int, limit: int) -> Dict[int, DTO]:
+        """Returns a dictionary of up to limit entity data transfer objects in id order, starting
+        at offset.
+
+        Args:
+            offset (int): The number of rows to skip.
+            limit (int): The maximum number of rows to return.
+        """
+        statement = self._database.prepare(self._dml.select_page)
+        dtos = self._database.select_all(statement.sql, (limit, offset), row_factory=self._mapper)
+        return self._to_dict(dtos)
+
+    def read_all_frame(self) -> pd.DataFrame:
+        """Returns all rows of the underlying table as a DataFrame, without building DTOs."""
+        statement = self._database.prepare(self._dml.select_all)
+        return self._database.select_frame(statement.sql)
+
     def read_by_parent_id(self, parent_id: int) -> Dict[int, DTO]:
         """Returns a dictionary of entity data transfer objects with the designated parent id.
 
@@ -132,12 +178,32 @@ class DAO(ABC):
             parent_id (int): Id for the parent object.
         """
         result = {}
-        cmd = self._dml.select_by_parent_id(parent_id)
-        rows = self._database.select_all(cmd.sql, cmd.args)
-        if rows is not None:
-            result = self._rows_to_dict(rows)
+        statement = self._database.prepare(self._dml.select_by_parent_id)
+        dtos = self._database.select_all(statement.sql, (parent_id,), row_factory=self._mapper)
+        if dtos is not None:
+            result = self._to_dict(dtos)
         return result
 
+    def iter_all(self, batch_size: int = 1000) -> Iterator[DTO]:
+        """Yields all entity data transfer objects, streaming rows from a server-side cursor.
+
+        Args:
+            batch_size (int): Rows fetched from the server at a time. Default = 1000.
+        """
+        statement = self._database.prepare(self._dml.select_all)
+        yield from self._database.iterate(statement.sql, batch_size=batch_size, row_factory=self._mapper)
+
+    def iter_by_parent_id(self, parent_id: int, batch_size: int = 1000) -> Iterator[DTO]:
+        """Yields entity data transfer objects with the designated parent id, streaming rows
+        from a server-side cursor.
+
+        Args:
+            parent_id (int): Id for the parent object.
+            batch_size (int): Rows fetched from the server at a time. Default = 1000.
+        """
+        statement = self._database.prepare(self._dml.select_by_parent_id)
+        yield from self._database.iterate(statement.sql, (parent_id,), batch_size, row_factory=self._mapper)
+
     def update(self, dto: DTO) -> int:
         """Performs an update to an existing entity DTO
 
@@ -146,25 +212,48 @@ class DAO(ABC):
 
         Returns number of rows effected.
         """
-        rows_affected = None
-        if self.exists(dto.id):
-            cmd = self._dml.update(dto)
-            rows_affected = self._database.update(cmd.sql, cmd.args)
-
-        else:
+        statement = self._database.prepare(self._dml.update)
+        rows_affected = self._database.update(statement.sql, statement.bind(dto))
+        if rows_affected == 0:
             msg = f"{self.__class__.__name__} was unable to update {self._entity.__name__}.{dto.id}. Not found in the database. Try insert instead."
             self._logger.error(msg)
             raise mysql.connector.ProgrammingError(msg)
         return rows_affected
 
+    def update_many(self, dtos: List[DTO]) -> int:
+        """Performs updates to existing entity DTOs in a single executemany call.
+
+        Runs inside the caller's transaction, if one has been started. Raises an error if any
+        of the DTOs is not found in the database.
+
+        Args:
+            dtos (List[DTO]): Data Transfer Objects
+
+        Returns number of rows effected.
+        """
+        rows_affected = 0
+        if len(dtos) > 0:
+            statement = self._database.prepare(self._dml.update)
+            rows_affected = self._database.update_many(statement.sql, [statement.bind(dto) for dto in dtos])
+            if rows_affected < len(dtos):
+                msg = f"{self.__class__.__name__} was unable to update {len(dtos) - rows_affected} of {len(dtos)} {self._entity.__name__} entities. Not found in the database. Try insert instead."
+                self._logger.error(msg)
+                raise mysql.connector.ProgrammingError(msg)
+        return rows_affected
+
+    def count(self) -> int:
+        """Returns the number of rows in the underlying table, counted in the database."""
+        statement = self._database.prepare(self._dml.count)
+        return self._database.select(statement.sql)[0]
+
     def exists(self, id: int) -> bool:
         """Returns True if the entity with id exists in the database.
 
         Args:
             id (int): id for the entity
         """
-        cmd = self._dml.exists(id)
-        result = self._database.exists(cmd.sql, cmd.args)
+        statement = self._database.prepare(self._dml.exists)
+        result = self._database.exists(statement.sql, (id,))
         return result
 
     def delete(self, id: int, persist=True) -> None:
@@ -173,25 +262,15 @@ class DAO(ABC):
             id (int): The id for the entity to delete.
 
         """
-        if self.exists(id):
-            cmd = self._dml.delete(id)
-            self._database.delete(cmd.sql, cmd.args)
-        else:
+        statement = self._database.prepare(self._dml.delete)
+        if self._database.delete(statement.sql, (id,)) == 0:
             msg = f"{self.__class__.__name__}  was unable to delete {self._entity.__name__}.{id}. Not found in the database."
             self._logger.error(msg)
             raise mysql.connector.ProgrammingError(msg)
 
-    def _rows_to_dict(self, results: List) -> Dict:
-        """Converts the results to a dictionary of DTO objects."""
-        results_dict = OrderedDict()
-        for row in results:
-            dto = self._row_to_dto(row)
-            results_dict[dto.id] = dto
-        return results_dict
-
-    @abstractmethod
-    def _row_to_dto(self, row: Tuple) -> DTO:
-        """Converts a row from the Database into a Data Transfer Object."""
+    def _to_dict(self, dtos: List[DTO]) -> Dict:
+        """Indexes DTO objects by id."""
+        return OrderedDict((dto.id, dto) for dto in dtos)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -199,35 +278,7 @@ class DAO(ABC):
 # ------------------------------------------------------------------------------------------------ #
 class DataFrameDAO(DAO):
     def __init__(self, dml: DML, database: Database) -> None:
-        super().__init__(dml=dml, database=database)
-
-    def _row_to_dto(self, row: Tuple) -> DataFrameDTO:
-        try:
-            return DataFrameDTO(
-                id=row[0],
-                oid=row[1],
-                name=row[2],
-                description=row[3],
-                stage=row[4],
-                mode=row[5],
-                size=row[6],
-                nrows=row[7],
-                ncols=row[8],
-                nulls=row[9],
-                pct_nulls=row[10],
-                parent_id=row[11],
-                created=row[12],
-                modified=row[13],
-            )
-        except TypeError:
-            msg = "No data matched the query."
-            self._logger.info(msg)
-            raise FileNotFoundError(msg)
-
-        except IndexError as e:  # pragma: no cover
-            msg = f"Index error in_row_to_dto method.\n{e}"
-            self._logger.error(msg)
-            raise IndexError(msg)
+        super().__init__(dml=dml, database=database, dto=DataFrameDTO)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -235,31 +286,7 @@ class DataFrameDAO(DAO):
 # ------------------------------------------------------------------------------------------------ #
 class DatasetDAO(DAO):
     def __init__(self, dml: DML, database: Database) -> None:
-        super().__init__(dml=dml, database=database)
-
-    def _row_to_dto(self, row: Tuple) -> DataFrameDTO:
-        try:
-            return DatasetDTO(
-                id=row[0],
-                oid=row[1],
-                name=row[2],
-                description=row[3],
-                datasource_id=row[4],
-                mode=row[5],
-                stage=row[6],
-                task_id=row[7],
-                created=row[8],
-                modified=row[9],
-            )
-        except TypeError:
-            msg = "No data matched the query."
-            self._logger.info(msg)
-            raise FileNotFoundError(msg)
-
-        except IndexError as e:  # pragma: no cover
-            msg = f"Index error in_row_to_dto method.\n{e}"
-            self._logger.error(msg)
-            raise IndexError(msg)
+        super().__init__(dml=dml, database=database, dto=DatasetDTO)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -269,49 +296,7 @@ class ProfileDAO(DAO):
     """Profile for Tasks"""
 
     def __init__(self, dml: DML, database: Database) -> None:
-        super().__init__(dml=dml, database=database)
-
-    def _row_to_dto(self, row: Tuple) -> ProfileDTO:
-        try:
-            return ProfileDTO(
-                id=row[0],
-                oid=row[1],
-                name=row[2],
-                description=row[3],
-                mode=row[4],
-                start=row[5],
-                end=row[6],
-                duration=row[7],
-                user_cpu_time=row[8],
-                percent_cpu_used=row[9],
-                total_physical_memory=row[10],
-                physical_memory_available=row[11],
-                physical_memory_used=row[12],
-                percent_physical_memory_used=row[13],
-                active_memory_used=row[14],
-                disk_usage=row[15],
-                percent_disk_usage=row[16],
-                read_count=row[17],
-                write_count=row[18],
-                read_bytes=row[19],
-                write_bytes=row[20],
-                read_time=row[21],
-                write_time=row[22],
-                bytes_sent=row[23],
-                bytes_recv=row[24],
-                parent_id=row[25],
-                created=row[26],
-                modified=row[27],
-            )
-        except TypeError:
-            msg = "No data matched the query."
-            self._logger.info(msg)
-            raise FileNotFoundError(msg)
-
-        except IndexError as e:  # pragma: no cover
-            msg = f"Index error in_row_to_dto method.\n{e}"
-            self._logger.error(msg)
-            raise IndexError(msg)
+        super().__init__(dml=dml, database=database, dto=ProfileDTO)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -321,30 +306,7 @@ class TaskDAO(DAO):
     """Task Data Access Object"""
 
     def __init__(self, dml: DML, database: Database) -> None:
-        super().__init__(dml=dml, database=database)
-
-    def _row_to_dto(self, row: Tuple) -> TaskDTO:
-        try:
-            return TaskDTO(
-                id=row[0],
-                oid=row[1],
-                name=row[2],
-                description=row[3],
-                mode=row[4],
-                state=row[5],
-                parent_id=row[6],
-                created=row[7],
-                modified=row[8],
-            )
-        except TypeError:
-            msg = "No data matched the query."
-            self._logger.info(msg)
-            raise FileNotFoundError(msg)
-
-        except IndexError as e:  # pragma: no cover
-            msg = f"Index error in_row_to_dto method.\n{e}"
-            self._logger.error(msg)
-            raise IndexError(msg)
+        super().__init__(dml=dml, database=database, dto=TaskDTO)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -354,29 +316,7 @@ class JobDAO(DAO):
     """Job Data Access Object"""
 
     def __init__(self, dml: DML, database: Database) -> None:
-        super().__init__(dml=dml, database=database)
-
-    def _row_to_dto(self, row: Tuple) -> JobDTO:
-        try:
-            return JobDTO(
-                id=row[0],
-                oid=row[1],
-                name=row[2],
-                description=row[3],
-                mode=row[4],
-                state=row[5],
-                created=row[6],
-                modified=row[7],
-            )
-        except TypeError:
-            msg = "No data matched the query."
-            self._logger.info(msg)
-            raise FileNotFoundError(msg)
-
-        except IndexError as e:  # pragma: no cover
-            msg = f"Index error in_row_to_dto method.\n{e}"
-            self._logger.error(msg)
-            raise IndexError(msg)
+        super().__init__(dml=dml, database=database, dto=JobDTO)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -386,33 +326,7 @@ class FileDAO(DAO):
     """File Data Access Object"""
 
     def __init__(self, dml: DML, database: Database) -> None:
-        super().__init__(dml=dml, database=database)
-
-    def _row_to_dto(self, row: Tuple) -> FileDTO:
-        try:
-            return FileDTO(
-                id=row[0],
-                oid=row[1],
-                name=row[2],
-                description=row[3],
-                datasource_id=row[4],
-                mode=row[5],
-                stage=row[6],
-                uri=row[7],
-                size=row[8],
-                task_id=row[9],
-                created=row[10],
-                modified=row[11],
-            )
-        except TypeError:
-            msg = "No data matched the query."
-            self._logger.info(msg)
-            raise FileNotFoundError(msg)
-
-        except IndexError as e:  # pragma: no cover
-            msg = f"Index error in_row_to_dto method.\n{e}"
-            self._logger.error(msg)
-            raise IndexError(msg)
+        super().__init__(dml=dml, database=database, dto=FileDTO)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -422,29 +336,7 @@ class DataSourceDAO(DAO):
     """File Data Access Object"""
 
     def __init__(self, dml: DML, database: Database) -> None:
-        super().__init__(dml=dml, database=database)
-
-    def _row_to_dto(self, row: Tuple) -> FileDTO:
-        try:
-            return DataSourceDTO(
-                id=row[0],
-                oid=row[1],
-                name=row[2],
-                description=row[3],
-                website=row[4],
-                mode=row[5],
-                created=row[6],
-                modified=row[7],
-            )
-        except TypeError:
-            msg = "No data matched the query."
-            self._logger.info(msg)
-            raise FileNotFoundError(msg)
-
-        except IndexError as e:  # pragma: no cover
-            msg = f"Index error in_row_to_dto method.\n{e}"
-            self._logger.error(msg)
-            raise IndexError(msg)
+        super().__init__(dml=dml, database=database, dto=DataSourceDTO)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -454,27 +346,4 @@ class DataSourceURLDAO(DAO):
     """File Data Access Object"""
 
     def __init__(self, dml: DML, database: Database) -> None:
-        super().__init__(dml=dml, database=database)
-
-    def _row_to_dto(self, row: Tuple) -> FileDTO:
-        try:
-            return DataSourceURLDTO(
-                id=row[0],
-                oid=row[1],
-                name=row[2],
-                description=row[3],
-                url=row[4],
-                mode=row[5],
-                datasource_id=row[6],
-                created=row[7],
-                modified=row[8],
-            )
-        except TypeError:
-            msg = "No data matched the query."
-            self._logger.info(msg)
-            raise FileNotFoundError(msg)
-
-        except IndexError as e:  # pragma: no cover
-            msg = f"Index error in_row_to_dto method.\n{e}"
-            self._logger.error(msg)
-            raise IndexError(msg)
+        super().__init__(dml=dml, database=database, dto=DataSourceURLDTO)
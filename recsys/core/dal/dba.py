@@ -18,11 +18,18 @@
 # ================================================================================================ #
 """Data Definition Object Module."""
 from abc import ABC, abstractmethod
+from datetime import datetime
 import logging
 
 from recsys.core.database.relational import Database
 from recsys.core.database.object import ObjectDB
 from recsys.core.dal.sql.base import DDL, ODL
+from recsys.core.dal.sql.schema import (
+    MIGRATIONS,
+    SchemaVersionDDL,
+    SelectSchemaVersion,
+    InsertSchemaVersion,
+)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -67,6 +74,11 @@ class DBA(AbstractDBA):
         msg = self._ddl.create.description
         self._logger.info(msg)
 
+        for index in self._ddl.indexes:
+            if self._database.exists(sql=index.guard):
+                self._database.create(sql=index.sql, args=index.args)
+                self._logger.info(index.description)
+
         self._database.save()
         self._database.close()
 
@@ -98,6 +110,63 @@ class DBA(AbstractDBA):
         self.create()
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                                          MIGRATOR                                                #
+# ------------------------------------------------------------------------------------------------ #
+class Migrator:
+    """Brings an existing relational schema up to the current version.
+
+    The applied version is recorded in the schema_version table. Each statement of a pending
+    migration runs only while its guard query reports the change as outstanding. MySQL commits
+    DDL implicitly, so a failed migration can't be rolled back; the guards make a rerun safe.
+
+    Args:
+        database (Database): The relational database to migrate.
+        migrations (tuple): Migrations in ascending version order. Defaults to MIGRATIONS.
+    """
+
+    def __init__(self, database: Database, migrations: tuple = MIGRATIONS) -> None:
+        self._database = database
+        self._migrations = migrations
+        self._ddl = SchemaVersionDDL()
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def version(self) -> int:
+        """Returns the version of the schema, 0 if no migration has been applied."""
+        self._database.create(sql=self._ddl.create.sql, args=self._ddl.create.args)
+        row = self._database.select(sql=SelectSchemaVersion.sql)
+        return row[0] or 0
+
+    def migrate(self, target: int = None) -> list:
+        """Applies the pending migrations up to and including the target version.
+
+        Args:
+            target (int): The version to migrate to. Defaults to the latest migration.
+
+        Returns a list of the versions applied.
+        """
+        applied = []
+        current = self.version
+        for migration in self._migrations:
+            if migration.version <= current or (target is not None and migration.version > target):
+                continue
+            for statement in migration.statements:
+                if statement.guard is None or self._database.exists(sql=statement.guard):
+                    self._database.create(sql=statement.sql, args=statement.args)
+                    self._logger.info(statement.description)
+            record = InsertSchemaVersion(
+                version=migration.version, description=migration.description, applied=datetime.now()
+            )
+            self._database.insert(sql=record.sql, args=record.args)
+            self._database.save()
+            self._logger.info(f"Migrated the schema to version {migration.version}. {migration.description}")
+            applied.append(migration.version)
+        return applied
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                                       OBJECT DB ADMIN                                            #
 # ------------------------------------------------------------------------------------------------ #
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /recsys/core/dal/mapper.py                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday January 16th 2023 08:41:07 am                                                #
+# Modified   : Monday January 16th 2023 08:41:07 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Maps database rows to Data Transfer Objects by column name."""
+from dataclasses import fields
+from operator import itemgetter
+from typing import Callable, Dict, Sequence, Tuple
+
+from .dto import DTO
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          ROW MAPPER                                              #
+# ------------------------------------------------------------------------------------------------ #
+class RowMapper:
+    """Binds the columns of a result set to the fields of a DTO class by name.
+
+    An instance is passed to the Database select methods as a row factory. It is called once per
+    query with the cursor description, and returns a converter that builds a DTO from a row. The
+    column positions are resolved when the converter is compiled, so a change in column order is
+    followed and a missing column raises at once. Converters are cached by column names.
+
+    Args:
+        dto (type): The DTO dataclass to build.
+    """
+
+    def __init__(self, dto: type(DTO)) -> None:
+        self._dto = dto
+        self._fields = tuple(field.name for field in fields(dto) if field.init)
+        self._converters: Dict[Tuple[str, ...], Callable[[tuple], DTO]] = {}
+
+    @property
+    def dto(self) -> type(DTO):
+        return self._dto
+
+    def __call__(self, description: Sequence[tuple]) -> Callable[[tuple], DTO]:
+        """Returns the row converter for a cursor description."""
+        columns = tuple(column[0] for column in description)
+        try:
+            return self._converters[columns]
+        except KeyError:
+            converter = self._converters[columns] = self._compile(columns)
+            return converter
+
+    def _compile(self, columns: Tuple[str, ...]) -> Callable[[tuple], DTO]:
+        missing = [name for name in self._fields if name not in columns]
+        if missing:
+            msg = f"Unable to map the columns {columns} to {self._dto.__name__}. Missing: {missing}."
+            raise ValueError(msg)
+        dto = self._dto
+        if columns == self._fields:
+            return lambda row: dto(*row)
+        positions = [columns.index(name) for name in self._fields]
+        if len(positions) == 1:
+            position = positions[0]
+            return lambda row: dto(row[position])
+        getter = itemgetter(*positions)
+        return lambda row: dto(*getter(row))
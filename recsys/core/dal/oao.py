@@ -18,7 +18,9 @@
 # ================================================================================================ #
 """Object Access Object Module."""
 import logging
+from typing import Dict, Iterator, List
 
+from recsys.core.dal.cache import EntityCache
 from recsys.core.dal.sql.odb import OML
 from recsys.core.database.object import ObjectDB
 from recsys.core.entity.base import Entity
@@ -33,11 +35,14 @@ class OAO:
     Args:
         database(ObjectDB): An object database
         oml (OML): An instance of the Object Manipulation Language class.
+        cache (EntityCache): Optional LRU cache of deserialized entities, shared by the OAOs
+            of a database. Entries are invalidated on update, delete and rollback.
     """
 
-    def __init__(self, oml: OML, database: ObjectDB) -> None:
+    def __init__(self, oml: OML, database: ObjectDB, cache: EntityCache = None) -> None:
         self._oml = oml
         self._database = database
+        self._cache = cache
         self._logger = logging.getLogger(
             f"{self.__module__}.{self.__class__.__name__}",
         )
@@ -54,13 +59,19 @@ class OAO:
         """Commits changes to the database."""
         self._database.save()
 
+    @property
+    def cache(self) -> EntityCache:
+        return self._cache
+
     def close(self) -> None:
         """Commits changes to the database."""
         self._database.close()
+        self._clear_cache()
 
     def rollback(self) -> None:
         """Rollback changes to the database."""
         self._database.rollback()
+        self._clear_cache()
 
     def create(self, entity: Entity) -> Entity:
         """Adds an entity to the objct database.
@@ -81,20 +92,96 @@ class OAO:
 
         Returns a Entity
         """
-        return self._database.select(oid)
+        if self._cache is not None:
+            entity = self._cache.get(oid)
+            if entity is not None:
+                return entity
+        entity, nbytes = self._database.read(oid)
+        if self._cache is not None and isinstance(entity, Entity) and nbytes is not None:
+            self._cache.put(oid, entity, nbytes)
+        return entity
+
+    def read_many(self, oids: List[str]) -> Dict[str, Entity]:
+        """Obtains the entities with the designated oids in a single database session.
+
+        Args:
+            oids (List[str]): The oids of the entities.
+
+        Returns a dictionary of the entities found, keyed by oid, in the order of oids.
+        """
+        entities = {}
+        if self._cache is not None:
+            for oid in oids:
+                entity = self._cache.get(oid)
+                if entity is not None:
+                    entities[oid] = entity
+        missing = [oid for oid in oids if oid not in entities]
+        if missing:
+            selected = self._database.read_many(missing)
+            for oid, (entity, nbytes) in selected.items():
+                if self._cache is not None and nbytes is not None:
+                    self._cache.put(oid, entity, nbytes)
+                entities[oid] = entity
+        return {oid: entities[oid] for oid in oids if oid in entities}
+
+    def scan(self, prefix: str = None, batch_size: int = 100, keys_only: bool = False, headers: bool = False) -> Iterator:
+        """Lazily iterates over the object database without populating the entity cache.
 
-    def read_by_name_mode(self, name: str, mode: str) -> Entity:
+        Args:
+            prefix (str): Optional oid prefix, e.g. 'job_' for all jobs.
+            batch_size (int): Number of entities read at a time. Default = 100.
+            keys_only (bool): Yield oids only. Default = False.
+            headers (bool): Yield (oid, indexed attributes) pairs. Default = False.
+        """
+        return self._database.scan(prefix=prefix, batch_size=batch_size, keys_only=keys_only, headers=headers)
+
+    def read_by_name_mode(self, name: str, mode: str, entity: type(Entity) = None) -> Entity:
         """Obtains an entity Entity with the designated name and mode.
         Args:
             name (str): The name assigned to the entity.
             mode (str): Mode, i.e. 'dev', 'prod', or 'test'
+            entity (type(Entity)): Optional entity class, required if several classes of
+                entity share the name and mode.
+
+        Returns the Entity or an empty list if not found.
+        """
+        criteria = {"name": name, "mode": mode}
+        if entity is not None:
+            criteria["entity"] = entity
+        entities = self.read_by(**criteria)
+        return next(iter(entities.values()), [])
+
+    def read_by(self, **criteria) -> Dict[str, Entity]:
+        """Obtains the entities whose indexed attributes match the criteria via the object index.
 
-        Returns a Data Transfer Object (Entity)
+        Args:
+            criteria: Values for the indexed fields: entity (class), name, mode, stage,
+                parent (entity or oid), task_id and datasource_id.
+
+        Returns a dictionary of entities keyed by oid.
+        """
+        return self.read_many(self._database.find(**criteria))
+
+    def create_many(self, entities: List[Entity]) -> List[Entity]:
+        """Adds entities to the object database in a single session and commit.
+
+        Args:
+            entities (List[Entity]): The entities to add.
+
+        Returns: the entities
         """
-        result = []
-        ocl = self._oml.select_by_name_mode(name, mode)
-        result = self._database.select(ocl.oid)
-        return result
+        self._database.insert_many(entities)
+        return entities
+
+    def update_many(self, entities: List[Entity]) -> None:
+        """Updates existing entities in a single session and commit.
+
+        Args:
+            entities (List[Entity]): The entities to update.
+        """
+        self._database.update_many(entities)
+        for entity in entities:
+            self._invalidate(entity.oid)
 
     def update(self, entity: Entity) -> None:
         """Updates an existing entity.
@@ -104,6 +191,7 @@ class OAO:
 
         """
         self._database.update(entity)
+        self._invalidate(entity.oid)
 
     def exists(self, oid: str) -> bool:
         """Returns True if the entity with id exists in the database.
@@ -120,3 +208,13 @@ class OAO:
 
         """
         self._database.delete(oid)
+        self._invalidate(oid)
+
+    def _invalidate(self, oid: str) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(oid)
+
+    def _clear_cache(self) -> None:
+        """Discards cached entities, which may hold changes that were not committed."""
+        if self._cache is not None:
+            self._cache.clear()
@@ -30,6 +30,48 @@ class SQL(ABC):  # pragma: no cover
     """Base class for SQL Command Objects."""
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                                   SCHEMA CHANGE COMMANDS                                         #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class CreateIndex(SQL):
+    """Creates a secondary index. The guard query is true when the table exists without the index."""
+
+    table: str
+    columns: tuple
+    name: str = None
+    sql: str = None
+    args: tuple = ()
+    guard: str = None
+    description: str = None
+
+    def __post_init__(self) -> None:
+        self.name = self.name or f"ix_{self.table}_{'_'.join(self.columns)}"
+        self.sql = f"CREATE INDEX {self.name} ON {self.table} ({', '.join(self.columns)});"
+        self.guard = f"SELECT (SELECT COUNT(*) FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = '{self.table}') = 1 AND (SELECT COUNT(*) FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = '{self.table}' AND INDEX_NAME = '{self.name}') = 0;"
+        self.description = f"Created index {self.name} on the {self.table} table."
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class ModifyColumn(SQL):
+    """Changes the type of a column. The guard query is true when the column has another type."""
+
+    table: str
+    column: str
+    definition: str
+    sql: str = None
+    args: tuple = ()
+    guard: str = None
+    description: str = None
+
+    def __post_init__(self) -> None:
+        data_type = self.definition.split()[0].lower()
+        self.sql = f"ALTER TABLE {self.table} MODIFY {self.column} {self.definition};"
+        self.guard = f"SELECT COUNT(*) > 0 FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = '{self.table}' AND COLUMN_NAME = '{self.column}' AND DATA_TYPE <> '{data_type}';"
+        self.description = f"Changed {self.table}.{self.column} to {self.definition}."
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                             DDL AGGREGATION BASE CLASS                                           #
 # ------------------------------------------------------------------------------------------------ #
@@ -40,6 +82,7 @@ class DDL(ABC):  # pragma: no cover
     create: SQL
     drop: SQL
     exists: SQL
+    indexes: tuple = ()
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -49,9 +92,12 @@ class DDL(ABC):  # pragma: no cover
 class DML(ABC):  # pragma: no cover
     """Base class for entity Data Manipulation Language (DML)."""
     insert: type(SQL) = None
+    upsert: type(SQL) = None
     update: type(SQL) = None
     select: type(SQL) = None
     select_all: type(SQL) = None
+    select_page: type(SQL) = None
+    count: type(SQL) = None
     exists: type(SQL) = None
     delete: type(SQL) = None
 
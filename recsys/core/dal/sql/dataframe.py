@@ -17,7 +17,7 @@
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 from dataclasses import dataclass
-from recsys.core.dal.sql.base import SQL, DDL, DML
+from recsys.core.dal.sql.base import SQL, DDL, DML, CreateIndex
 from recsys.core.dal.dto import DTO
 from recsys.core.entity.base import Entity
 from recsys.core.entity.dataset import DataFrame
@@ -33,7 +33,7 @@ from recsys.core.entity.dataset import DataFrame
 @dataclass
 class CreateDataFrameTable(SQL):
     name: str = "dataframe"
-    sql: str = """CREATE TABLE IF NOT EXISTS dataframe (id MEDIUMINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), stage VARCHAR(64) NOT NULL, mode VARCHAR(32) NOT NULL, size BIGINT, nrows BIGINT, ncols SMALLINT, nulls SMALLINT, pct_nulls FLOAT, parent_id SMALLINT NOT NULL, created DATETIME, modified DATETIME, UNIQUE(name, mode));"""
+    sql: str = """CREATE TABLE IF NOT EXISTS dataframe (id BIGINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), stage VARCHAR(64) NOT NULL, mode VARCHAR(32) NOT NULL, size BIGINT, nrows BIGINT, ncols INT, nulls BIGINT, pct_nulls FLOAT, parent_id BIGINT NOT NULL, created DATETIME, modified DATETIME, UNIQUE(name, mode));"""
     args: tuple = ()
     description: str = "Created the dataframe table."
 
@@ -65,6 +65,10 @@ class DataFrameDDL(DDL):
     create: SQL = CreateDataFrameTable()
     drop: SQL = DropDataFrameTable()
     exists: SQL = DataFrameTableExists()
+    indexes: tuple = (
+        CreateIndex(table="dataframe", columns=("oid",)),
+        CreateIndex(table="dataframe", columns=("parent_id",)),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -99,6 +103,14 @@ class InsertDataFrame(SQL):
 # ------------------------------------------------------------------------------------------------ #
 
 
+@dataclass
+class UpsertDataFrame(InsertDataFrame):
+    sql: str = """INSERT INTO dataframe (oid, name, description, stage, mode, size, nrows, ncols, nulls, pct_nulls, parent_id, created, modified) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id), oid = VALUES(oid), description = VALUES(description), stage = VALUES(stage), size = VALUES(size), nrows = VALUES(nrows), ncols = VALUES(ncols), nulls = VALUES(nulls), pct_nulls = VALUES(pct_nulls), parent_id = VALUES(parent_id), modified = VALUES(modified);"""
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
 @dataclass
 class UpdateDataFrame(SQL):
     dto: DTO
@@ -141,12 +153,12 @@ class SelectDataFrame(SQL):
 
 @dataclass
 class SelectDataFrameByParentId(SQL):
-    dataset_id: int
-    sql: str = """SELECT * FROM dataframe WHERE dataset_id = %s;"""
+    parent_id: int
+    sql: str = """SELECT * FROM dataframe WHERE parent_id = %s;"""
     args: tuple = ()
 
     def __post_init__(self) -> None:
-        self.args = (self.dataset_id,)
+        self.args = (self.parent_id,)
 
 # ------------------------------------------------------------------------------------------------ #
 
@@ -174,6 +186,27 @@ class SelectAllDataset(SQL):
 # ------------------------------------------------------------------------------------------------ #
 
 
+@dataclass
+class SelectDataFramePage(SQL):
+    offset: int
+    limit: int
+    sql: str = """SELECT * FROM dataframe ORDER BY id LIMIT %s OFFSET %s;"""
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.args = (self.limit, self.offset)
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class CountDataFrame(SQL):
+    sql: str = """SELECT COUNT(*) FROM dataframe;"""
+    args: tuple = ()
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
 @dataclass
 class DataFrameExists(SQL):
     id: int
@@ -200,10 +233,13 @@ class DeleteDataFrame(SQL):
 class DataFrameDML(DML):
     entity: type(Entity) = DataFrame
     insert: type(SQL) = InsertDataFrame
+    upsert: type(SQL) = UpsertDataFrame
     update: type(SQL) = UpdateDataFrame
     select: type(SQL) = SelectDataFrame
     select_by_name_mode: type(SQL) = SelectDataFrameByNameMode
-    select_by_dataset_id: type(SQL) = SelectDataFrameByParentId
+    select_by_parent_id: type(SQL) = SelectDataFrameByParentId
     select_all: type(SQL) = SelectAllDataset
+    select_page: type(SQL) = SelectDataFramePage
+    count: type(SQL) = CountDataFrame
     exists: type(SQL) = DataFrameExists
     delete: type(SQL) = DeleteDataFrame
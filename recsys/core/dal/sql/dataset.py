@@ -17,7 +17,7 @@
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 from dataclasses import dataclass
-from recsys.core.dal.sql.base import SQL, DDL, DML
+from recsys.core.dal.sql.base import SQL, DDL, DML, CreateIndex
 from recsys.core.dal.dto import DTO
 from recsys.core.entity.base import Entity
 from recsys.core.entity.dataset import Dataset
@@ -32,7 +32,7 @@ from recsys.core.entity.dataset import Dataset
 @dataclass
 class CreateDatasetTable(SQL):
     name: str = "dataset"
-    sql: str = """CREATE TABLE IF NOT EXISTS dataset (id MEDIUMINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), datasource_id SMALLINT NOT NULL, mode VARCHAR(32) NOT NULL, stage VARCHAR(64) NOT NULL, task_id MEDIUMINT DEFAULT 0, created DATETIME, modified DATETIME, UNIQUE(name, mode));"""
+    sql: str = """CREATE TABLE IF NOT EXISTS dataset (id BIGINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), datasource_id BIGINT NOT NULL, mode VARCHAR(32) NOT NULL, stage VARCHAR(64) NOT NULL, task_id BIGINT DEFAULT 0, created DATETIME, modified DATETIME, UNIQUE(name, mode));"""
     args: tuple = ()
     description: str = "Created the dataset table."
 
@@ -64,6 +64,11 @@ class DatasetDDL(DDL):
     create: SQL = CreateDatasetTable()
     drop: SQL = DropDatasetTable()
     exists: SQL = DatasetTableExists()
+    indexes: tuple = (
+        CreateIndex(table="dataset", columns=("oid",)),
+        CreateIndex(table="dataset", columns=("datasource_id",)),
+        CreateIndex(table="dataset", columns=("task_id",)),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -94,6 +99,14 @@ class InsertDataset(SQL):
 # ------------------------------------------------------------------------------------------------ #
 
 
+@dataclass
+class UpsertDataset(InsertDataset):
+    sql: str = """INSERT INTO dataset (oid, name, description, datasource_id, mode, stage, task_id, created, modified) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s) ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id), oid = VALUES(oid), description = VALUES(description), datasource_id = VALUES(datasource_id), stage = VALUES(stage), task_id = VALUES(task_id), modified = VALUES(modified);"""
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
 @dataclass
 class UpdateDataset(SQL):
     dto: DTO
@@ -153,6 +166,27 @@ class SelectAllDataset(SQL):
 # ------------------------------------------------------------------------------------------------ #
 
 
+@dataclass
+class SelectDatasetPage(SQL):
+    offset: int
+    limit: int
+    sql: str = """SELECT * FROM dataset ORDER BY id LIMIT %s OFFSET %s;"""
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.args = (self.limit, self.offset)
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class CountDataset(SQL):
+    sql: str = """SELECT COUNT(*) FROM dataset;"""
+    args: tuple = ()
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
 @dataclass
 class DatasetExists(SQL):
     id: int
@@ -179,9 +213,12 @@ class DeleteDataset(SQL):
 class DatasetDML(DML):
     entity: type(Entity) = Dataset
     insert: type(SQL) = InsertDataset
+    upsert: type(SQL) = UpsertDataset
     update: type(SQL) = UpdateDataset
     select: type(SQL) = SelectDataset
     select_by_name_mode: type(SQL) = SelectDatasetByNameMode
     select_all: type(SQL) = SelectAllDataset
+    select_page: type(SQL) = SelectDatasetPage
+    count: type(SQL) = CountDataset
     exists: type(SQL) = DatasetExists
     delete: type(SQL) = DeleteDataset
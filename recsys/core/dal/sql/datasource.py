@@ -17,7 +17,7 @@
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 from dataclasses import dataclass
-from recsys.core.dal.sql.base import SQL, DDL, DML
+from recsys.core.dal.sql.base import SQL, DDL, DML, CreateIndex
 from recsys.core.dal.dto import DTO
 from recsys.core.entity.base import Entity
 from recsys.core.entity.datasource import DataSource
@@ -32,7 +32,7 @@ from recsys.core.entity.datasource import DataSource
 @dataclass
 class CreateDataSourceTable(SQL):
     name: str = "datasource"
-    sql: str = """CREATE TABLE IF NOT EXISTS datasource (id MEDIUMINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), website VARCHAR(255) NOT NULL, mode VARCHAR(32) NOT NULL, created DATETIME, modified DATETIME, UNIQUE(name, mode));"""
+    sql: str = """CREATE TABLE IF NOT EXISTS datasource (id BIGINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), website VARCHAR(255) NOT NULL, mode VARCHAR(32) NOT NULL, created DATETIME, modified DATETIME, UNIQUE(name, mode));"""
     args: tuple = ()
     description: str = "Created the datasource table"
 
@@ -64,6 +64,9 @@ class DataSourceDDL(DDL):
     create: SQL = CreateDataSourceTable()
     drop: SQL = DropDataSourceTable()
     exists: SQL = DataSourceTableExists()
+    indexes: tuple = (
+        CreateIndex(table="datasource", columns=("oid",)),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -92,6 +95,14 @@ class InsertDataSource(SQL):
 # ------------------------------------------------------------------------------------------------ #
 
 
+@dataclass
+class UpsertDataSource(InsertDataSource):
+    sql: str = """INSERT INTO datasource (oid, name, description, website, mode, created, modified) VALUES (%s, %s, %s, %s, %s, %s, %s) ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id), oid = VALUES(oid), description = VALUES(description), website = VALUES(website), modified = VALUES(modified);"""
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
 @dataclass
 class UpdateDataSource(SQL):
     dto: DTO
@@ -149,6 +160,27 @@ class SelectAllDataSource(SQL):
 # ------------------------------------------------------------------------------------------------ #
 
 
+@dataclass
+class SelectDataSourcePage(SQL):
+    offset: int
+    limit: int
+    sql: str = """SELECT * FROM datasource ORDER BY id LIMIT %s OFFSET %s;"""
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.args = (self.limit, self.offset)
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class CountDataSource(SQL):
+    sql: str = """SELECT COUNT(*) FROM datasource;"""
+    args: tuple = ()
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
 @dataclass
 class DataSourceExists(SQL):
     id: int
@@ -175,9 +207,12 @@ class DeleteDataSource(SQL):
 class DataSourceDML(DML):
     entity: type(Entity) = DataSource
     insert: type(SQL) = InsertDataSource
+    upsert: type(SQL) = UpsertDataSource
     update: type(SQL) = UpdateDataSource
     select: type(SQL) = SelectDataSource
     select_by_name_mode: type(SQL) = SelectDataSourceByNameMode
     select_all: type(SQL) = SelectAllDataSource
+    select_page: type(SQL) = SelectDataSourcePage
+    count: type(SQL) = CountDataSource
     exists: type(SQL) = DataSourceExists
     delete: type(SQL) = DeleteDataSource
@@ -17,7 +17,7 @@
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 from dataclasses import dataclass
-from recsys.core.dal.sql.base import SQL, DDL, DML
+from recsys.core.dal.sql.base import SQL, DDL, DML, CreateIndex
 from recsys.core.dal.dto import DTO
 from recsys.core.entity.base import Entity
 from recsys.core.entity.datasource import DataSourceURL
@@ -32,7 +32,7 @@ from recsys.core.entity.datasource import DataSourceURL
 @dataclass
 class CreateDataSourceURLTable(SQL):
     name: str = "datasource_url"
-    sql: str = """CREATE TABLE IF NOT EXISTS datasource_url (id MEDIUMINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), url VARCHAR(255) NOT NULL, mode VARCHAR(32) NOT NULL, parent_id SMALLINT NOT NULL, created DATETIME, modified DATETIME, UNIQUE(name, mode));"""
+    sql: str = """CREATE TABLE IF NOT EXISTS datasource_url (id BIGINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), url VARCHAR(255) NOT NULL, mode VARCHAR(32) NOT NULL, parent_id BIGINT NOT NULL, created DATETIME, modified DATETIME, UNIQUE(name, mode));"""
     args: tuple = ()
     description: str = "Created the datasource URL table."
 
@@ -64,6 +64,10 @@ class DataSourceURLDDL(DDL):
     create: SQL = CreateDataSourceURLTable()
     drop: SQL = DropDataSourceURLTable()
     exists: SQL = DataSourceURLTableExists()
+    indexes: tuple = (
+        CreateIndex(table="datasource_url", columns=("oid",)),
+        CreateIndex(table="datasource_url", columns=("parent_id",)),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -93,6 +97,14 @@ class InsertDataSourceURL(SQL):
 # ------------------------------------------------------------------------------------------------ #
 
 
+@dataclass
+class UpsertDataSourceURL(InsertDataSourceURL):
+    sql: str = """INSERT INTO datasource_url (oid, name, description, url, mode, parent_id, created, modified) VALUES (%s, %s, %s, %s, %s, %s, %s, %s) ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id), oid = VALUES(oid), description = VALUES(description), url = VALUES(url), parent_id = VALUES(parent_id), modified = VALUES(modified);"""
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
 @dataclass
 class UpdateDataSourceURL(SQL):
     dto: DTO
@@ -161,6 +173,27 @@ class SelectAllDataSourceURL(SQL):
 # ------------------------------------------------------------------------------------------------ #
 
 
+@dataclass
+class SelectDataSourceURLPage(SQL):
+    offset: int
+    limit: int
+    sql: str = """SELECT * FROM datasource_url ORDER BY id LIMIT %s OFFSET %s;"""
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.args = (self.limit, self.offset)
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class CountDataSourceURL(SQL):
+    sql: str = """SELECT COUNT(*) FROM datasource_url;"""
+    args: tuple = ()
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
 @dataclass
 class DataSourceURLExists(SQL):
     id: int
@@ -187,10 +220,13 @@ class DeleteDataSourceURL(SQL):
 class DataSourceURLDML(DML):
     entity: type(Entity) = DataSourceURL
     insert: type(SQL) = InsertDataSourceURL
+    upsert: type(SQL) = UpsertDataSourceURL
     update: type(SQL) = UpdateDataSourceURL
     select: type(SQL) = SelectDataSourceURL
     select_by_name_mode: type(SQL) = SelectDataSourceURLByNameMode
     select_by_parent_id: type(SQL) = SelectDataSourceURLByParentId
     select_all: type(SQL) = SelectAllDataSourceURL
+    select_page: type(SQL) = SelectDataSourceURLPage
+    count: type(SQL) = CountDataSourceURL
     exists: type(SQL) = DataSourceURLExists
     delete: type(SQL) = DeleteDataSourceURL
@@ -17,7 +17,7 @@
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 from dataclasses import dataclass
-from recsys.core.dal.sql.base import SQL, DDL, DML
+from recsys.core.dal.sql.base import SQL, DDL, DML, CreateIndex
 from recsys.core.dal.dto import DTO
 from recsys.core.entity.base import Entity
 from recsys.core.entity.file import File
@@ -32,7 +32,7 @@ from recsys.core.entity.file import File
 @dataclass
 class CreateFileTable(SQL):
     name: str = "file"
-    sql: str = """CREATE TABLE IF NOT EXISTS file (id MEDIUMINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), datasource_id SMALLINT NOT NULL, mode VARCHAR(32) NOT NULL, stage VARCHAR(64) NOT NULL, uri VARCHAR(255) NOT NULL, size BIGINT DEFAULT 0, task_id MEDIUMINT DEFAULT 0, created DATETIME, modified DATETIME, UNIQUE(name, mode));"""
+    sql: str = """CREATE TABLE IF NOT EXISTS file (id BIGINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), datasource_id BIGINT NOT NULL, mode VARCHAR(32) NOT NULL, stage VARCHAR(64) NOT NULL, uri VARCHAR(255) NOT NULL, size BIGINT DEFAULT 0, task_id BIGINT DEFAULT 0, created DATETIME, modified DATETIME, UNIQUE(name, mode));"""
     args: tuple = ()
     description: str = "Created the file table"
 
@@ -64,6 +64,11 @@ class FileDDL(DDL):
     create: SQL = CreateFileTable()
     drop: SQL = DropFileTable()
     exists: SQL = FileTableExists()
+    indexes: tuple = (
+        CreateIndex(table="file", columns=("oid",)),
+        CreateIndex(table="file", columns=("datasource_id",)),
+        CreateIndex(table="file", columns=("task_id",)),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -96,6 +101,14 @@ class InsertFile(SQL):
 # ------------------------------------------------------------------------------------------------ #
 
 
+@dataclass
+class UpsertFile(InsertFile):
+    sql: str = """INSERT INTO file (oid, name, description, datasource_id, mode, stage, uri, size, task_id, created, modified) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id), oid = VALUES(oid), description = VALUES(description), datasource_id = VALUES(datasource_id), stage = VALUES(stage), uri = VALUES(uri), size = VALUES(size), task_id = VALUES(task_id), modified = VALUES(modified);"""
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
 @dataclass
 class UpdateFile(SQL):
     dto: DTO
@@ -157,6 +170,27 @@ class SelectAllFile(SQL):
 # ------------------------------------------------------------------------------------------------ #
 
 
+@dataclass
+class SelectFilePage(SQL):
+    offset: int
+    limit: int
+    sql: str = """SELECT * FROM file ORDER BY id LIMIT %s OFFSET %s;"""
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.args = (self.limit, self.offset)
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class CountFile(SQL):
+    sql: str = """SELECT COUNT(*) FROM file;"""
+    args: tuple = ()
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
 @dataclass
 class FileExists(SQL):
     id: int
@@ -183,9 +217,12 @@ class DeleteFile(SQL):
 class FileDML(DML):
     entity: type(Entity) = File
     insert: type(SQL) = InsertFile
+    upsert: type(SQL) = UpsertFile
     update: type(SQL) = UpdateFile
     select: type(SQL) = SelectFile
     select_by_name_mode: type(SQL) = SelectFileByNameMode
     select_all: type(SQL) = SelectAllFile
+    select_page: type(SQL) = SelectFilePage
+    count: type(SQL) = CountFile
     exists: type(SQL) = FileExists
     delete: type(SQL) = DeleteFile
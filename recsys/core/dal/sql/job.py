@@ -17,7 +17,7 @@
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 from dataclasses import dataclass
-from recsys.core.dal.sql.base import SQL, DDL, DML
+from recsys.core.dal.sql.base import SQL, DDL, DML, CreateIndex
 from recsys.core.dal.dto import DTO
 from recsys.core.entity.base import Entity
 from recsys.core.entity.job import Job
@@ -33,7 +33,7 @@ from recsys.core.entity.job import Job
 @dataclass
 class CreateJobTable(SQL):
     name: str = "job"
-    sql: str = """CREATE TABLE IF NOT EXISTS job (id MEDIUMINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), mode VARCHAR(32) NOT NULL, state VARCHAR(32), created DATETIME, modified DATETIME, UNIQUE(name, mode));"""
+    sql: str = """CREATE TABLE IF NOT EXISTS job (id BIGINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), mode VARCHAR(32) NOT NULL, state VARCHAR(32), created DATETIME, modified DATETIME, UNIQUE(name, mode));"""
     args: tuple = ()
     description: str = "Created the job table."
 
@@ -65,6 +65,9 @@ class JobDDL(DDL):
     create: SQL = CreateJobTable()
     drop: SQL = DropJobTable()
     exists: SQL = JobTableExists()
+    indexes: tuple = (
+        CreateIndex(table="job", columns=("oid",)),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -94,6 +97,14 @@ class InsertJob(SQL):
 # ------------------------------------------------------------------------------------------------ #
 
 
+@dataclass
+class UpsertJob(InsertJob):
+    sql: str = """INSERT INTO job (oid, name, description, mode, state, created, modified) VALUES (%s, %s, %s, %s, %s, %s, %s) ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id), oid = VALUES(oid), description = VALUES(description), state = VALUES(state), modified = VALUES(modified);"""
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
 @dataclass
 class UpdateJob(SQL):
     dto: DTO
@@ -147,6 +158,27 @@ class SelectAllJob(SQL):
     sql: str = """SELECT * FROM job;"""
     args: tuple = ()
 
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+@dataclass
+class SelectJobPage(SQL):
+    offset: int
+    limit: int
+    sql: str = """SELECT * FROM job ORDER BY id LIMIT %s OFFSET %s;"""
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.args = (self.limit, self.offset)
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class CountJob(SQL):
+    sql: str = """SELECT COUNT(*) FROM job;"""
+    args: tuple = ()
+
 # ------------------------------------------------------------------------------------------------ #
 
 
@@ -176,9 +208,12 @@ class DeleteJob(SQL):
 class JobDML(DML):
     entity: type(Entity) = Job
     insert: type(SQL) = InsertJob
+    upsert: type(SQL) = UpsertJob
     update: type(SQL) = UpdateJob
     select: type(SQL) = SelectJob
     select_by_name_mode: type(SQL) = SelectJobByNameMode
     select_all: type(SQL) = SelectAllJob
+    select_page: type(SQL) = SelectJobPage
+    count: type(SQL) = CountJob
     exists: type(SQL) = JobExists
     delete: type(SQL) = DeleteJob
@@ -17,7 +17,7 @@
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 from dataclasses import dataclass
-from recsys.core.dal.sql.base import SQL, DDL, DML
+from recsys.core.dal.sql.base import SQL, DDL, DML, CreateIndex
 from recsys.core.dal.dto import DTO
 from recsys.core.entity.base import Entity
 from recsys.core.entity.profile import Profile
@@ -32,7 +32,7 @@ from recsys.core.entity.profile import Profile
 @dataclass
 class CreateProfileTable(SQL):
     name: str = "profile"
-    sql: str = """CREATE TABLE IF NOT EXISTS profile  (id MEDIUMINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), mode VARCHAR(32), start DATETIME, end DATETIME, duration MEDIUMINT, user_cpu_time BIGINT, percent_cpu_used FLOAT, total_physical_memory BIGINT, physical_memory_available BIGINT, physical_memory_used BIGINT, percent_physical_memory_used FLOAT, active_memory_used BIGINT, disk_usage BIGINT, percent_disk_usage FLOAT, read_count BIGINT, write_count BIGINT, read_bytes BIGINT, write_bytes BIGINT, read_time FLOAT, write_time FLOAT, bytes_sent BIGINT, bytes_recv BIGINT, parent_id MEDIUMINT NOT NULL, created DATETIME, modified DATETIME, UNIQUE(name, mode));"""
+    sql: str = """CREATE TABLE IF NOT EXISTS profile  (id BIGINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), mode VARCHAR(32), start DATETIME, end DATETIME, duration MEDIUMINT, user_cpu_time BIGINT, percent_cpu_used FLOAT, total_physical_memory BIGINT, physical_memory_available BIGINT, physical_memory_used BIGINT, percent_physical_memory_used FLOAT, active_memory_used BIGINT, disk_usage BIGINT, percent_disk_usage FLOAT, read_count BIGINT, write_count BIGINT, read_bytes BIGINT, write_bytes BIGINT, read_time FLOAT, write_time FLOAT, bytes_sent BIGINT, bytes_recv BIGINT, parent_id BIGINT NOT NULL, created DATETIME, modified DATETIME, UNIQUE(name, mode));"""
     args: tuple = ()
     description: str = "Created the profile table."
 
@@ -64,6 +64,10 @@ class ProfileDDL(DDL):
     create: SQL = CreateProfileTable()
     drop: SQL = DropProfileTable()
     exists: SQL = ProfileTableExists()
+    indexes: tuple = (
+        CreateIndex(table="profile", columns=("oid",)),
+        CreateIndex(table="profile", columns=("parent_id",)),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -112,6 +116,14 @@ class InsertProfile(SQL):
 # ------------------------------------------------------------------------------------------------ #
 
 
+@dataclass
+class UpsertProfile(InsertProfile):
+    sql: str = """INSERT INTO profile (oid, name, description, mode, start, end, duration, user_cpu_time, percent_cpu_used, total_physical_memory, physical_memory_available, physical_memory_used, percent_physical_memory_used, active_memory_used, disk_usage, percent_disk_usage, read_count, write_count, read_bytes, write_bytes, read_time, write_time, bytes_sent, bytes_recv, parent_id, created, modified) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id), oid = VALUES(oid), description = VALUES(description), start = VALUES(start), end = VALUES(end), duration = VALUES(duration), user_cpu_time = VALUES(user_cpu_time), percent_cpu_used = VALUES(percent_cpu_used), total_physical_memory = VALUES(total_physical_memory), physical_memory_available = VALUES(physical_memory_available), physical_memory_used = VALUES(physical_memory_used), percent_physical_memory_used = VALUES(percent_physical_memory_used), active_memory_used = VALUES(active_memory_used), disk_usage = VALUES(disk_usage), percent_disk_usage = VALUES(percent_disk_usage), read_count = VALUES(read_count), write_count = VALUES(write_count), read_bytes = VALUES(read_bytes), write_bytes = VALUES(write_bytes), read_time = VALUES(read_time), write_time = VALUES(write_time), bytes_sent = VALUES(bytes_sent), bytes_recv = VALUES(bytes_recv), parent_id = VALUES(parent_id), modified = VALUES(modified);"""
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
 @dataclass
 class UpdateProfile(SQL):
     dto: DTO
@@ -180,11 +192,45 @@ class SelectProfileByNameMode(SQL):
 # ------------------------------------------------------------------------------------------------ #
 
 
+@dataclass
+class SelectProfileByParentId(SQL):
+    parent_id: int
+    sql: str = """SELECT * FROM profile WHERE parent_id = %s;"""
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.args = (self.parent_id,)
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
 @dataclass
 class SelectAllProfiles(SQL):
     sql: str = """SELECT * FROM profile;"""
     args: tuple = ()
 
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+@dataclass
+class SelectProfilePage(SQL):
+    offset: int
+    limit: int
+    sql: str = """SELECT * FROM profile ORDER BY id LIMIT %s OFFSET %s;"""
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.args = (self.limit, self.offset)
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class CountProfile(SQL):
+    sql: str = """SELECT COUNT(*) FROM profile;"""
+    args: tuple = ()
+
 # ------------------------------------------------------------------------------------------------ #
 
 
@@ -214,9 +260,13 @@ class DeleteProfile(SQL):
 class ProfileDML(DML):
     entity: type(Entity) = Profile
     insert: type(SQL) = InsertProfile
+    upsert: type(SQL) = UpsertProfile
     update: type(SQL) = UpdateProfile
     select: type(SQL) = SelectProfile
     select_by_name_mode: type(SQL) = SelectProfileByNameMode
+    select_by_parent_id: type(SQL) = SelectProfileByParentId
     select_all: type(SQL) = SelectAllProfiles
+    select_page: type(SQL) = SelectProfilePage
+    count: type(SQL) = CountProfile
     exists: type(SQL) = ProfileExists
     delete: type(SQL) = DeleteProfile
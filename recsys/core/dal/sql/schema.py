@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /recsys/core/dal/sql/schema.py                                                      #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday January 15th 2023 09:12:40 am                                                #
+# Modified   : Sunday January 15th 2023 09:12:40 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Schema Versioning and Migrations for the Relational Database."""
+from dataclasses import dataclass
+
+from recsys.core.dal.sql.base import SQL, DDL, ModifyColumn
+from recsys.core.dal.sql.dataframe import DataFrameDDL
+from recsys.core.dal.sql.dataset import DatasetDDL
+from recsys.core.dal.sql.datasource import DataSourceDDL
+from recsys.core.dal.sql.datasource_url import DataSourceURLDDL
+from recsys.core.dal.sql.file import FileDDL
+from recsys.core.dal.sql.job import JobDDL
+from recsys.core.dal.sql.profile import ProfileDDL
+from recsys.core.dal.sql.task import TaskDDL
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                            DDL                                                   #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class CreateSchemaVersionTable(SQL):
+    name: str = "schema_version"
+    sql: str = """CREATE TABLE IF NOT EXISTS schema_version (version INT PRIMARY KEY, description VARCHAR(255), applied DATETIME);"""
+    args: tuple = ()
+    description: str = "Created the schema_version table."
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class DropSchemaVersionTable(SQL):
+    name: str = "schema_version"
+    sql: str = """DROP TABLE IF EXISTS schema_version;"""
+    args: tuple = ()
+    description: str = "Dropped the schema_version table."
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class SchemaVersionTableExists(SQL):
+    name: str = "schema_version"
+    sql: str = """SELECT COUNT(TABLE_NAME) FROM information_schema.TABLES WHERE TABLE_NAME = 'schema_version';"""
+    args: tuple = ()
+    description: str = "Checked the existence of the schema_version table."
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class SchemaVersionDDL(DDL):
+    create: SQL = CreateSchemaVersionTable()
+    drop: SQL = DropSchemaVersionTable()
+    exists: SQL = SchemaVersionTableExists()
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          DML                                                     #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class SelectSchemaVersion(SQL):
+    sql: str = """SELECT MAX(version) FROM schema_version;"""
+    args: tuple = ()
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class InsertSchemaVersion(SQL):
+    version: int
+    description: str
+    applied: str
+    sql: str = """INSERT INTO schema_version (version, description, applied) VALUES (%s, %s, %s);"""
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.args = (self.version, self.description, self.applied)
+
+
+# ================================================================================================ #
+#                                        MIGRATIONS                                                #
+# ================================================================================================ #
+@dataclass
+class Migration:
+    """An ordered, numbered set of schema changes.
+
+    Each statement carries a guard query that is true while the change is still pending, so a
+    migration interrupted part way through can be run again.
+    """
+
+    version: int
+    description: str
+    statements: tuple
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _widen(table: str, columns: tuple) -> tuple:
+    statements = [ModifyColumn(table=table, column="id", definition="BIGINT NOT NULL AUTO_INCREMENT")]
+    statements.extend(ModifyColumn(table=table, column=column, definition=definition) for column, definition in columns)
+    return tuple(statements)
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _indexes(*ddls: DDL) -> tuple:
+    return tuple(index for ddl in ddls for index in ddl.indexes)
+
+
+# ------------------------------------------------------------------------------------------------ #
+MIGRATIONS = (
+    Migration(
+        version=1,
+        description="Widened the surrogate and foreign key columns to BIGINT.",
+        statements=(
+            _widen("dataframe", (("parent_id", "BIGINT NOT NULL"), ("ncols", "INT"), ("nulls", "BIGINT")))
+            + _widen("dataset", (("datasource_id", "BIGINT NOT NULL"), ("task_id", "BIGINT DEFAULT 0")))
+            + _widen("datasource", ())
+            + _widen("datasource_url", (("parent_id", "BIGINT NOT NULL"),))
+            + _widen("file", (("datasource_id", "BIGINT NOT NULL"), ("task_id", "BIGINT DEFAULT 0")))
+            + _widen("job", ())
+            + _widen("task", (("parent_id", "BIGINT NOT NULL"),))
+            + _widen("profile", (("parent_id", "BIGINT NOT NULL"),))
+        ),
+    ),
+    Migration(
+        version=2,
+        description="Indexed the oid and foreign key columns.",
+        statements=_indexes(
+            DataFrameDDL(),
+            DatasetDDL(),
+            DataSourceDDL(),
+            DataSourceURLDDL(),
+            FileDDL(),
+            JobDDL(),
+            TaskDDL(),
+            ProfileDDL(),
+        ),
+    ),
+)
@@ -17,7 +17,7 @@
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 from dataclasses import dataclass
-from recsys.core.dal.sql.base import SQL, DDL, DML
+from recsys.core.dal.sql.base import SQL, DDL, DML, CreateIndex
 from recsys.core.dal.dto import DTO
 from recsys.core.entity.base import Entity
 from recsys.core.entity.job import Task
@@ -33,7 +33,7 @@ from recsys.core.entity.job import Task
 @dataclass
 class CreateTaskTable(SQL):
     name: str = "task"
-    sql: str = """CREATE TABLE IF NOT EXISTS task (id MEDIUMINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), mode VARCHAR(32) NOT NULL, state VARCHAR(32), parent_id MEDIUMINT NOT NULL, created DATETIME, modified DATETIME, UNIQUE(name, mode));"""
+    sql: str = """CREATE TABLE IF NOT EXISTS task (id BIGINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), mode VARCHAR(32) NOT NULL, state VARCHAR(32), parent_id BIGINT NOT NULL, created DATETIME, modified DATETIME, UNIQUE(name, mode));"""
     args: tuple = ()
     description: str = "Created the task table."
 
@@ -65,6 +65,10 @@ class TaskDDL(DDL):
     create: SQL = CreateTaskTable()
     drop: SQL = DropTaskTable()
     exists: SQL = TaskTableExists()
+    indexes: tuple = (
+        CreateIndex(table="task", columns=("oid",)),
+        CreateIndex(table="task", columns=("parent_id",)),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -94,6 +98,14 @@ class InsertTask(SQL):
 # ------------------------------------------------------------------------------------------------ #
 
 
+@dataclass
+class UpsertTask(InsertTask):
+    sql: str = """INSERT INTO task (oid, name, description, mode, state, parent_id, created, modified) VALUES (%s, %s, %s, %s, %s, %s, %s, %s) ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id), oid = VALUES(oid), description = VALUES(description), state = VALUES(state), parent_id = VALUES(parent_id), modified = VALUES(modified);"""
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
 @dataclass
 class UpdateTask(SQL):
     dto: DTO
@@ -161,6 +173,27 @@ class SelectAllTasks(SQL):
     args: tuple = ()
 
 
+# ------------------------------------------------------------------------------------------------ #
+
+
+@dataclass
+class SelectTaskPage(SQL):
+    offset: int
+    limit: int
+    sql: str = """SELECT * FROM task ORDER BY id LIMIT %s OFFSET %s;"""
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.args = (self.limit, self.offset)
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class CountTask(SQL):
+    sql: str = """SELECT COUNT(*) FROM task;"""
+    args: tuple = ()
+
+
 # ------------------------------------------------------------------------------------------------ #
 
 @dataclass
@@ -189,10 +222,13 @@ class DeleteTask(SQL):
 class TaskDML(DML):
     entity: type(Entity) = Task
     insert: type(SQL) = InsertTask
+    upsert: type(SQL) = UpsertTask
     update: type(SQL) = UpdateTask
     select: type(SQL) = SelectTask
     select_by_name_mode: type(SQL) = SelectTaskByNameMode
     select_by_parent_id: type(SQL) = SelectTaskByParentId
     select_all: type(SQL) = SelectAllTasks
+    select_page: type(SQL) = SelectTaskPage
+    count: type(SQL) = CountTask
     exists: type(SQL) = TaskExists
     delete: type(SQL) = DeleteTask
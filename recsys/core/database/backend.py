@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /recsys/core/database/backend.py                                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday January 12th 2023 09:42:17 pm                                              #
+# Modified   : Thursday January 12th 2023 09:42:17 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Key-value storage backends for the object database."""
+import os
+import dbm
+import pickle
+import shelve
+import sqlite3
+import logging
+from abc import abstractmethod
+from glob import glob
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from recsys.core.services.base import Service
+from .serializer import Serializer
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          BACKEND                                                 #
+# ------------------------------------------------------------------------------------------------ #
+class Backend(Service):
+    """Abstract base class for the key-value stores behind object database cursors.
+
+    Backends map entity oids to entities. Writes become visible to other readers on commit,
+    and are flushed to disk on sync or close.
+
+    Args:
+        location (str): The path of the store, without a file extension.
+        serializer (Serializer): Converts entities to and from stored bytes. Defaults to
+            pickle protocol 5 without compression.
+    """
+
+    def __init__(self, location: str, serializer: Serializer = None) -> None:
+        super().__init__()
+        self._location = location
+        self._serializer = serializer or Serializer()
+
+    @property
+    def location(self) -> str:
+        return self._location
+
+    @property
+    def serializer(self) -> Serializer:
+        return self._serializer
+
+    @property
+    @abstractmethod
+    def is_open(self) -> bool:
+        """Returns True if the store is open."""
+
+    @abstractmethod
+    def open(self) -> None:
+        """Opens the store if it isn't already open."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Commits pending writes and closes the store."""
+
+    @abstractmethod
+    def commit(self) -> None:
+        """Makes pending writes visible to other readers of the store."""
+
+    @abstractmethod
+    def sync(self) -> None:
+        """Commits pending writes and flushes them to disk."""
+
+    @abstractmethod
+    def drop(self) -> None:
+        """Closes the store and removes its files."""
+
+    @abstractmethod
+    def exists(self) -> bool:
+        """Returns True if the store exists on disk."""
+
+    @abstractmethod
+    def items(self) -> List[Tuple[str, Any]]:
+        """Returns a list of (oid, entity) pairs."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all entities and index entries from the store."""
+
+    def is_indexed(self) -> bool:
+        """Returns False if the store may hold entities written before the secondary index existed."""
+        return True
+
+    def set_indexed(self) -> None:
+        """Records that every entity in the store is indexed."""
+
+    @abstractmethod
+    def index(self, oid: str, headers: Dict[str, str]) -> None:
+        """Replaces the secondary index entries of an entity with the field/value headers."""
+
+    @abstractmethod
+    def find(self, criteria: Dict[str, str]) -> List[str]:
+        """Returns the sorted oids whose index headers match all criteria."""
+
+    @abstractmethod
+    def iterkeys(self, prefix: str = None, batch_size: int = 1000) -> Iterator[List[str]]:
+        """Yields batches of at most batch_size oids, optionally those starting with prefix."""
+
+    @abstractmethod
+    def get_headers(self, oids: List[str]) -> Dict[str, Dict[str, str]]:
+        """Returns the index headers of the oids, keyed by oid."""
+
+    @abstractmethod
+    def __contains__(self, oid: str) -> bool:
+        """Returns True if the oid is in the store."""
+
+    @abstractmethod
+    def read(self, oid: str) -> Tuple[Any, Optional[int]]:
+        """Returns the entity for the oid and the size of its stored value in bytes, or None if
+        the size isn't known. Raises KeyError if it doesn't exist."""
+
+    def __getitem__(self, oid: str) -> Any:
+        """Returns the entity for the oid. Raises KeyError if it doesn't exist."""
+        return self.read(oid)[0]
+
+    @abstractmethod
+    def __setitem__(self, oid: str, entity: Any) -> None:
+        """Inserts or replaces the entity for the oid."""
+
+    @abstractmethod
+    def __delitem__(self, oid: str) -> None:
+        """Deletes the entity and its index entries. Raises KeyError if it doesn't exist."""
+
+    def get(self, oid: str, default: Any = None) -> Any:
+        try:
+            return self[oid]
+        except KeyError:
+            return default
+
+    def get_many(self, oids: List[str]) -> Dict[str, Any]:
+        """Returns the entities found for the oids, keyed by oid."""
+        return {oid: entity for oid, (entity, _) in self.read_many(oids).items()}
+
+    def read_many(self, oids: List[str]) -> Dict[str, Tuple[Any, Optional[int]]]:
+        """Returns (entity, stored size in bytes) pairs for the oids found, keyed by oid."""
+        entities = {}
+        for oid in oids:
+            try:
+                entities[oid] = self.read(oid)
+            except KeyError:
+                pass
+        return entities
+
+    def _remove(self, pattern: str) -> None:
+        """Removes files that match the glob pattern."""
+        file_list = glob(pattern, recursive=True)
+        for filepath in file_list:
+            try:
+                os.remove(filepath)
+                msg = f"Removed {filepath}."
+                self._logger.debug(msg)
+            except OSError:  # pragma: no cover
+                msg = f"Encountered an error while deleting file at {filepath}"
+                self._logger.error(msg)
+                raise OSError(msg)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       SHELVE BACKEND                                             #
+# ------------------------------------------------------------------------------------------------ #
+class ShelveBackend(Backend):
+    """Stores entities in a shelve (dbm) database.
+
+    Shelve has no transactions and allows a single writer. Writes go straight to the dbm file,
+    so commit is a no-op. The secondary index is kept under reserved keys: one set of oids per
+    field and value, and the indexed headers of each oid.
+
+    Stores written before values were framed by the serializer hold entities pickled by shelve
+    itself. These are read as they are, with an unknown stored size. A reserved key marks stores
+    whose entities are all indexed; stores without it are indexed when first opened.
+
+    Args:
+        location (str): The path of the shelve database, without a file extension.
+        serializer (Serializer): Converts entities to and from stored bytes.
+    """
+
+    __reserved = "__"
+
+    def __init__(self, location: str, serializer: Serializer = None) -> None:
+        super().__init__(location=location, serializer=serializer)
+        self._shelf = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._shelf is not None
+
+    def open(self) -> None:
+        if self._shelf is None:
+            os.makedirs(os.path.dirname(self._location), exist_ok=True)
+            self._shelf = shelve.open(self._location)
+            if next(iter(self._shelf), None) is None:
+                self.set_indexed()
+
+    def close(self) -> None:
+        if self._shelf is not None:
+            self._shelf.close()
+            self._shelf = None
+
+    def commit(self) -> None:
+        pass
+
+    def sync(self) -> None:
+        if self._shelf is not None:
+            self._shelf.sync()
+
+    def drop(self) -> None:
+        self.close()
+        pattern = self._location + ".*"
+        self._remove(pattern)
+        msg = f"Pattern: {pattern}."
+        self._logger.debug(msg)
+
+    def exists(self) -> bool:
+        return bool(dbm.whichdb(self._location))
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(oid, self._loads(data)[0]) for oid, data in self._shelf.items() if not oid.startswith(self.__reserved)]
+
+    def clear(self) -> None:
+        self._shelf.clear()
+        self.set_indexed()
+
+    def is_indexed(self) -> bool:
+        return self._indexed_key() in self._shelf
+
+    def set_indexed(self) -> None:
+        self._shelf[self._indexed_key()] = self._serializer.dumps(True)
+
+    def index(self, oid: str, headers: Dict[str, str]) -> None:
+        self._unindex(oid)
+        for field, value in headers.items():
+            key = self._posting_key(field, value)
+            oids = self._read(key, set())
+            oids.add(oid)
+            self._shelf[key] = self._serializer.dumps(oids)
+        self._shelf[self._headers_key(oid)] = self._serializer.dumps(headers)
+
+    def iterkeys(self, prefix: str = None, batch_size: int = 1000) -> Iterator[List[str]]:
+        prefix = prefix or ""
+        batch = []
+        for oid in self._shelf.keys():
+            if oid.startswith(prefix) and not oid.startswith(self.__reserved):
+                batch.append(oid)
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    def get_headers(self, oids: List[str]) -> Dict[str, Dict[str, str]]:
+        return {oid: self._read(self._headers_key(oid), {}) for oid in oids}
+
+    def find(self, criteria: Dict[str, str]) -> List[str]:
+        if not criteria:
+            return sorted(oid for oid in self._shelf.keys() if not oid.startswith(self.__reserved))
+        postings = [self._read(self._posting_key(field, value), set()) for field, value in criteria.items()]
+        return sorted(set.intersection(*postings))
+
+    def __contains__(self, oid: str) -> bool:
+        return oid in self._shelf
+
+    def read(self, oid: str) -> Tuple[Any, Optional[int]]:
+        return self._loads(self._shelf[oid])
+
+    def __setitem__(self, oid: str, entity: Any) -> None:
+        self._shelf[oid] = self._serializer.dumps(entity)
+
+    def __delitem__(self, oid: str) -> None:
+        del self._shelf[oid]
+        self._unindex(oid)
+
+    def _unindex(self, oid: str) -> None:
+        headers = self._read(self._headers_key(oid), {})
+        for field, value in headers.items():
+            key = self._posting_key(field, value)
+            oids = self._read(key, set())
+            oids.discard(oid)
+            if oids:
+                self._shelf[key] = self._serializer.dumps(oids)
+            else:
+                del self._shelf[key]
+        if headers:
+            del self._shelf[self._headers_key(oid)]
+
+    def _loads(self, data: Any) -> Tuple[Any, Optional[int]]:
+        """Deserializes a stored value, accepting the unframed values of legacy stores."""
+        if not isinstance(data, bytes):
+            return data, None
+        if data[:1] == pickle.PROTO:
+            return pickle.loads(data), len(data)
+        return self._serializer.loads(data), len(data)
+
+    def _read(self, key: str, default: Any) -> Any:
+        try:
+            return self._serializer.loads(self._shelf[key])
+        except KeyError:
+            return default
+
+    def _posting_key(self, field: str, value: str) -> str:
+        return f"{self.__reserved}index/{field}/{value}"
+
+    def _headers_key(self, oid: str) -> str:
+        return f"{self.__reserved}headers/{oid}"
+
+    def _indexed_key(self) -> str:
+        return f"{self.__reserved}indexed"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       SQLITE BACKEND                                             #
+# ------------------------------------------------------------------------------------------------ #
+class SQLiteBackend(Backend):
+    """Stores serialized entities in a SQLite database.
+
+    The database runs in write-ahead-log mode, so any number of readers, in this or other
+    processes, can read the last committed state while a writer is active. Writes accumulate
+    in a single SQLite transaction until commit, which makes multi-key commits atomic. The
+    secondary index is a (field, value, oid) table written in the same transaction.
+
+    Args:
+        location (str): The path of the database. The '.sqlite' extension is appended.
+        serializer (Serializer): Converts entities to and from stored bytes.
+        timeout (float): Seconds to wait for another writer to release its lock. Default = 30.
+    """
+
+    __extension = ".sqlite"
+    __max_variables = 900  # Stays below SQLite's default limit on host parameters per statement.
+
+    def __init__(self, location: str, serializer: Serializer = None, timeout: float = 30.0) -> None:
+        super().__init__(location=location, serializer=serializer)
+        self._filepath = location + self.__extension
+        self._timeout = timeout
+        self._connection = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._connection is not None
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    def open(self) -> None:
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self._filepath), exist_ok=True)
+            # The handle may be shared by threads; cursors serialize writes with their write lock.
+            self._connection = sqlite3.connect(self._filepath, timeout=self._timeout, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS object (oid TEXT PRIMARY KEY, entity BLOB NOT NULL)")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS object_index (field TEXT NOT NULL, value TEXT NOT NULL, oid TEXT NOT NULL, "
+                "PRIMARY KEY (field, value, oid)) WITHOUT ROWID"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS object_index_oid ON object_index (oid)")
+            self._connection.commit()
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.commit()
+            self._connection.close()
+            self._connection = None
+
+    def commit(self) -> None:
+        if self._connection is not None:
+            self._connection.commit()
+
+    def sync(self) -> None:
+        self.commit()
+
+    def drop(self) -> None:
+        self.close()
+        pattern = self._filepath + "*"
+        self._remove(pattern)
+        msg = f"Pattern: {pattern}."
+        self._logger.debug(msg)
+
+    def exists(self) -> bool:
+        return os.path.exists(self._filepath)
+
+    def items(self) -> List[Tuple[str, Any]]:
+        rows = self._connection.execute("SELECT oid, entity FROM object").fetchall()
+        return [(oid, self._serializer.loads(entity)) for oid, entity in rows]
+
+    def clear(self) -> None:
+        self._connection.execute("DELETE FROM object")
+        self._connection.execute("DELETE FROM object_index")
+
+    def index(self, oid: str, headers: Dict[str, str]) -> None:
+        self._connection.execute("DELETE FROM object_index WHERE oid = ?", (oid,))
+        self._connection.executemany(
+            "INSERT INTO object_index (field, value, oid) VALUES (?, ?, ?)",
+            [(field, value, oid) for field, value in headers.items()],
+        )
+
+    def find(self, criteria: Dict[str, str]) -> List[str]:
+        if not criteria:
+            return [row[0] for row in self._connection.execute("SELECT oid FROM object ORDER BY oid")]
+        sql = " INTERSECT ".join(["SELECT oid FROM object_index WHERE field = ? AND value = ?"] * len(criteria))
+        args = [arg for item in criteria.items() for arg in item]
+        return [row[0] for row in self._connection.execute(sql + " ORDER BY oid", args)]
+
+    def __contains__(self, oid: str) -> bool:
+        row = self._connection.execute("SELECT 1 FROM object WHERE oid = ?", (oid,)).fetchone()
+        return row is not None
+
+    def read(self, oid: str) -> Tuple[Any, Optional[int]]:
+        row = self._connection.execute("SELECT entity FROM object WHERE oid = ?", (oid,)).fetchone()
+        if row is None:
+            raise KeyError(oid)
+        return self._serializer.loads(row[0]), len(row[0])
+
+    def read_many(self, oids: List[str]) -> Dict[str, Tuple[Any, Optional[int]]]:
+        entities = {}
+        oids = list(oids)
+        for i in range(0, len(oids), self.__max_variables):
+            chunk = oids[i:i + self.__max_variables]
+            sql = f"SELECT oid, entity FROM object WHERE oid IN ({', '.join('?' * len(chunk))})"
+            for oid, entity in self._connection.execute(sql, chunk):
+                entities[oid] = (self._serializer.loads(entity), len(entity))
+        return {oid: entities[oid] for oid in oids if oid in entities}
+
+    def iterkeys(self, prefix: str = None, batch_size: int = 1000) -> Iterator[List[str]]:
+        """Pages through oids in key order, so no cursor stays open between batches."""
+        prefix = prefix or ""
+        rows = self._connection.execute(
+            "SELECT oid FROM object WHERE oid >= ? ORDER BY oid LIMIT ?", (prefix, batch_size)
+        ).fetchall()
+        while rows:
+            batch = [row[0] for row in rows if row[0].startswith(prefix)]
+            if batch:
+                yield batch
+            if len(batch) < len(rows) or len(rows) < batch_size:
+                return
+            rows = self._connection.execute(
+                "SELECT oid FROM object WHERE oid > ? ORDER BY oid LIMIT ?", (batch[-1], batch_size)
+            ).fetchall()
+
+    def get_headers(self, oids: List[str]) -> Dict[str, Dict[str, str]]:
+        headers = {oid: {} for oid in oids}
+        for i in range(0, len(oids), self.__max_variables):
+            chunk = oids[i:i + self.__max_variables]
+            sql = f"SELECT oid, field, value FROM object_index WHERE oid IN ({', '.join('?' * len(chunk))})"
+            for oid, field, value in self._connection.execute(sql, chunk):
+                headers[oid][field] = value
+        return headers
+
+    def __setitem__(self, oid: str, entity: Any) -> None:
+        data = self._serializer.dumps(entity)
+        self._connection.execute("INSERT OR REPLACE INTO object (oid, entity) VALUES (?, ?)", (oid, data))
+
+    def __delitem__(self, oid: str) -> None:
+        cursor = self._connection.execute("DELETE FROM object WHERE oid = ?", (oid,))
+        if cursor.rowcount == 0:
+            raise KeyError(oid)
+        self._connection.execute("DELETE FROM object_index WHERE oid = ?", (oid,))
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      BACKEND FACTORY                                             #
+# ------------------------------------------------------------------------------------------------ #
+class BackendFactory:
+    """Creates object database backends by name."""
+
+    __backend = {"shelve": ShelveBackend, "sqlite": SQLiteBackend}
+    _logger = logging.getLogger(
+        f"{__module__}.{__name__}",
+    )
+
+    @classmethod
+    def create(cls, backend: str, location: str, serializer: Serializer = None) -> Backend:
+        try:
+            backend_cls = cls.__backend[backend]
+        except KeyError:
+            msg = f"Object database backend {backend} is not supported."
+            cls._logger.error(msg)
+            raise ValueError(msg)
+        return backend_cls(location=location, serializer=serializer)
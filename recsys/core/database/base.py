@@ -17,26 +17,79 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 """Base Database and Connection Classes."""
+import threading
 from abc import abstractmethod
 from typing import Union
 import mysql.connector
 import pymysql
 
 from recsys.core.services.base import Service
+from .dialect import Dialect, MySQLDialect, PreparedStatement
+from .pool import ConnectionPool
 
 
 # ------------------------------------------------------------------------------------------------ #
 #                                        CONNECTION                                                #
 # ------------------------------------------------------------------------------------------------ #
 class Connection(Service):
-    """MySQL Database."""
-
-    def __init__(self, connector: pymysql.connect = None) -> None:
+    """MySQL Database.
+
+    Connection state is held per thread, so a connection shared by several threads gives each
+    thread its own underlying connection and transaction. With a pool_size, underlying
+    connections are checked out of a bounded ConnectionPool on open and returned on close,
+    instead of being connected and disconnected each time.
+
+    Args:
+        connector (pymysql.connect): Creates the underlying DB-API connection.
+        pool_size (int): Maximum number of pooled connections. None disables pooling.
+        max_idle (float): Seconds after which idle pooled connections are closed. Default = 300.
+        ping_interval (float): Idle seconds after which a pooled connection is health-checked
+            before reuse. Default = 30.
+        dialect (Dialect): Renders statements for the database engine. Defaults to MySQL.
+    """
+
+    def __init__(
+        self,
+        connector: pymysql.connect = None,
+        pool_size: int = None,
+        max_idle: float = 300,
+        ping_interval: float = 30,
+        dialect: Dialect = None,
+    ) -> None:
         super().__init__()
         self._connector = connector
-        self._is_open = False
-        self._in_transaction = False
-        self._connection = None
+        self._dialect = dialect or MySQLDialect()
+        self._statements = {}
+        self._local = threading.local()
+        self._pool = None
+        if pool_size:
+            self._pool = ConnectionPool(
+                factory=self._create, max_size=pool_size, max_idle=max_idle, ping_interval=ping_interval
+            )
+
+    @property
+    def _connection(self):
+        return getattr(self._local, "connection", None)
+
+    @_connection.setter
+    def _connection(self, connection) -> None:
+        self._local.connection = connection
+
+    @property
+    def _is_open(self) -> bool:
+        return getattr(self._local, "is_open", False)
+
+    @_is_open.setter
+    def _is_open(self, is_open: bool) -> None:
+        self._local.is_open = is_open
+
+    @property
+    def _in_transaction(self) -> bool:
+        return getattr(self._local, "in_transaction", False)
+
+    @_in_transaction.setter
+    def _in_transaction(self, in_transaction: bool) -> None:
+        self._local.in_transaction = in_transaction
 
     @property
     def is_open(self) -> bool:
@@ -48,6 +101,23 @@ class Connection(Service):
         """Returns the True if a transaction has been started."""
         return self._in_transaction
 
+    @property
+    def dialect(self) -> Dialect:
+        """Returns the SQL dialect of the database."""
+        return self._dialect
+
+    @property
+    def pool(self) -> ConnectionPool:
+        return self._pool
+
+    def prepare(self, command: type) -> PreparedStatement:
+        """Returns the prepared statement for a SQL command class, preparing it on first use."""
+        try:
+            return self._statements[command]
+        except KeyError:
+            statement = self._statements[command] = PreparedStatement(command=command, dialect=self._dialect)
+            return statement
+
     @property
     def cursor(self) -> pymysql.connections.Connection.cursor:
         """Returns a cursor from the connection."""
@@ -57,6 +127,15 @@ class Connection(Service):
             self._logger.error(err)
             raise mysql.connector.Error()
 
+    @property
+    def server_cursor(self) -> pymysql.cursors.SSCursor:
+        """Returns an unbuffered server-side cursor, which streams rows as they are fetched."""
+        try:
+            return self._connection.cursor(pymysql.cursors.SSCursor)
+        except mysql.connector.Error as err:  # pragma: no cover
+            self._logger.error(err)
+            raise mysql.connector.Error()
+
     def begin(self) -> None:
         """Start a transaction on the connection."""
         try:
@@ -67,14 +146,25 @@ class Connection(Service):
             self._logger.error(err)
             raise mysql.connector.Error()
 
-    @abstractmethod
     def open(self) -> None:
-        """Opens a database connection."""
+        """Opens a database connection, checking it out of the pool if pooling is enabled."""
+        if self._pool is not None:
+            self._connection = self._pool.acquire()
+        else:
+            self._connection = self._create()
+        self._is_open = True
+        self._logger.debug(f"{self.__class__.__name__} is connected.")
 
     def close(self) -> None:
-        """Closes the connection."""
+        """Closes the connection, or returns it to the pool if pooling is enabled."""
         try:
-            self._connection.close()
+            if self._pool is not None:
+                if self._in_transaction:
+                    self._connection.rollback()
+                self._pool.release()
+            else:
+                self._connection.close()
+            self._connection = None
             self._is_open = False
             self._in_transaction = False
             self._logger.debug(f"{self.__class__.__name__}  is closed.")
@@ -102,6 +192,10 @@ class Connection(Service):
             self._logger.error(err)
             raise mysql.connector.Error()
 
+    @abstractmethod
+    def _create(self):
+        """Creates an underlying DB-API connection."""
+
 
 # ------------------------------------------------------------------------------------------------ #
 #                                        DATABASE                                                  #
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /recsys/core/database/dialect.py                                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday January 15th 2023 09:14:26 am                                                #
+# Modified   : Sunday January 15th 2023 09:14:26 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""SQL Dialects for the Relational Database."""
+import re
+from abc import abstractmethod
+from operator import attrgetter
+from typing import Any, Callable, Dict, Tuple
+
+from recsys.core.services.base import Service
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          DIALECT                                                 #
+# ------------------------------------------------------------------------------------------------ #
+class Dialect(Service):
+    """Renders the MySQL flavoured DDL and DML in recsys.core.dal.sql for a database engine.
+
+    Rendered statements are cached by their source text, so a statement is translated once and
+    the driver sees an identical string on every call, which lets it reuse the prepared
+    statement.
+    """
+
+    name = None
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._rendered: Dict[str, str] = {}
+
+    def render(self, sql: str) -> str:
+        """Returns the statement in this dialect."""
+        try:
+            return self._rendered[sql]
+        except KeyError:
+            rendered = self._rendered[sql] = self._translate(sql)
+            return rendered
+
+    def first_insert_id(self, cursor: Any, rowcount: int) -> int:
+        """Returns the id of the first row inserted by a multi-row INSERT."""
+        return cursor.lastrowid
+
+    @abstractmethod
+    def _translate(self, sql: str) -> str:
+        """Translates a MySQL statement into this dialect."""
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       MYSQL DIALECT                                              #
+# ------------------------------------------------------------------------------------------------ #
+class MySQLDialect(Dialect):
+    """The native dialect of the DDL and DML. Statements are passed through unchanged."""
+
+    name = "mysql"
+
+    def _translate(self, sql: str) -> str:
+        return sql
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       SQLITE DIALECT                                             #
+# ------------------------------------------------------------------------------------------------ #
+class SQLiteDialect(Dialect):
+    """Translates the MySQL statements in recsys.core.dal.sql to SQLite.
+
+    Database level DDL and column type changes have no SQLite counterpart and become no-ops.
+    Upserts become 'ON CONFLICT DO UPDATE' and return the id of the inserted or updated row.
+    """
+
+    name = "sqlite"
+
+    __database_ddl = re.compile(r"^\s*(CREATE|DROP)\s+DATABASE\b", re.IGNORECASE)
+    __database_exists = re.compile(r"\bFROM\s+INFORMATION_SCHEMA\.SCHEMATA\b", re.IGNORECASE)
+    __table_exists = re.compile(
+        r"SELECT\s+COUNT\(TABLE_NAME\)\s+FROM\s+information_schema\.TABLES\s+WHERE\s+TABLE_NAME\s*=\s*('\w+')",
+        re.IGNORECASE,
+    )
+    __schema_table = re.compile(
+        r"information_schema\.TABLES\s+WHERE\s+TABLE_SCHEMA\s*=\s*DATABASE\(\)\s+AND\s+TABLE_NAME\s*=\s*('\w+')",
+        re.IGNORECASE,
+    )
+    __schema_index = re.compile(
+        r"information_schema\.STATISTICS\s+WHERE\s+TABLE_SCHEMA\s*=\s*DATABASE\(\)\s+AND\s+TABLE_NAME\s*=\s*('\w+')\s+AND\s+INDEX_NAME\s*=\s*('\w+')",
+        re.IGNORECASE,
+    )
+    __modify_column = re.compile(r"^\s*ALTER\s+TABLE\s+\w+\s+MODIFY\b", re.IGNORECASE)
+    __column_type = re.compile(r"\bFROM\s+information_schema\.COLUMNS\b", re.IGNORECASE)
+    __auto_increment = re.compile(r"\b(?:TINY|SMALL|MEDIUM|BIG)?INT\s+PRIMARY\s+KEY\s+AUTO_INCREMENT\b", re.IGNORECASE)
+    __upsert = re.compile(r"\s+ON\s+DUPLICATE\s+KEY\s+UPDATE\s+(.+?)\s*;?\s*$", re.IGNORECASE | re.DOTALL)
+    __values = re.compile(r"\bVALUES\((\w+)\)", re.IGNORECASE)
+    __last_insert_id = re.compile(r"^\s*id\s*=\s*LAST_INSERT_ID\(id\)\s*$", re.IGNORECASE)
+
+    def first_insert_id(self, cursor: Any, rowcount: int) -> int:
+        """SQLite reports the id of the last row of a multi-row INSERT."""
+        return cursor.lastrowid - rowcount + 1
+
+    def _translate(self, sql: str) -> str:
+        if self.__database_ddl.match(sql) or self.__database_exists.search(sql):
+            return "SELECT 1;"
+        if self.__modify_column.match(sql):
+            return "SELECT 1;"
+        if self.__column_type.search(sql):
+            return "SELECT 0;"
+        sql = self.__schema_table.sub(r"sqlite_master WHERE type = 'table' AND name = \1", sql)
+        sql = self.__schema_index.sub(r"sqlite_master WHERE type = 'index' AND tbl_name = \1 AND name = \2", sql)
+        sql = self.__table_exists.sub(r"SELECT COUNT(name) FROM sqlite_master WHERE type = 'table' AND name = \1", sql)
+        sql = self.__auto_increment.sub("INTEGER PRIMARY KEY AUTOINCREMENT", sql)
+        match = self.__upsert.search(sql)
+        if match is not None:
+            assignments = [a for a in match.group(1).split(",") if not self.__last_insert_id.match(a)]
+            assignments = self.__values.sub(r"excluded.\1", ",".join(assignments)).strip()
+            sql = f"{sql[:match.start()]} ON CONFLICT DO UPDATE SET {assignments} RETURNING id;"
+        return sql.replace("%s", "?")
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    PREPARED STATEMENT                                            #
+# ------------------------------------------------------------------------------------------------ #
+class PreparedStatement:
+    """A SQL command class rendered for a dialect, with its argument extraction compiled.
+
+    The names bound to the '%s' placeholders are read from the statement once: the column list
+    of an INSERT, or the 'column = %s', 'LIMIT %s' and 'OFFSET %s' terms of any other statement. bind then builds the
+    argument tuple from a DTO with a single attrgetter call, without instantiating the command.
+
+    Args:
+        command (type): A SQL command class from recsys.core.dal.sql.
+        dialect (Dialect): The dialect to render the statement for.
+    """
+
+    __insert = re.compile(r"^\s*INSERT\s+INTO\s+\w+\s*\(([^)]*)\)\s*VALUES", re.IGNORECASE)
+    __assignment = re.compile(r"(?:(\w+)\s*=\s*|\b(LIMIT|OFFSET)\s+)%s", re.IGNORECASE)
+
+    def __init__(self, command: type, dialect: Dialect) -> None:
+        self._command = command
+        self._sql = dialect.render(command.sql)
+        self._parameters = self._parse(command.sql)
+        self._getter = attrgetter(*self._parameters) if self._parameters else None
+
+    @property
+    def sql(self) -> str:
+        return self._sql
+
+    @property
+    def parameters(self) -> Tuple[str, ...]:
+        """Returns the names bound to the placeholders, in order."""
+        return self._parameters
+
+    @property
+    def bind(self) -> Callable[[Any], tuple]:
+        """Returns a function that extracts the statement's arguments from a DTO."""
+        if len(self._parameters) == 1:
+            getter = self._getter
+            return lambda dto: (getter(dto),)
+        return self._getter
+
+    def _parse(self, sql: str) -> Tuple[str, ...]:
+        match = self.__insert.match(sql)
+        if match is not None:
+            parameters = tuple(column.strip() for column in match.group(1).split(","))
+        else:
+            parameters = tuple(column or clause.lower() for column, clause in self.__assignment.findall(sql))
+        if len(parameters) != sql.count("%s"):
+            msg = f"Unable to bind the placeholders of {self._command.__name__} to names."
+            raise ValueError(msg)
+        return parameters
@@ -18,13 +18,247 @@
 # ================================================================================================ #
 """Object persistence module"""
 import os
+import uuid
+import shutil
+import functools
+import threading
 from abc import abstractmethod
-import shelve
-from typing import Union
-from glob import glob
+from typing import Callable, Union, Dict, Iterator, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+import pyarrow as pa
 
 from .base import Connection, AbstractDatabase, Service
+from .backend import Backend, BackendFactory, ShelveBackend
+from .serializer import Serializer
 from recsys.core.entity.base import Entity
+from recsys.core.entity.dataset import Dataset, DataFrame
+from recsys.core.services.io import IOService
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         WRITE LOCK                                               #
+# ------------------------------------------------------------------------------------------------ #
+class WriteLock:
+    """Serializes writes to an object store across the threads and processes that share it.
+
+    Threads of a process share a reentrant lock per store. Processes take an exclusive advisory
+    lock on a hidden file next to the store, on platforms that support it. Locks are recreated
+    in forked children, so a lock held by a parent thread at fork time never blocks the child.
+
+    Args:
+        location (str): The path of the object store, without a file extension.
+    """
+
+    class _State:
+        def __init__(self) -> None:
+            self.lock = threading.RLock()
+            self.depth = 0
+            self.file = None
+
+    _states: Dict[str, _State] = {}
+    _guard = threading.Lock()
+
+    def __init__(self, location: str) -> None:
+        directory, name = os.path.split(location)
+        self._filepath = os.path.join(directory, f".{name}.lock")
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    def __enter__(self) -> "WriteLock":
+        state = self._get_state()
+        state.lock.acquire()
+        if state.depth == 0 and fcntl is not None:
+            os.makedirs(os.path.dirname(self._filepath) or ".", exist_ok=True)
+            state.file = open(self._filepath, "a")
+            fcntl.flock(state.file, fcntl.LOCK_EX)
+        state.depth += 1
+        return self
+
+    def __exit__(self, *args) -> None:
+        state = self._get_state()
+        state.depth -= 1
+        if state.depth == 0 and state.file is not None:
+            fcntl.flock(state.file, fcntl.LOCK_UN)
+            state.file.close()
+            state.file = None
+        state.lock.release()
+
+    def _get_state(self) -> _State:
+        with WriteLock._guard:
+            return WriteLock._states.setdefault(self._filepath, WriteLock._State())
+
+    @classmethod
+    def _reset(cls) -> None:
+        """Discards the locks inherited by a forked child."""
+        cls._guard = threading.Lock()
+        cls._states = {}
+
+
+os.register_at_fork(after_in_child=WriteLock._reset)
+
+
+def exclusive(method: Callable) -> Callable:
+    """Runs a cursor method while holding the write lock of its object store."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        PAYLOAD STORE                                             #
+# ------------------------------------------------------------------------------------------------ #
+class PayloadStore(Service):
+    """Stores DataFrame payloads in Arrow files apart from the object database.
+
+    Payload files are keyed by the oid of the persisted entity and the oid of the DataFrame.
+    Entities in the object database keep only a reference to their payload files, so
+    metadata reads and updates never read or rewrite the payload itself. The payload files of
+    an entity are those in its directory, so they are found without reading the entity.
+
+    Payloads are written uncompressed as a single record batch, so they can be memory-mapped. With
+    memory_map=True, numeric columns are loaded as read-only views of the page cache, shared
+    by every reader of the file, instead of being copied onto the heap. Payloads Arrow can't
+    represent, such as mixed-type object columns, are pickled instead.
+
+    Each write goes to a new file, so files in use by readers, or by the committed entity if
+    the write is not committed, are never overwritten.
+
+    Args:
+        location (str): The path of the object database. Payload files are stored in the
+            'payload' directory next to it.
+        memory_map (bool): Whether payloads are loaded as memory-mapped, read-only columns.
+            Default = False.
+    """
+
+    __format = "arrow"
+
+    def __init__(self, location: str, memory_map: bool = False) -> None:
+        super().__init__()
+        self._directory = os.path.join(os.path.dirname(location), "payload", os.path.basename(location))
+        self._memory_map = bool(memory_map)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def memory_map(self) -> bool:
+        return self._memory_map
+
+    def bind(self, entity: Entity) -> None:
+        """Configures how the DataFrames of an entity read from storage load their payloads."""
+        for dataframe in self._get_dataframes(entity):
+            dataframe.memory_map = self._memory_map
+
+    def externalize(self, entity: Entity) -> None:
+        """Writes the payloads held in memory to payload files and sets the references on the
+        DataFrames. Payloads not loaded can't have changed and keep their files."""
+        for dataframe in self._get_dataframes(entity):
+            if dataframe.is_loaded:
+                dataframe.payload_uri = self._write(entity.oid, dataframe)
+
+    def _write(self, oid: str, dataframe: DataFrame) -> str:
+        """Writes a payload to a new file and returns its uri."""
+        filepath = os.path.join(self._directory, oid, f"{dataframe.oid}.{uuid.uuid4().hex}")
+        uri = f"{filepath}.{self.__format}"
+        try:
+            IOService.write(filepath=uri, data=dataframe.data, chunksize=max(len(dataframe.data), 1))
+        except pa.ArrowException as e:
+            if os.path.exists(uri):
+                os.remove(uri)
+            uri = f"{filepath}.pkl"
+            msg = f"Unable to store payload for {dataframe.oid} in {self.__format} format. Pickled instead.\n{e}"
+            self._logger.warning(msg)
+            IOService.write(filepath=uri, data=dataframe.data)
+        msg = f"Stored payload for {dataframe.oid} at {uri}."
+        self._logger.debug(msg)
+        return uri
+
+    def remove(self, oid: str, keep: Entity = None) -> None:
+        """Removes the payload files stored for an entity.
+
+        Args:
+            oid (str): The oid of the entity whose payload files are to be removed.
+            keep (Entity): Optional. Payload files referenced by this entity are retained.
+        """
+        directory = os.path.join(self._directory, oid)
+        if not os.path.isdir(directory):
+            return
+        keep = {dataframe.payload_uri for dataframe in self._get_dataframes(keep)}
+        for filename in os.listdir(directory):
+            uri = os.path.join(directory, filename)
+            if uri not in keep:
+                os.remove(uri)
+                msg = f"Removed payload at {uri}."
+                self._logger.debug(msg)
+
+    def drop(self) -> None:
+        """Removes all payload files."""
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def _get_dataframes(self, entity: Entity) -> List[DataFrame]:
+        if isinstance(entity, Dataset):
+            return list(entity.dataframes.values())
+        elif isinstance(entity, DataFrame):
+            return [entity]
+        else:
+            return []
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        OBJECT INDEX                                              #
+# ------------------------------------------------------------------------------------------------ #
+class ObjectIndex:
+    """Defines the secondary index of the object database.
+
+    Entities are indexed by class name ('entity'), name, mode, stage, parent oid, task id and
+    datasource id. Attributes an entity doesn't have, or that are None, are not indexed. Values
+    are indexed as strings; entity values, such as parents, are indexed by oid.
+    """
+
+    fields = ("entity", "name", "mode", "stage", "parent", "task_id", "datasource_id")
+
+    @classmethod
+    def headers(cls, entity: Entity) -> Dict[str, str]:
+        """Returns the indexed field/value pairs of an entity."""
+        headers = {"entity": entity.__class__.__name__}
+        for field in cls.fields[1:]:
+            value = getattr(entity, field, None)
+            if value is not None:
+                headers[field] = cls._format(value)
+        return headers
+
+    @classmethod
+    def criteria(cls, criteria: dict) -> Dict[str, str]:
+        """Validates criteria and formats their values as index values."""
+        unsupported = set(criteria) - set(cls.fields)
+        if unsupported:
+            msg = f"Fields {sorted(unsupported)} are not indexed. Indexed fields are {list(cls.fields)}."
+            raise ValueError(msg)
+        return {field: cls._format(value) for field, value in criteria.items()}
+
+    @classmethod
+    def matches(cls, entity: Entity, criteria: Dict[str, str]) -> bool:
+        """Returns True if the entity matches formatted criteria."""
+        headers = cls.headers(entity)
+        return all(headers.get(field) == value for field, value in criteria.items())
+
+    @classmethod
+    def _format(cls, value) -> str:
+        if isinstance(value, type):
+            return value.__name__
+        if isinstance(value, Entity):
+            return value.oid
+        return str(value)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -34,70 +268,197 @@ class Cursor(Service):
     """Abstract base class for object database cursors.
 
     Args:
-        location (str): The path of the shelve database file.
+        location (str): The path of the object store, without a file extension.
+        persistent (bool): If True, the store is opened once and kept open until the
+            cursor is closed. Writes are committed after each call and flushed to disk on
+            sync or close. If False, the store is opened and closed on every call. Default = False.
+        backend (str): The key-value store backend, 'sqlite' or 'shelve'. A legacy shelve
+            store at the location is migrated, or indexed if the backend is 'shelve', when the
+            store is first opened. Default = 'sqlite'.
+        serializer (Serializer): Converts entities to and from stored bytes. Optional.
     """
-    def __init__(self, location) -> None:
+    def __init__(self, location, persistent: bool = False, backend: str = "sqlite", serializer: Serializer = None) -> None:
         super().__init__()
         self._location = location
-        self._cursor = None
-        self.open()
+        self._persistent = persistent
+        self._cursor = BackendFactory.create(backend=backend, location=location, serializer=serializer)
+        self._lock = WriteLock(location)
+        self._migrated = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._cursor.is_open
+
+    @property
+    def persistent(self) -> bool:
+        return self._persistent
+
+    @property
+    def backend(self) -> Backend:
+        return self._cursor
 
     def open(self) -> None:
-        os.makedirs(os.path.dirname(self._location), exist_ok=True)
-        self._cursor = shelve.open(self._location)
-        msg = f"Object storage opened at {self._location}"
-        self._logger.debug(msg)
+        """Opens the object store if it isn't already open."""
+        if not self._cursor.is_open:
+            if not self._migrated:
+                self._migrate()
+            self._cursor.open()
+            msg = f"Object storage opened at {self._location}"
+            self._logger.debug(msg)
 
     def close(self) -> None:
-        self._cursor.close()
-        msg = f"Object storage at {self._location} is closed."
-        self._logger.debug(msg)
-
+        if self._cursor.is_open:
+            self._cursor.close()
+            msg = f"Object storage at {self._location} is closed."
+            self._logger.debug(msg)
+
+    def sync(self) -> None:
+        """Flushes pending writes to disk without closing the object store."""
+        if self._cursor.is_open:
+            self._cursor.sync()
+            msg = f"Object storage at {self._location} is synchronized."
+            self._logger.debug(msg)
+
+    @exclusive
     def drop(self) -> None:
-        """Delete the cursor, i.e. the shelve database."""
-        pattern = self._location + ".*"
-        self._remove(pattern)
-        self._is_open = False
-        msg = f"Pattern: {pattern}."
-        self._logger.debug(msg)
+        """Delete the cursor, i.e. the object store."""
+        self._cursor.drop()
         msg = f"Dropped object store at {self._location}."
         self._logger.info(msg)
 
+    def database_exists(self) -> bool:
+        """Returns True if the object store exists on disk."""
+        return self._cursor.exists()
+
     def select(self, oid: str) -> Union[Entity, None]:
         """Select an existing entity by oid from object storage"""
-        self.open()
+        return self.read(oid)[0]
+
+    def read(self, oid: str) -> Tuple[Union[Entity, list], int]:
+        """Selects an entity by oid and returns it with the size of its stored value in bytes,
+        or ([], 0) if it doesn't exist."""
+        self._open_session()
         try:
-            result = self._cursor[oid]
+            result = self._get(oid)
         except KeyError:
-            result = []
-        self.close()
+            result = ([], 0)
+        self._close_session()
         return result
 
+    @exclusive
     def insert(self, entity: Entity) -> None:
         """Inserts an entity into the underlying object data store."""
-        self.open()
-        if entity.oid not in self._cursor.keys():
-            self._cursor[entity.oid] = entity
+        self._open_session()
+        if entity.oid not in self._cursor:
+            self._put(entity)
             msg = f"Inserted entity oid: {entity.oid}."
             self._logger.info(msg)
         else:
             msg = f"Unable to insert entity oid: {entity.oid}. Entity already exists."
             self._logger.error(msg)
             raise FileExistsError(msg)
-        self.close()
+        self._close_session()
 
+    @exclusive
     def update(self, entity: Entity) -> None:
         """Update an existing entity in object storage or cache."""
-        self.open()
-        if entity.oid in self._cursor.keys():
-            self._cursor[entity.oid] = entity
+        self._open_session()
+        if entity.oid in self._cursor:
+            self._put(entity)
             msg = f"Updated entity oid: {entity.oid}."
             self._logger.info(msg)
         else:
             msg = f"Unable to update entity oid: {entity.oid}. Entity does not exist."
             self._logger.error(msg)
             raise FileNotFoundError(msg)
-        self.close()
+        self._close_session()
+
+    def select_many(self, oids: List[str]) -> Dict[str, Entity]:
+        """Selects the entities that exist for the oids in a single session, keyed by oid."""
+        return {oid: entity for oid, (entity, _) in self.read_many(oids).items()}
+
+    def read_many(self, oids: List[str]) -> Dict[str, Tuple[Entity, int]]:
+        """Selects the entities that exist for the oids in a single session, and returns them with
+        the sizes of their stored values in bytes, keyed by oid."""
+        self._open_session()
+        entities = self._cursor.read_many(oids)
+        for entity, _ in entities.values():
+            self._bind(entity)
+        self._close_session()
+        return entities
+
+    @exclusive
+    def insert_many(self, entities: List[Entity]) -> None:
+        """Inserts entities in a single session and commit. Nothing is written if any exists."""
+        self._open_session()
+        for entity in entities:
+            if entity.oid in self._cursor:
+                self._close_session()
+                msg = f"Unable to insert entity oid: {entity.oid}. Entity already exists."
+                self._logger.error(msg)
+                raise FileExistsError(msg)
+        for entity in entities:
+            self._put(entity)
+        msg = f"Inserted {len(entities)} entities."
+        self._logger.info(msg)
+        self._close_session()
+
+    @exclusive
+    def update_many(self, entities: List[Entity]) -> None:
+        """Updates entities in a single session and commit. Nothing is written if any is missing."""
+        self._open_session()
+        for entity in entities:
+            if entity.oid not in self._cursor:
+                self._close_session()
+                msg = f"Unable to update entity oid: {entity.oid}. Entity does not exist."
+                self._logger.error(msg)
+                raise FileNotFoundError(msg)
+        for entity in entities:
+            self._put(entity)
+        msg = f"Updated {len(entities)} entities."
+        self._logger.info(msg)
+        self._close_session()
+
+    def find(self, criteria: Dict[str, str]) -> List[str]:
+        """Returns the oids of entities whose indexed attributes match the formatted criteria."""
+        self._open_session()
+        oids = self._cursor.find(criteria)
+        self._close_session()
+        return oids
+
+    def scan(self, prefix: str = None, batch_size: int = 100, keys_only: bool = False, headers: bool = False) -> Iterator:
+        """Iterates over stored entities, reading batch_size entities at a time.
+
+        Yields entities, oids if keys_only, or (oid, index headers) pairs if headers. The store
+        stays open until the iteration is complete or the generator is closed.
+        """
+        self._open_session()
+        try:
+            for oids in self._cursor.iterkeys(prefix=prefix, batch_size=batch_size):
+                if keys_only:
+                    yield from oids
+                elif headers:
+                    yield from self._cursor.get_headers(oids).items()
+                else:
+                    for entity in self._cursor.get_many(oids).values():
+                        self._bind(entity)
+                        yield entity
+        finally:
+            self._close_session()
+
+    @exclusive
+    def reindex(self) -> None:
+        """Rebuilds the secondary index from the stored entities."""
+        self._open_session()
+        count = 0
+        for oids in self._cursor.iterkeys():
+            for oid, entity in self._cursor.get_many(oids).items():
+                self._cursor.index(oid, ObjectIndex.headers(entity))
+                count += 1
+        self._cursor.set_indexed()
+        msg = f"Reindexed {count} entities in object storage at {self._location}."
+        self._logger.info(msg)
+        self._close_session()
 
     @abstractmethod
     def delete(self, oid: str) -> None:
@@ -105,84 +466,154 @@ class Cursor(Service):
 
     def exists(self, oid: str) -> None:
         """Checks existence of an object in the storage"""
-        self.open()
-        exists = oid in self._cursor.keys()
+        self._open_session()
+        exists = oid in self._cursor
         answer = "exists" if exists else "does not exist."
         msg = f"Checked existence of {oid}. Entity {answer}."
         self._logger.debug(msg)
-        self.close()
+        self._close_session()
         return exists
 
-    def _remove(self, pattern) -> None:
-        """Removes files that match the glob pattern."""
-        file_list = glob(pattern, recursive=True)
-        for filepath in file_list:
+    def _get(self, oid: str) -> Tuple[Entity, int]:
+        """Reads an entity and the size of its stored value from the object store."""
+        entity, nbytes = self._cursor.read(oid)
+        self._bind(entity)
+        return entity, nbytes
+
+    def _bind(self, entity: Entity) -> None:
+        """Prepares an entity read from the object store for use."""
+
+    def _put(self, entity: Entity) -> None:
+        """Writes an entity and its index entries to the object store."""
+        self._cursor[entity.oid] = entity
+        self._cursor.index(entity.oid, ObjectIndex.headers(entity))
+
+    @exclusive
+    def _migrate(self) -> None:
+        """Brings a store written by an earlier version up to date, once per cursor."""
+        if isinstance(self._cursor, ShelveBackend):
+            self._index_legacy()
+        else:
+            self._copy_legacy()
+        self._migrated = True
+
+    def _index_legacy(self) -> None:
+        """Indexes a shelve store holding entities written before the secondary index existed."""
+        self._cursor.open()
+        if not self._cursor.is_indexed():
+            count = 0
+            for oids in self._cursor.iterkeys():
+                for oid, entity in self._cursor.get_many(oids).items():
+                    if isinstance(entity, Entity):
+                        self._cursor.index(oid, ObjectIndex.headers(entity))
+                        count += 1
+            self._cursor.set_indexed()
+            self._cursor.sync()
+            msg = f"Indexed {count} entities in the shelve store at {self._location}."
+            self._logger.info(msg)
+
+    def _copy_legacy(self) -> None:
+        """Copies the entities of a legacy shelve store at the location into the store, unless
+        the store already exists. A failed copy leaves no store behind, so it is retried."""
+        legacy = ShelveBackend(self._location, serializer=self._cursor.serializer)
+        if legacy.exists() and not self._cursor.exists():
+            legacy.open()
+            self._cursor.open()
             try:
-                os.remove(filepath)
-                msg = f"Removed {filepath}."
-                self._logger.debug(msg)
-            except OSError:  # pragma: no cover
-                msg = f"Encountered an error while deleting file at {filepath}"
-                self._logger.error(msg)
-                raise OSError(msg)
+                count = 0
+                for oids in legacy.iterkeys():
+                    for entity in legacy.get_many(oids).values():
+                        if isinstance(entity, Entity):
+                            self._put(entity)
+                            count += 1
+                self._cursor.sync()
+            except Exception:
+                self._cursor.drop()
+                raise
+            finally:
+                legacy.close()
+            msg = f"Migrated {count} entities from the shelve store at {self._location}."
+            self._logger.info(msg)
+
+    def _open_session(self) -> None:
+        """Opens the object store if not already open."""
+        self.open()
+
+    def _close_session(self) -> None:
+        """Closes the object store, or commits the writes if the cursor holds a persistent handle."""
+        if self._persistent:
+            self._cursor.commit()
+        else:
+            self.close()
 
 
 # ------------------------------------------------------------------------------------------------ #
 #                                          CACHE CURSOR                                            #
 # ------------------------------------------------------------------------------------------------ #
-class CacheCursor(Cursor):
-    """Class for object cache.
-
-    Args:
-        location (str): The path to the database file.
+class CacheCursor(Service):
+    """In-memory write-back cache for object database transactions.
 
+    Writes made during a transaction are staged in process memory. Deletes are recorded as
+    tombstones, i.e. None entries, and every written oid is tracked as dirty. On commit, only
+    the dirty entries are written to storage; on rollback, the cache is simply discarded.
     """
 
-    def __init__(self, location) -> None:
-        super().__init__(location=location)
-        self._location = self._set_cache_location()
+    def __init__(self) -> None:
+        super().__init__()
+        self._entries = {}
+        self._dirty = set()
 
     @property
-    def cache(self) -> dict:
-        self.open()
-        cache = {}
-        for oid, entity in self._cursor.items():
-            cache[oid] = entity
-        return cache
+    def changes(self) -> dict:
+        """Returns the dirty entries keyed by oid. Deleted entities map to None."""
+        return {oid: self._entries[oid] for oid in self._dirty}
 
     def reset(self) -> None:
-        self.open()
-        for oid in self._cursor.keys():
-            del self._cursor[oid]
-        self.close()
+        self._entries = {}
+        self._dirty = set()
         msg = "Cache is reset."
         self._logger.debug(msg)
 
-    def delete(self, oid: str) -> None:
-        """Deletes a key/value pair from object storage"""
-        self.open()
+    def contains(self, oid: str) -> bool:
+        """Returns True if the cache holds an entity or a tombstone for the oid."""
+        return oid in self._entries
 
-        self._cursor[oid] = None
-        msg = f"Marked entity oid = {oid} for deletion."
+    def select(self, oid: str) -> Union[Entity, list]:
+        """Returns the cached entity, or an empty list if it isn't cached or has been deleted."""
+        entity = self._entries.get(oid)
+        return [] if entity is None else entity
+
+    def insert(self, entity: Entity) -> None:
+        if self.exists(entity.oid):
+            msg = f"Unable to insert entity oid: {entity.oid}. Entity already exists."
+            self._logger.error(msg)
+            raise FileExistsError(msg)
+        self._write(entity.oid, entity)
+        msg = f"Inserted entity oid: {entity.oid}."
         self._logger.info(msg)
 
-        self.close()
+    def update(self, entity: Entity) -> None:
+        self._write(entity.oid, entity)
+        msg = f"Updated entity oid: {entity.oid}."
+        self._logger.info(msg)
 
-    def exists(self, oid: str) -> None:
-        """Checks existence of an object in the storage"""
-        self.open()
-        if oid in self._cursor.keys():
-            exists = not self._cursor[oid] == []
-        else:
-            exists = False
+    def delete(self, oid: str) -> None:
+        """Marks an entity for deletion."""
+        self._write(oid, None)
+        msg = f"Marked entity oid = {oid} for deletion."
+        self._logger.info(msg)
+
+    def exists(self, oid: str) -> bool:
+        """Returns True if the cache holds the entity, i.e. it isn't missing or deleted."""
+        exists = self._entries.get(oid) is not None
         answer = "exists" if exists else "does not exist."
         msg = f"Checked existence of {oid}. Entity {answer}."
         self._logger.debug(msg)
-        self.close()
         return exists
 
-    def _set_cache_location(self) -> str:
-        return os.path.join(os.path.dirname(self._location), "cache", os.path.basename(self._location))
+    def _write(self, oid: str, entity: Union[Entity, None]) -> None:
+        self._entries[oid] = entity
+        self._dirty.add(oid)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -193,32 +624,48 @@ class StorageCursor(Cursor):
 
     Args:
         location (str): The path to the database file.
+        persistent (bool): Keeps the store open between calls. Default = False.
+        backend (str): The key-value store backend. Default = 'sqlite'.
+        serializer (Serializer): Converts entities to and from stored bytes. Optional.
+        memory_map (bool): Loads stored DataFrame payloads as memory-mapped, read-only columns.
+            Default = False.
 
     """
 
-    def __init__(self, location) -> None:
-        super().__init__(location=location)
+    def __init__(
+        self, location, persistent: bool = False, backend: str = "sqlite", serializer: Serializer = None, memory_map: bool = False
+    ) -> None:
+        super().__init__(location=location, persistent=persistent, backend=backend, serializer=serializer)
+        self._payloads = PayloadStore(location, memory_map=memory_map)
+        self._session = threading.local()
 
+    @property
+    def payloads(self) -> PayloadStore:
+        return self._payloads
+
+    @exclusive
     def save(self, cache_cursor: CacheCursor) -> None:
-        """Commits cache to object storage."""
-        self.open()
-        cache = cache_cursor.cache
-        for oid, entity in cache.items():
+        """Writes the dirty entries of the cache to object storage in a single commit."""
+        self._open_session()
+        for oid, entity in cache_cursor.changes.items():
             if entity is not None:
-                self._cursor[oid] = entity
+                self._put(entity)
                 msg = f"Saved entity {entity.oid} to object storage."
                 self._logger.debug(msg)
-            else:
+            elif oid in self._cursor:
                 del self._cursor[oid]
+                self._stale()[oid] = None
+        self.sync()
         cache_cursor.reset()
-        cache_cursor.close()
-        self.close()
+        self._close_session()
 
+    @exclusive
     def delete(self, oid) -> None:
         """Deletes a key/value pair from object storage"""
-        self.open()
+        self._open_session()
         try:
             del self._cursor[oid]
+            self._stale()[oid] = None
             msg = f"Deleted object with oid = {oid} from object storage."
             self._logger.info(msg)
 
@@ -226,7 +673,41 @@ class StorageCursor(Cursor):
             msg = f"Unable to delete entity oid: {oid}. Entity does not exist."
             self._logger.error(msg)
             raise FileNotFoundError(msg)
-        self.close()
+        self._close_session()
+
+    @exclusive
+    def drop(self) -> None:
+        """Deletes the object store and its payload files."""
+        super().drop()
+        self._payloads.drop()
+
+    def _bind(self, entity: Entity) -> None:
+        self._payloads.bind(entity)
+
+    def _put(self, entity: Entity) -> None:
+        """Stores payloads in payload files, then writes the entity with payload references only.
+        Payload files the entity no longer references are removed once the write is committed."""
+        self._payloads.externalize(entity)
+        super()._put(entity)
+        self._stale()[entity.oid] = entity
+
+    def _stale(self) -> Dict[str, Union[Entity, None]]:
+        """Returns the entities written, or None for those deleted, in this thread's session, keyed by oid."""
+        if not hasattr(self._session, "stale"):
+            self._session.stale = {}
+        return self._session.stale
+
+    def _open_session(self) -> None:
+        self._session.stale = {}
+        super()._open_session()
+
+    def _close_session(self) -> None:
+        """Commits the writes, then removes the payload files that the entities written, or
+        deleted, in the session no longer reference."""
+        super()._close_session()
+        stale, self._session.stale = self._stale(), {}
+        for oid, entity in stale.items():
+            self._payloads.remove(oid, keep=entity)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -238,14 +719,35 @@ class ObjectDBConnection(Connection):
     Args:
         location (str): The path and filename for the data store. The base of the path is
             the database name by convention.
+        autocommit (bool): Whether changes outside of a transaction are committed immediately.
+        persistent (bool): If True, the storage cursor keeps its handle open for
+            the life of the connection session, and flush to disk only on commit or close.
+            Otherwise, every cursor call opens and closes the underlying file. Default = False.
+        memory_map (bool): If True, DataFrame payloads are loaded as read-only, memory-mapped
+            columns shared through the page cache. Default = False.
+        backend (str): The key-value store behind the cursors. 'sqlite' supports concurrent
+            readers and commits the cache to storage atomically; 'shelve' is the legacy
+            dbm store, which is migrated to 'sqlite' when first opened. Default = 'sqlite'.
+        serializer (Serializer): Converts entities to and from stored bytes, optionally with
+            compression. Defaults to pickle protocol 5 without compression.
     """
 
-    __cache_filename = "cache.odb"
-
-    def __init__(self, location: str, autocommit: bool = True) -> None:
+    def __init__(
+        self,
+        location: str,
+        autocommit: bool = True,
+        persistent: bool = False,
+        memory_map: bool = False,
+        backend: str = "sqlite",
+        serializer: Serializer = None,
+    ) -> None:
         super().__init__()
         self._location = location
         self._autocommit = autocommit
+        self._persistent = bool(persistent)
+        self._backend = backend
+        self._serializer = serializer
+        self._memory_map = bool(memory_map)
         self._cache = None
         self._storage = None
         self._build_cursors()
@@ -259,13 +761,25 @@ class ObjectDBConnection(Connection):
         return self._storage
 
     @property
-    def cache(self) -> Cursor:
+    def cache(self) -> CacheCursor:
         return self._cache
 
     @property
     def autocommit(self) -> bool:
         return self._autocommit
 
+    @property
+    def persistent(self) -> bool:
+        return self._persistent
+
+    @property
+    def memory_map(self) -> bool:
+        return self._memory_map
+
+    @property
+    def backend(self) -> str:
+        return self._backend
+
     def begin(self) -> None:
         """Starts a transaction."""
         if not self._is_open:
@@ -274,14 +788,14 @@ class ObjectDBConnection(Connection):
     def open(self) -> None:
         """Opens a database connection."""
         self._storage.open()
-        self._cache.open()
+        self._is_open = True
         self._logger.debug("connection is open.")
 
     def close(self) -> None:
         """Closes the current connection."""
         self._cache.reset()
-        self._cache.close()
         self._storage.close()
+        self._is_open = False
         self._logger.debug("is closed.")
 
     def commit(self) -> None:
@@ -294,12 +808,22 @@ class ObjectDBConnection(Connection):
         self._cache.reset()
 
     def drop(self) -> None:
-        self._cache.drop()
+        self._cache.reset()
         self._storage.drop()
 
     def _build_cursors(self) -> None:
-        self._cache = CacheCursor(self._location)
-        self._storage = StorageCursor(self._location)
+        self._cache = CacheCursor()
+        self._storage = self._create()
+
+    def _create(self) -> StorageCursor:
+        """Creates the storage cursor, which stands in for a DB-API connection."""
+        return StorageCursor(
+            self._location,
+            persistent=self._persistent,
+            backend=self._backend,
+            serializer=self._serializer,
+            memory_map=self._memory_map,
+        )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -348,18 +872,35 @@ class ObjectDB(AbstractDatabase):
         self._in_transaction = False
 
     def select(self, oid: str) -> Entity:
-        if self._in_transaction:
-            result = self._connection.cache.select(oid)
-            if result == []:
-                result = self._connection.storage.select(oid)
+        return self.read(oid)[0]
+
+    def read(self, oid: str) -> Tuple[Entity, Union[int, None]]:
+        """Returns the entity and the size of its stored value in bytes. Entities staged in the
+        current transaction have not been stored, so their size is None."""
+        if self._in_transaction and self._connection.cache.contains(oid):
+            result = (self._connection.cache.select(oid), None)
         else:
-            result = self._connection.storage.select(oid)
+            result = self._connection.storage.read(oid)
         return result
 
+    def select_many(self, oids: List[str]) -> Dict[str, Entity]:
+        """Returns the entities that exist for the oids, keyed by oid, in a single storage session."""
+        return {oid: entity for oid, (entity, _) in self.read_many(oids).items()}
+
+    def read_many(self, oids: List[str]) -> Dict[str, Tuple[Entity, Union[int, None]]]:
+        """Returns (entity, stored size) pairs for the oids that exist, keyed by oid, in a single
+        storage session. Entities staged in the current transaction have a size of None."""
+        if self._in_transaction:
+            cache = self._connection.cache
+            entities = self._connection.storage.read_many([oid for oid in oids if not cache.contains(oid)])
+            entities.update({oid: (cache.select(oid), None) for oid in oids if cache.exists(oid)})
+            return {oid: entities[oid] for oid in oids if oid in entities}
+        return self._connection.storage.read_many(oids)
+
     def insert(self, entity: Entity) -> int:
         """Inserts an object into object storage."""
         if self._in_transaction:
-            if not self._connection.storage.exists(entity.oid) and not self._connection.cache.exists(entity.oid):
+            if not self.exists(entity.oid):
                 self._connection.cache.insert(entity)
             else:
                 msg = f"Unable to insert entity oid = {entity.oid}. Entity already exists."
@@ -368,42 +909,131 @@ class ObjectDB(AbstractDatabase):
         else:
             self._connection.storage.insert(entity)
 
+    def insert_many(self, entities: List[Entity]) -> None:
+        """Inserts objects into object storage in a single session and commit."""
+        if self._in_transaction:
+            for entity in entities:
+                if self.exists(entity.oid):
+                    msg = f"Unable to insert entity oid = {entity.oid}. Entity already exists."
+                    self._logger.error(msg)
+                    raise FileExistsError(msg)
+            for entity in entities:
+                self._connection.cache.insert(entity)
+        else:
+            self._connection.storage.insert_many(entities)
+
     def update(self, entity) -> None:
         """Performs an update on existing data in the database."""
         if self._in_transaction:
-            if not self._connection.cache.exists(entity.oid):
-                self._cache(entity.oid)
-            self._connection.cache.update(entity)
+            if self.exists(entity.oid):
+                self._connection.cache.update(entity)
+            else:
+                msg = f"Unable to update entity oid: {entity.oid}. Entity does not exist."
+                self._logger.error(msg)
+                raise FileNotFoundError(msg)
         else:
             self._connection.storage.update(entity)
 
+    def update_many(self, entities: List[Entity]) -> None:
+        """Updates existing objects in a single session and commit."""
+        if self._in_transaction:
+            for entity in entities:
+                if not self.exists(entity.oid):
+                    msg = f"Unable to update entity oid: {entity.oid}. Entity does not exist."
+                    self._logger.error(msg)
+                    raise FileNotFoundError(msg)
+            for entity in entities:
+                self._connection.cache.update(entity)
+        else:
+            self._connection.storage.update_many(entities)
+
     def delete(self, oid: str) -> None:
         """Deletes existing data."""
         if self._in_transaction:
-            if not self._connection.cache.exists(oid):
-                self._cache(oid)
-            self._connection.cache.delete(oid)
+            if self.exists(oid):
+                self._connection.cache.delete(oid)
+            else:
+                msg = f"Unable to delete entity oid: {oid}. Entity does not exist."
+                self._logger.error(msg)
+                raise FileNotFoundError(msg)
         else:
             self._connection.storage.delete(oid)
 
+    def find(self, **criteria) -> List[str]:
+        """Returns the oids of entities whose indexed attributes match all criteria.
+
+        Criteria are keyword arguments on the indexed fields: entity (class or class name),
+        name, mode, stage, parent (entity or oid), task_id and datasource_id. In a transaction,
+        uncommitted inserts, updates and deletes are reflected.
+        """
+        try:
+            criteria = ObjectIndex.criteria(criteria)
+        except ValueError as e:
+            self._logger.error(e)
+            raise
+        oids = self._connection.storage.find(criteria)
+        if self._in_transaction:
+            cache = self._connection.cache
+            oids = [oid for oid in oids if not cache.contains(oid)]
+            oids.extend(
+                oid for oid, entity in cache.changes.items() if entity is not None and ObjectIndex.matches(entity, criteria)
+            )
+            oids.sort()
+        return oids
+
+    def scan(self, prefix: str = None, batch_size: int = 100, keys_only: bool = False, headers: bool = False) -> Iterator:
+        """Lazily iterates over the object database in constant memory.
+
+        Args:
+            prefix (str): Optional oid prefix, e.g. 'dataset_' for all datasets.
+            batch_size (int): Number of entities read from storage at a time. Default = 100.
+            keys_only (bool): Yield oids only, without reading the entities. Default = False.
+            headers (bool): Yield (oid, headers) pairs, where headers are the indexed
+                attributes, without reading the entities. Default = False.
+
+        In a transaction, uncommitted changes are reflected: staged entities are yielded after
+        the stored ones and deleted entities are skipped.
+        """
+        items = self._connection.storage.scan(prefix=prefix, batch_size=batch_size, keys_only=keys_only, headers=headers)
+        if not self._in_transaction:
+            yield from items
+            return
+
+        cache = self._connection.cache
+        for item in items:
+            if keys_only:
+                oid = item
+            elif headers:
+                oid = item[0]
+            else:
+                oid = item.oid
+            if not cache.contains(oid):
+                yield item
+
+        for oid, entity in cache.changes.items():
+            if entity is None or not oid.startswith(prefix or ""):
+                continue
+            if keys_only:
+                yield oid
+            elif headers:
+                yield oid, ObjectIndex.headers(entity)
+            else:
+                yield entity
+
+    def reindex(self) -> None:
+        """Rebuilds the secondary index, e.g. for object stores created before it existed."""
+        self._connection.storage.reindex()
+
     def drop(self) -> None:
         """Drop database."""
         self._connection.drop()
 
     def exists(self, oid: str) -> bool:
         """Returns True if the data specified by the parameters exists. Returns False otherwise."""
-        if self._in_transaction:
+        if self._in_transaction and self._connection.cache.contains(oid):
             return self._connection.cache.exists(oid)
         else:
             return self._connection.storage.exists(oid)
 
     def database_exists(self) -> bool:
-        pattern = self._connection.location + ".*"
-        return len(glob(pattern)) > 0
-
-    def _cache(self, oid: str) -> None:
-        """Copies an entity from storage to cache"""
-        entity = self._connection.storage.select(oid)
-        self._connection.cache.insert(entity)
-        msg = f"Copied entity {oid} from storage to cache."
-        self._logger.debug(msg)
+        return self._connection.storage.database_exists()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /recsys/core/database/pool.py                                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday January 14th 2023 10:05:37 am                                              #
+# Modified   : Saturday January 14th 2023 10:05:37 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Connection Pool Module."""
+import threading
+from time import monotonic
+from typing import Any, Callable, Dict, List
+
+from recsys.core.services.base import Service
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     CONNECTION POOL                                              #
+# ------------------------------------------------------------------------------------------------ #
+class ConnectionPool(Service):
+    """Bounded, thread-safe pool of DB-API connections with per-thread checkout.
+
+    A thread that acquires a connection it already holds gets the same connection back, and the
+    connection returns to the pool when the thread has released it as many times as it was
+    acquired. Idle connections are evicted after max_idle seconds, and connections idle for more
+    than ping_interval seconds are health-checked with 'SELECT 1' before reuse. Broken
+    connections are discarded and replaced.
+
+    Args:
+        factory (Callable): Creates a new DB-API connection.
+        max_size (int): Maximum number of open connections. Default = 8.
+        max_idle (float): Seconds after which idle connections are closed. Default = 300.
+        ping_interval (float): Idle seconds after which a connection is checked before reuse.
+            Default = 30.
+        timeout (float): Seconds to wait for a connection when all are checked out. Default = 30.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        max_size: int = 8,
+        max_idle: float = 300,
+        ping_interval: float = 30,
+        timeout: float = 30,
+    ) -> None:
+        super().__init__()
+        self._factory = factory
+        self._max_size = max_size
+        self._max_idle = max_idle
+        self._ping_interval = ping_interval
+        self._timeout = timeout
+        self._idle = []  # (connection, released at) pairs, most recently released last.
+        self._checked_out = {}  # Thread id -> [connection, depth]
+        self._size = 0
+        self._created = 0
+        self._condition = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """Returns the number of open connections, idle or checked out."""
+        return self._size
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._condition:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "checked_out": len(self._checked_out),
+                "created": self._created,
+            }
+
+    def acquire(self) -> Any:
+        """Returns the calling thread's connection, checking one out of the pool if needed.
+
+        Raises:
+            TimeoutError: If no connection becomes available within the timeout.
+        """
+        thread = threading.get_ident()
+        deadline = monotonic() + self._timeout
+        while True:
+            connection = None
+            with self._condition:
+                if thread in self._checked_out:
+                    self._checked_out[thread][1] += 1
+                    return self._checked_out[thread][0]
+                self._evict()
+                if self._idle:
+                    connection, released = self._idle.pop()
+                    self._checked_out[thread] = [connection, 1]
+                    stale = monotonic() - released >= self._ping_interval
+                elif self._size < self._max_size:
+                    self._size += 1
+                else:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0:
+                        msg = f"Timed out after {self._timeout} seconds waiting for one of {self._max_size} connections."
+                        self._logger.error(msg)
+                        raise TimeoutError(msg)
+                    self._condition.wait(remaining)
+                    continue
+
+            if connection is None:
+                return self._create(thread)
+            # Health checks run outside the lock, so other threads aren't blocked on the network.
+            if not stale or self._is_healthy(connection):
+                return connection
+            with self._condition:
+                del self._checked_out[thread]
+                self._discard(connection)
+                self._condition.notify()
+
+    def release(self, discard: bool = False) -> None:
+        """Releases the calling thread's connection, returning it to the pool on the last release.
+
+        Args:
+            discard (bool): Close the connection instead of returning it to the pool, e.g. after
+                a connection error.
+        """
+        thread = threading.get_ident()
+        with self._condition:
+            if thread not in self._checked_out:
+                return
+            item = self._checked_out[thread]
+            item[1] -= 1
+            if item[1] > 0 and not discard:
+                return
+            del self._checked_out[thread]
+            if discard:
+                self._discard(item[0])
+            else:
+                self._idle.append((item[0], monotonic()))
+                self._evict()
+            self._condition.notify()
+
+    def close(self) -> None:
+        """Closes all idle connections. Checked out connections are closed when released."""
+        with self._condition:
+            while self._idle:
+                connection, _ = self._idle.pop()
+                self._discard(connection)
+            self._condition.notify_all()
+
+    def _create(self, thread: int) -> Any:
+        """Opens a connection in a slot reserved by the caller."""
+        try:
+            connection = self._factory()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._created += 1
+            self._checked_out[thread] = [connection, 1]
+        self._logger.debug("Opened a new pooled connection.")
+        return connection
+
+    def _evict(self) -> None:
+        """Closes connections idle for more than max_idle seconds. Requires the lock."""
+        now = monotonic()
+        keep: List = []
+        for connection, released in self._idle:
+            if now - released > self._max_idle:
+                self._discard(connection)
+            else:
+                keep.append((connection, released))
+        self._idle = keep
+
+    def _discard(self, connection: Any) -> None:
+        """Closes a connection and frees its slot. Requires the lock."""
+        self._size -= 1
+        try:
+            connection.close()
+        except Exception:  # pragma: no cover
+            pass
+        self._logger.debug("Closed a pooled connection.")
+
+    def _is_healthy(self, connection: Any) -> bool:
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+            cursor.close()
+            return True
+        except Exception as err:
+            self._logger.debug(f"Discarding unhealthy pooled connection: {err}")
+            return False
@@ -18,35 +18,59 @@
 # ================================================================================================ #
 """Relational Databases Module."""
 import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Iterator
 import pymysql
+from pymysql.constants import CLIENT
 import dotenv
+import pandas as pd
 import mysql.connector
 from mysql.connector import errorcode
 
 from .base import Connection, AbstractDatabase
+from .dialect import PreparedStatement, SQLiteDialect
 
 
 # ------------------------------------------------------------------------------------------------ #
 #                                       MYSQL CONNECTION                                           #
 # ------------------------------------------------------------------------------------------------ #
 class MySQLConnection(Connection):
-    """MySQL Database."""
-
-    def __init__(self, connector: pymysql.connect) -> None:
-        super().__init__(connector=connector)
-
-    def open(self) -> None:
+    """MySQL Database.
+
+    Credentials are read from the environment once, on the first connect.
+
+    Args:
+        connector (pymysql.connect): Creates the underlying connection.
+        pool_size (int): Maximum number of pooled connections. None disables pooling.
+        max_idle (float): Seconds after which idle pooled connections are closed. Default = 300.
+        ping_interval (float): Idle seconds after which a pooled connection is health-checked.
+            Default = 30.
+    """
+
+    def __init__(
+        self, connector: pymysql.connect, pool_size: int = None, max_idle: float = 300, ping_interval: float = 30
+    ) -> None:
+        super().__init__(connector=connector, pool_size=pool_size, max_idle=max_idle, ping_interval=ping_interval)
+        self._credentials = None
+
+    def _get_credentials(self) -> dict:
+        if self._credentials is None:
+            dotenv.load_dotenv()
+            self._credentials = {
+                "host": os.getenv("MYSQL_HOST"),
+                "user": os.getenv("MYSQL_USER"),
+                "password": os.getenv("MYSQL_PASSWORD"),
+            }
+        return self._credentials
+
+    def _create(self):
         """Opens a database connection."""
-
-        dotenv.load_dotenv()
-        host = os.getenv("MYSQL_HOST")
-        user = os.getenv("MYSQL_USER")
-        password = os.getenv("MYSQL_PASSWORD")
-
         try:
-            self._connection = self._connector(host=host, user=user, password=password, autocommit=False)
-            self._is_open = True
-            self._logger.debug(f"{self.__class__.__name__} is connected.")
+            return self._connector(**self._get_credentials(), autocommit=False, client_flag=CLIENT.FOUND_ROWS)
         except mysql.connector.Error as err:  # pragma: no cover
             if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
                 msg = "Invalid user name or password"
@@ -65,24 +89,41 @@ class MySQLConnection(Connection):
 #                                      DATABASE CONNECTION                                         #
 # ------------------------------------------------------------------------------------------------ #
 class DatabaseConnection(Connection):
-    """Connection to a Database."""
-
-    def __init__(self, connector: pymysql.connect) -> None:
-        super().__init__(connector=connector)
-
-    def open(self) -> None:
+    """Connection to a Database.
+
+    Credentials are read from the environment once, on the first connect.
+
+    Args:
+        connector (pymysql.connect): Creates the underlying connection.
+        pool_size (int): Maximum number of pooled connections. None disables pooling.
+        max_idle (float): Seconds after which idle pooled connections are closed. Default = 300.
+        ping_interval (float): Idle seconds after which a pooled connection is health-checked.
+            Default = 30.
+    """
+
+    def __init__(
+        self, connector: pymysql.connect, pool_size: int = None, max_idle: float = 300, ping_interval: float = 30
+    ) -> None:
+        super().__init__(connector=connector, pool_size=pool_size, max_idle=max_idle, ping_interval=ping_interval)
+        self._credentials = None
+        self._database = None
+
+    def _get_credentials(self) -> dict:
+        if self._credentials is None:
+            dotenv.load_dotenv()
+            self._database = os.getenv("DATABASE_NAME")
+            self._credentials = {
+                "host": os.getenv("DATABASE_HOST"),
+                "user": os.getenv("DATABASE_USER"),
+                "password": os.getenv("DATABASE_PASSWORD"),
+                "database": self._database,
+            }
+        return self._credentials
+
+    def _create(self):
         """Opens a database connection."""
-
-        dotenv.load_dotenv()
-        host = os.getenv("DATABASE_HOST")
-        user = os.getenv("DATABASE_USER")
-        password = os.getenv("DATABASE_PASSWORD")
-        self._database = os.getenv("DATABASE_NAME")
-
         try:
-            self._connection = self._connector(host=host, user=user, password=password, database=self._database, autocommit=False)
-            self._is_open = True
-            self._logger.debug(f"{self.__class__.__name__} is connected.")
+            return self._connector(**self._get_credentials(), autocommit=False, client_flag=CLIENT.FOUND_ROWS)
         except mysql.connector.Error as err:  # pragma: no cover
             if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
                 msg = "Invalid user name or password"
@@ -97,22 +138,193 @@ class DatabaseConnection(Connection):
                 raise mysql.connector.Error()
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                                     SQLITE CONNECTION                                            #
+# ------------------------------------------------------------------------------------------------ #
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+sqlite3.register_converter("DATETIME", lambda value: datetime.fromisoformat(value.decode()))
+
+
+class SQLiteCursor(sqlite3.Cursor):
+    """SQLite cursor that takes None for no arguments, like pymysql cursors."""
+
+    def execute(self, sql: str, args: tuple = None) -> sqlite3.Cursor:
+        return super().execute(sql, args or ())
+
+
+class BufferedCursor(SQLiteCursor):
+    """SQLite cursor that fetches all rows on execute, like the default pymysql cursor.
+
+    Database commits, and may close the connection, before results are fetched. The rows must
+    already be off the connection by then.
+    """
+
+    def execute(self, sql: str, args: tuple = None) -> sqlite3.Cursor:
+        super().execute(sql, args)
+        self._rows = super().fetchall() if self.description else []
+        self._position = 0
+        return self
+
+    def fetchone(self) -> tuple:
+        rows = self.fetchmany(1)
+        return rows[0] if rows else None
+
+    def fetchmany(self, size: int = 1) -> list:
+        rows = self._rows[self._position: self._position + size]
+        self._position += len(rows)
+        return rows
+
+    def fetchall(self) -> list:
+        return self.fetchmany(len(self._rows))
+
+
+class SQLiteConnection(Connection):
+    """SQLite database, for single node runs and tests that need no database server.
+
+    The database runs in WAL mode, so readers don't block the writer, with synchronous=NORMAL.
+    MySQL statements are rendered by the SQLiteDialect, and the driver keeps a cache of
+    prepared statements for the rendered text.
+
+    Args:
+        location (str): Path to the database file.
+        pool_size (int): Maximum number of pooled connections. None disables pooling.
+        max_idle (float): Seconds after which idle pooled connections are closed. Default = 300.
+        ping_interval (float): Idle seconds after which a pooled connection is health-checked.
+            Default = 30.
+        timeout (float): Seconds to wait for a lock held by another connection. Default = 30.
+        cached_statements (int): Prepared statements cached per connection. Default = 256.
+    """
+
+    def __init__(
+        self,
+        location: str,
+        pool_size: int = None,
+        max_idle: float = 300,
+        ping_interval: float = 30,
+        timeout: float = 30,
+        cached_statements: int = 256,
+    ) -> None:
+        super().__init__(
+            connector=sqlite3.connect,
+            pool_size=pool_size,
+            max_idle=max_idle,
+            ping_interval=ping_interval,
+            dialect=SQLiteDialect(),
+        )
+        self._location = location
+        self._timeout = timeout
+        self._cached_statements = cached_statements
+
+    @property
+    def cursor(self) -> BufferedCursor:
+        """Returns a cursor that buffers results, like the MySQL cursor."""
+        return self._connection.cursor(BufferedCursor)
+
+    @property
+    def server_cursor(self) -> SQLiteCursor:
+        """Returns a cursor that steps through results as they are fetched."""
+        return self._connection.cursor(SQLiteCursor)
+
+    def begin(self) -> None:
+        """Start a transaction on the connection."""
+        if not self._connection.in_transaction:
+            self._connection.execute("BEGIN")
+        self._in_transaction = True
+        self._logger.debug(f"{self.__class__.__name__}  transaction started.")
+
+    def _create(self) -> sqlite3.Connection:
+        """Opens a database connection."""
+        os.makedirs(os.path.dirname(os.path.abspath(self._location)), exist_ok=True)
+        connection = self._connector(
+            self._location,
+            timeout=self._timeout,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False,
+            cached_statements=self._cached_statements,
+        )
+        connection.execute("PRAGMA journal_mode=WAL;")
+        connection.execute("PRAGMA synchronous=NORMAL;")
+        return connection
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                                        DATABASE                                                  #
 # ------------------------------------------------------------------------------------------------ #
 class Database(AbstractDatabase):
-    def __init__(self, connection: Connection, autocommit: bool = True, autoclose: bool = False) -> None:
+    """Relational database service.
+
+    Open and transaction state is held per thread, as in the connection, so a Database shared
+    by several threads gives each thread its own session.
+
+    Args:
+        connection (Connection): The database connection.
+        autocommit (bool): Commit after each statement outside of a transaction. Default = True.
+        autoclose (bool): Close the connection, returning it to the pool if pooling is enabled,
+            after each statement outside of a transaction. Default = False.
+        group_size (int): With autocommit, the number of statements that change data committed
+            together. Reads don't count towards the group. The default of 1 commits each
+            statement on its own.
+        group_window (float): With autocommit, the maximum age in seconds of the oldest
+            uncommitted statement. A group is committed when either limit is reached. The age
+            is only checked as statements complete; no timer commits a trailing group when the
+            window elapses. Default = None, no time limit.
+
+    Group commit trades durability for fewer commits: a statement that has returned isn't
+    durable until its group is committed, by a later statement, flush, save, begin or close.
+    Callers that need it at once, or that have issued their last write, call flush.
+    """
+
+    __reads = re.compile(r"^\s*(SELECT|SHOW|DESCRIBE|DESC|EXPLAIN)\b", re.IGNORECASE)  # Statements that don't change data.
+
+    def __init__(
+        self,
+        connection: Connection,
+        autocommit: bool = True,
+        autoclose: bool = False,
+        group_size: int = 1,
+        group_window: float = None,
+    ) -> None:
         super().__init__()
         self._connection = connection
         self._autocommit = autocommit
         self._autoclose = autoclose
-        self._is_open = self._connection.is_open
-        self._in_transaction = False
+        self._group_size = group_size
+        self._group_window = group_window
+        self._local = threading.local()
+
+    @property
+    def _is_open(self) -> bool:
+        return getattr(self._local, "is_open", False) and self._connection.is_open
+
+    @_is_open.setter
+    def _is_open(self, is_open: bool) -> None:
+        self._local.is_open = is_open
+
+    @property
+    def _in_transaction(self) -> bool:
+        return getattr(self._local, "in_transaction", False)
+
+    @_in_transaction.setter
+    def _in_transaction(self, in_transaction: bool) -> None:
+        self._local.in_transaction = in_transaction
+
+    @property
+    def _pending(self) -> int:
+        return getattr(self._local, "pending", 0)
+
+    @_pending.setter
+    def _pending(self, pending: int) -> None:
+        self._local.pending = pending
 
     @property
     def in_transaction(self) -> bool:
         return self._in_transaction
 
+    @property
+    def pending(self) -> int:
+        """Returns the number of autocommitted statements awaiting their group commit."""
+        return self._pending
+
     @property
     def is_open(self) -> bool:
         return self._is_open
@@ -126,11 +338,13 @@ class Database(AbstractDatabase):
         """Starts a transaction on the underlying database connection."""
         if not self._is_open:
             self.connect()
+        self.flush()
         self._connection.begin()
         self._in_transaction = True
 
     def close(self) -> None:
-        """Closes the underlying database connection."""
+        """Closes the underlying database connection, committing any pending group first."""
+        self.flush()
         self._connection.close()
         self._is_open = False
         self._in_transaction = False
@@ -139,18 +353,33 @@ class Database(AbstractDatabase):
         """Saves changes to the database."""
         self._connection.commit()
         self._in_transaction = False
+        self._pending = 0
+
+    def flush(self) -> None:
+        """Commits the pending group of autocommitted statements, making them durable. A group
+        whose window has elapsed stays pending until the next statement, so call flush after the
+        last write of a batch."""
+        if self._pending and not self._in_transaction:
+            self.save()
 
     def rollback(self) -> None:
-        """Rolls back the database to state as of last save or commit."""
+        """Rolls back the database to state as of last save or commit. Autocommitted statements
+        are committed first, so a group commit never discards them."""
+        if not self._in_transaction:
+            self.flush()
         self._connection.rollback()
         self._in_transaction = False
 
+    def prepare(self, command: type) -> PreparedStatement:
+        """Returns the connection's prepared statement for a SQL command class."""
+        return self._connection.prepare(command)
+
     def query(self, sql: str, args: tuple = None) -> Connection.cursor:
         """Executes a query on the database and returns a cursor object."""
         self._open_session()
         cursor = self._connection.cursor
         try:
-            cursor.execute(sql, args)
+            cursor.execute(self._connection.dialect.render(sql), args)
         except mysql.connector.Error as err:  # pragma: no cover
             self._logger.error(err)
             self._logger.error("Error Code: ", err.errno)
@@ -158,7 +387,7 @@ class Database(AbstractDatabase):
             self._logger.error("Message: ", err.msg)
             raise mysql.connector.Error()
 
-        self._close_session()
+        self._close_session(changes=self.__reads.match(sql) is None)
         return cursor
 
     def create(self, sql: str, args: tuple = None) -> None:
@@ -167,46 +396,137 @@ class Database(AbstractDatabase):
         cursor.close()
 
     def insert(self, sql: str, args: tuple = None) -> int:
-        """Inserts data into a table and returns the last row id."""
+        """Inserts data into a table and returns the last row id, or the id returned by the
+        statement, e.g. by an upsert rendered with a RETURNING clause."""
         cursor = self.query(sql, args)
-        id = cursor.lastrowid
+        row = cursor.fetchone() if cursor.description else None
+        id = cursor.lastrowid if row is None else row[0]
         cursor.close()
         return id
 
-    def select(self, sql: str, args: tuple = None) -> tuple:
-        """Performs a select query returning a single instance or row."""
+    def insert_many(self, sql: str, args: list, batch_size: int = 1000) -> list:
+        """Inserts rows in batches and returns the row ids in order.
+
+        The single row 'INSERT ... VALUES (...)' statement is expanded to a multi-row VALUES
+        list, so each batch is one round trip. Ids are derived from the last row id of each
+        batch, which MySQL reports for the first row and SQLite for the last; both assign the
+        rows of a single statement consecutive ids.
+        Outside of a transaction, each batch is committed on its own.
+
+        Args:
+            sql (str): Single row INSERT statement.
+            args (list): A tuple of arguments for each row.
+            batch_size (int): Maximum rows per statement. Default = 1000.
+        """
+        ids = []
+        prefix, values = self._split_values(sql)
+        for i in range(0, len(args), batch_size):
+            batch = args[i: i + batch_size]
+            cmd = f"{prefix} VALUES {', '.join([values] * len(batch))};"
+            cursor = self.query(cmd, tuple(arg for row in batch for arg in row))
+            first = self._connection.dialect.first_insert_id(cursor, len(batch))
+            cursor.close()
+            ids.extend(range(first, first + len(batch)))
+        return ids
+
+    def select(self, sql: str, args: tuple = None, row_factory: Callable = None) -> tuple:
+        """Performs a select query returning a single instance or row.
+
+        Args:
+            sql (str): The query.
+            args (tuple): The query parameters.
+            row_factory (Callable): Optional. Called with the cursor description, it returns the
+                function that converts each row, e.g. a RowMapper.
+        """
         row = None
         cursor = self.query(sql, args)
         row = cursor.fetchone()
+        if row is not None and row_factory is not None:
+            row = row_factory(cursor.description)(row)
         cursor.close()
         return row
 
-    def select_all(self, sql: str, args: tuple = None) -> list:
-        """Performs a select query returning multiple instances or rows."""
+    def select_all(self, sql: str, args: tuple = None, row_factory: Callable = None) -> list:
+        """Performs a select query returning multiple instances or rows, converted by the
+        optional row_factory as in select."""
         rows = []
         cursor = self.query(sql, args)
         rows = cursor.fetchall()
+        if rows and row_factory is not None:
+            rows = list(map(row_factory(cursor.description), rows))
         cursor.close()
         return rows
 
-    def update(self, sql: str, args: tuple = None) -> None:
-        """Performs an update on existing data in the database."""
+    def select_frame(self, sql: str, args: tuple = None) -> pd.DataFrame:
+        """Performs a select query returning the rows as a DataFrame, with the query's columns."""
+        cursor = self.query(sql, args)
+        columns = [column[0] for column in cursor.description]
+        frame = pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+        cursor.close()
+        return frame
+
+    def iterate(
+        self, sql: str, args: tuple = None, batch_size: int = 1000, row_factory: Callable = None
+    ) -> Iterator[tuple]:
+        """Streams the rows of a query through a server-side cursor, batch_size rows at a time.
+
+        Rows are read from the server as the iterator is consumed, so memory stays flat however
+        many rows the query returns. No other statement can run on the connection until the
+        iterator is exhausted or closed. Rows are converted by the optional row_factory as in
+        select.
+        """
+        self._open_session()
+        cursor = self._connection.server_cursor
+        try:
+            cursor.execute(self._connection.dialect.render(sql), args)
+            convert = row_factory(cursor.description) if row_factory is not None else None
+            rows = cursor.fetchmany(batch_size)
+            while rows:
+                yield from (rows if convert is None else map(convert, rows))
+                rows = cursor.fetchmany(batch_size)
+        except mysql.connector.Error as err:  # pragma: no cover
+            self._logger.error(err)
+            raise mysql.connector.Error()
+        finally:
+            cursor.close()
+            self._close_session(changes=False)
+
+    def update(self, sql: str, args: tuple = None) -> int:
+        """Performs an update on existing data and returns the number of rows matched."""
         cursor = self.query(sql, args)
         rowcount = cursor.rowcount
         cursor.close()
         return rowcount
 
+    def update_many(self, sql: str, args: list) -> int:
+        """Performs an update for each tuple of arguments with executemany. Returns rows affected."""
+        self._open_session()
+        cursor = self._connection.cursor
+        try:
+            cursor.executemany(self._connection.dialect.render(sql), args)
+        except mysql.connector.Error as err:  # pragma: no cover
+            self._logger.error(err)
+            raise mysql.connector.Error()
+
+        self._close_session()
+        rowcount = cursor.rowcount
+        cursor.close()
+        return rowcount
+
     def count(self, sql: str, args: tuple = None) -> int:
-        """Counts the rows returned from a query."""
-        cursor = self.query(sql, args)
-        rows = cursor.fetchall()
+        """Counts the rows returned from a query, without fetching them."""
+        sql = sql.strip().rstrip(";")
+        cursor = self.query(f"SELECT COUNT(*) FROM ({sql}) AS counted;", args)
+        count = cursor.fetchone()[0]
         cursor.close()
-        return len(rows)
+        return count
 
-    def delete(self, sql: str, args: tuple = None) -> None:
-        """Deletes existing data."""
+    def delete(self, sql: str, args: tuple = None) -> int:
+        """Deletes existing data and returns the number of rows deleted."""
         cursor = self.query(sql, args)
+        rowcount = cursor.rowcount
         cursor.close()
+        return rowcount
 
     def drop(self, sql: str, args: tuple = None) -> None:
         """Drop a database or table."""
@@ -230,9 +550,27 @@ class Database(AbstractDatabase):
         if not self._is_open:
             self.connect()
 
-    def _close_session(self) -> None:
-        """Saves and closes the connection, if not in transaction."""
+    def _close_session(self, changes: bool = True) -> None:
+        """Saves and closes the connection, if not in transaction. With group commit, the save
+        is deferred until the group of statements that change data is full or its window has
+        elapsed. A read outside of a group is committed at once, ending its snapshot."""
         if not self._in_transaction and self._autocommit:
-            self.save()
+            if changes:
+                if self._pending == 0:
+                    self._local.started = time.monotonic()
+                self._pending += 1
+            if self._pending == 0 or self._pending >= self._group_size or (
+                self._group_window is not None and time.monotonic() - self._local.started >= self._group_window
+            ):
+                self.save()
         if not self._in_transaction and self._autoclose:
             self.close()
+
+    def _split_values(self, sql: str) -> tuple:
+        """Splits a single row INSERT statement into its prefix and VALUES placeholder tuple."""
+        match = re.match(r"^\s*(INSERT\s.+?)\s+VALUES\s*(\(.*\))\s*;?\s*$", sql, re.IGNORECASE | re.DOTALL)
+        if match is None:
+            msg = f"Expected a single row INSERT ... VALUES (...) statement. Got: {sql}"
+            self._logger.error(msg)
+            raise ValueError(msg)
+        return match.group(1), match.group(2)
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /recsys/core/database/serializer.py                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday January 13th 2023 04:26:09 pm                                                #
+# Modified   : Friday January 13th 2023 04:26:09 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Serializers for object database values."""
+import pickle
+import struct
+import zlib
+from typing import Any, List
+
+from recsys.core.services.base import Service
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+try:
+    import lz4.frame
+except ImportError:  # pragma: no cover
+    lz4 = None
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         CODECS                                                   #
+# ------------------------------------------------------------------------------------------------ #
+class Codec:
+    """Compression codec identified by a single byte header in serialized values."""
+
+    id: bytes = b"\x00"
+    name: str = "none"
+
+    @classmethod
+    def available(cls) -> bool:
+        return True
+
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+
+class ZlibCodec(Codec):
+
+    id = b"\x01"
+    name = "zlib"
+
+    def __init__(self, level: int = 1) -> None:
+        self._level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self._level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class ZstdCodec(Codec):
+
+    id = b"\x02"
+    name = "zstd"
+
+    def __init__(self, level: int = 3) -> None:
+        self._level = level
+
+    @classmethod
+    def available(cls) -> bool:
+        return zstandard is not None
+
+    def compress(self, data: bytes) -> bytes:
+        return zstandard.ZstdCompressor(level=self._level).compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zstandard.ZstdDecompressor().decompress(data)
+
+
+class LZ4Codec(Codec):
+
+    id = b"\x03"
+    name = "lz4"
+
+    def __init__(self, level: int = 0) -> None:
+        self._level = level
+
+    @classmethod
+    def available(cls) -> bool:
+        return lz4 is not None
+
+    def compress(self, data: bytes) -> bytes:
+        return lz4.frame.compress(data, compression_level=self._level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return lz4.frame.decompress(data)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        SERIALIZER                                                #
+# ------------------------------------------------------------------------------------------------ #
+class Serializer(Service):
+    """Pickles entities with out-of-band buffers and optional compression.
+
+    With pickle protocol 5, large buffers such as numpy arrays are written after the pickle
+    stream instead of being copied into it, and are loaded back without an extra copy.
+    Values of at least threshold bytes are compressed with the configured codec. zstd and lz4
+    are used when their packages are installed; otherwise, the serializer falls back to zlib.
+
+    Serialized values are framed as: codec id (1 byte), then the, possibly compressed, body
+    holding the buffer count, the buffer lengths, the pickle stream and the buffers.
+
+    Args:
+        protocol (int): The pickle protocol. Out-of-band buffers require protocol 5. Default = 5.
+        compression (str): 'none', 'zlib', 'zstd' or 'lz4'. Default = 'none'.
+        threshold (int): Minimum size, in bytes, of values to compress. Default = 4096.
+        level (int): Compression level. Default is the codec's default.
+    """
+
+    __codecs = {codec.name: codec for codec in (Codec, ZlibCodec, ZstdCodec, LZ4Codec)}
+    __header = struct.Struct("<I")
+    __length = struct.Struct("<Q")
+
+    def __init__(self, protocol: int = 5, compression: str = "none", threshold: int = 4096, level: int = None) -> None:
+        super().__init__()
+        self._protocol = min(protocol, pickle.HIGHEST_PROTOCOL)
+        self._threshold = threshold
+        self._codec = self._get_codec(compression, level)
+        self._decoders = {codec.id: codec() for codec in self.__codecs.values() if codec.available()}
+        self._decoders[self._codec.id] = self._codec
+
+    @property
+    def protocol(self) -> int:
+        return self._protocol
+
+    @property
+    def compression(self) -> str:
+        return self._codec.name
+
+    @property
+    def threshold(self) -> int:
+        return self._threshold
+
+    def dumps(self, value: Any) -> bytes:
+        """Serializes a value to bytes."""
+        buffers = []
+        if self._protocol >= 5:
+            data = pickle.dumps(value, protocol=self._protocol, buffer_callback=buffers.append)
+        else:
+            data = pickle.dumps(value, protocol=self._protocol)
+        raws = [buffer.raw() for buffer in buffers]
+        parts = [self.__header.pack(len(raws))]
+        parts.extend(self.__length.pack(raw.nbytes) for raw in raws)
+        parts.append(data)
+        parts.extend(raws)
+        body = b"".join(parts)
+        if len(body) >= self._threshold:
+            return self._codec.id + self._codec.compress(body)
+        return Codec.id + body
+
+    def loads(self, data: bytes) -> Any:
+        """Deserializes a value from bytes."""
+        try:
+            codec = self._decoders[data[:1]]
+        except KeyError:
+            msg = f"Unable to deserialize value compressed with codec id {data[:1]!r}. The codec is not available."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        body = codec.decompress(memoryview(data)[1:])
+        nbuffers = self.__header.unpack_from(body)[0]
+        # Buffers are views of the body, so it is copied once into writable memory. Arrays
+        # loaded from them can then be modified in place.
+        body = memoryview(bytearray(body) if nbuffers else body)
+        offset = self.__header.size
+        lengths = []
+        for _ in range(nbuffers):
+            lengths.append(self.__length.unpack_from(body, offset)[0])
+            offset += self.__length.size
+        buffers_size = sum(lengths)
+        stream = body[offset:len(body) - buffers_size]
+        buffers = self._split(body[len(body) - buffers_size:], lengths)
+        return pickle.loads(stream, buffers=buffers)
+
+    def _split(self, data: memoryview, lengths: List[int]) -> List[memoryview]:
+        buffers = []
+        offset = 0
+        for length in lengths:
+            buffers.append(data[offset:offset + length])
+            offset += length
+        return buffers
+
+    def _get_codec(self, compression: str, level: int) -> Codec:
+        try:
+            codec = self.__codecs[compression]
+        except KeyError:
+            msg = f"Compression {compression} is not supported."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        if not codec.available():
+            msg = f"Compression {compression} is not installed. Falling back to zlib."
+            self._logger.warning(msg)
+            codec = ZlibCodec
+        if level is None or codec is Codec:
+            return codec()
+        return codec(level=level)
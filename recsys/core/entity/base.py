@@ -22,6 +22,7 @@ from dataclasses import dataclass
 from abc import ABC, abstractmethod
 from datetime import datetime
 import logging
+from typing import Dict, List, Tuple
 
 import recsys
 from recsys.core.services.validation import Validator
@@ -129,6 +130,35 @@ class Entity(ABC):
             raise response.exception(response.msg)
 
 
+# ------------------------------------------------------------------------------------------------ #
+class ChildTracker:
+    """Tracks the children of a composite entity that changed since the composite was persisted.
+
+    The tracker records the id and modified timestamp of each child when the composite is
+    persisted. Children without an id were added since, children whose timestamp moved on were
+    modified, and recorded children no longer in the composite were removed.
+    """
+
+    def __init__(self) -> None:
+        self._versions: Dict[str, Tuple[int, datetime]] = {}
+
+    def changes(self, children: Dict[str, Entity]) -> Tuple[List[Entity], List[Entity], List[int]]:
+        """Returns the children added and modified, and the ids of the children removed."""
+        added, modified = [], []
+        for name, child in children.items():
+            if child.id is None:
+                added.append(child)
+            elif self._versions.get(name) != (child.id, child.modified):
+                modified.append(child)
+        ids = {child.id for child in children.values()}
+        removed = [id for id, _ in self._versions.values() if id not in ids]
+        return added, modified, removed
+
+    def reset(self, children: Dict[str, Entity]) -> None:
+        """Records the children as persisted."""
+        self._versions = {name: (child.id, child.modified) for name, child in children.items()}
+
+
 # ------------------------------------------------------------------------------------------------ #
 @dataclass
 class Spec:
@@ -20,10 +20,11 @@
 from abc import abstractmethod
 from datetime import datetime
 import pandas as pd
-from typing import Union, Dict
+from typing import Union, Dict, List, Tuple
 
-from recsys.core.entity.base import Entity
+from recsys.core.entity.base import Entity, ChildTracker
 from recsys.core.dal.dto import DataFrameDTO, DatasetDTO
+from recsys.core.services.io import IOService
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -90,6 +91,7 @@ class Dataset(DataComponent):
         self._task_id = task_id
 
         self._dataframes = {}
+        self._tracker = ChildTracker()
         self._is_composite = True
 
         self._validate()
@@ -101,6 +103,18 @@ class Dataset(DataComponent):
     def __len__(self) -> int:
         return len(self._dataframes)
 
+    def __getstate__(self) -> dict:
+        """Excludes the change tracker. A dataset read from storage holds its persisted dataframes."""
+        state = self.__dict__.copy()
+        state.pop("_tracker", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restores the dataset and records its dataframes as persisted."""
+        self.__dict__.update(state)
+        self._tracker = ChildTracker()
+        self._tracker.reset(self._dataframes)
+
     def __str__(self) -> str:
         return f"Dataset Id: {self._id}\n\tData source: {self._datasource_id}\n\tName: {self._name}\n\tDescription: {self._description}\n\tMode: {self._mode}\n\tStage: {self._stage}\n\tDataFrames: {self.dataframe_count}\n\tCreated: {self._created}\n\tModified: {self._modified}"
 
@@ -191,6 +205,17 @@ class Dataset(DataComponent):
         del self._dataframes[name]
         self._modified = datetime.now()
 
+    # -------------------------------------------------------------------------------------------- #
+    def get_changes(self) -> Tuple[List[DataComponent], List[DataComponent], List[int]]:
+        """Returns the dataframes added and modified, and the ids of the dataframes removed, since the
+        dataset was last persisted."""
+        return self._tracker.changes(self._dataframes)
+
+    # -------------------------------------------------------------------------------------------- #
+    def clear_changes(self) -> None:
+        """Marks the dataframes as persisted."""
+        self._tracker.reset(self._dataframes)
+
     # -------------------------------------------------------------------------------------------- #
     def as_dto(self) -> DatasetDTO:
 
@@ -252,6 +277,10 @@ class DataFrame(DataComponent):
         self._parent = parent
         self._is_composite = False
 
+        # Location of the payload when it is stored apart from the DataFrame object.
+        self._payload_uri = None
+        self._memory_map = False
+
         # Possibly inherited from dataset and assigned in set_metadata if and when dataset is set.
         self._stage = None
 
@@ -279,11 +308,24 @@ class DataFrame(DataComponent):
         """
 
         if isinstance(other, DataFrame):
-            return self._data.equals(other.data)
+            return self.data.equals(other.data)
 
     def __len__(self) -> int:
         return self._nrows
 
+    def __getstate__(self) -> dict:
+        """Excludes the payload from the pickled state once it is stored in its own file."""
+        state = self.__dict__.copy()
+        if self._payload_uri is not None:
+            state["_data"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restores the DataFrame. DataFrames pickled before payload files existed hold their payload."""
+        state.setdefault("_payload_uri", None)
+        state.setdefault("_memory_map", False)
+        self.__dict__.update(state)
+
     # -------------------------------------------------------------------------------------------- #
     @property
     def is_composite(self) -> str:
@@ -298,8 +340,39 @@ class DataFrame(DataComponent):
     # -------------------------------------------------------------------------------------------- #
     @property
     def data(self) -> pd.DataFrame:
+        """The payload. Loaded from the payload file on first access if not in memory."""
+        if self._data is None and self._payload_uri is not None:
+            self._data = IOService.read(self._payload_uri, memory_map=self._memory_map)
+            msg = f"Loaded payload for {self._oid} from {self._payload_uri}."
+            self._logger.debug(msg)
         return self._data
 
+    # -------------------------------------------------------------------------------------------- #
+    @property
+    def payload_uri(self) -> str:
+        """Location of the externally stored payload. None if the payload has not been stored."""
+        return self._payload_uri
+
+    @payload_uri.setter
+    def payload_uri(self, payload_uri: str) -> None:
+        self._payload_uri = payload_uri
+
+    # -------------------------------------------------------------------------------------------- #
+    @property
+    def memory_map(self) -> bool:
+        """If True, the stored payload is loaded as read-only memory-mapped columns where possible."""
+        return self._memory_map
+
+    @memory_map.setter
+    def memory_map(self, memory_map: bool) -> None:
+        self._memory_map = memory_map
+
+    # -------------------------------------------------------------------------------------------- #
+    @property
+    def is_loaded(self) -> bool:
+        """True if the payload is held in memory."""
+        return self._data is not None
+
     # -------------------------------------------------------------------------------------------- #
     @property
     def parent(self) -> Dataset:
@@ -309,6 +382,7 @@ class DataFrame(DataComponent):
     @parent.setter
     def parent(self, parent: Dataset) -> None:
         self._parent = parent
+        self._modified = datetime.now()
 
     # -------------------------------------------------------------------------------------------- #
     @property
@@ -334,13 +408,13 @@ class DataFrame(DataComponent):
     # Data Access methods
 
     def info(self) -> None:
-        self._data.info(verbose=True, memory_usage=True, show_counts=True)
+        self.data.info(verbose=True, memory_usage=True, show_counts=True)
 
     def head(self, n: int = 5) -> pd.DataFrame:
-        return self._data.head(n)
+        return self.data.head(n)
 
     def tail(self, n: int = 5) -> pd.DataFrame:
-        return self._data.tail(n)
+        return self.data.tail(n)
 
     # ------------------------------------------------------------------------------------------------ #
     def as_dto(self) -> DataFrameDTO:
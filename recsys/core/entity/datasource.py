@@ -18,11 +18,11 @@
 # ================================================================================================ #
 """DataSourceURL Entity Module"""
 from abc import abstractmethod
-from typing import Union, Dict
+from typing import Union, Dict, List, Tuple
 import pandas as pd
 from datetime import datetime
 
-from recsys.core.entity.base import Entity
+from recsys.core.entity.base import Entity, ChildTracker
 from recsys.core.dal.dto import DataSourceURLDTO, DataSourceDTO
 
 
@@ -72,6 +72,7 @@ class DataSource(DataSourceComponent):
         self._website = website
 
         self._urls = {}
+        self._tracker = ChildTracker()
         self._is_composite = True
 
         self._validate()
@@ -91,6 +92,18 @@ class DataSource(DataSourceComponent):
         else:
             return False
 
+    def __getstate__(self) -> dict:
+        """Excludes the change tracker. A datasource read from storage holds its persisted urls."""
+        state = self.__dict__.copy()
+        state.pop("_tracker", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restores the datasource and records its urls as persisted."""
+        self.__dict__.update(state)
+        self._tracker = ChildTracker()
+        self._tracker.reset(self._urls)
+
     @property
     def url_count(self) -> int:
         return len(self._urls)
@@ -104,6 +117,7 @@ class DataSource(DataSourceComponent):
     @website.setter
     def website(self, website: str) -> None:
         self._website = website
+        self._modified = datetime.now()
 
     # -------------------------------------------------------------------------------------------- #
     @property
@@ -153,6 +167,17 @@ class DataSource(DataSourceComponent):
         del self._urls[name]
         self._modified = datetime.now()
 
+    # -------------------------------------------------------------------------------------------- #
+    def get_changes(self) -> Tuple[List[DataSourceComponent], List[DataSourceComponent], List[int]]:
+        """Returns the urls added and modified, and the ids of the urls removed, since the
+        datasource was last persisted."""
+        return self._tracker.changes(self._urls)
+
+    # -------------------------------------------------------------------------------------------- #
+    def clear_changes(self) -> None:
+        """Marks the urls as persisted."""
+        self._tracker.reset(self._urls)
+
     # -------------------------------------------------------------------------------------------- #
     def as_dto(self) -> DataSourceDTO:
 
@@ -237,6 +262,7 @@ class DataSourceURL(DataSourceComponent):
     @url.setter
     def url(self, url: str) -> None:
         self._url = url
+        self._modified = datetime.now()
 
     # -------------------------------------------------------------------------------------------- #
     @property
@@ -247,6 +273,7 @@ class DataSourceURL(DataSourceComponent):
     @parent.setter
     def parent(self, parent: DataSource) -> None:
         self._parent = parent
+        self._modified = datetime.now()
 
     # ------------------------------------------------------------------------------------------------ #
     def as_dto(self) -> DataSourceURLDTO:
@@ -18,11 +18,11 @@
 # ================================================================================================ #
 """Task Entity Module"""
 from abc import abstractmethod
-from typing import Union, Dict
+from typing import Union, Dict, List, Tuple
 import pandas as pd
 from datetime import datetime
 
-from recsys.core.entity.base import Entity
+from recsys.core.entity.base import Entity, ChildTracker
 from recsys.core.dal.dto import TaskDTO, JobDTO
 from recsys import STATES
 
@@ -79,6 +79,7 @@ class Job(JobComponent):
         super().__init__(name=name, description=description, mode=mode)
 
         self._tasks = {}
+        self._tracker = ChildTracker()
         self._state = STATES[0]
         self._is_composite = True
 
@@ -103,6 +104,18 @@ class Job(JobComponent):
     def __len__(self) -> int:
         return len(self._tasks.values())
 
+    def __getstate__(self) -> dict:
+        """Excludes the change tracker. A job read from storage holds its persisted tasks."""
+        state = self.__dict__.copy()
+        state.pop("_tracker", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restores the job and records its tasks as persisted."""
+        self.__dict__.update(state)
+        self._tracker = ChildTracker()
+        self._tracker.reset(self._tasks)
+
     # -------------------------------------------------------------------------------------------- #
     @property
     def is_composite(self) -> str:
@@ -162,6 +175,17 @@ class Job(JobComponent):
         del self._tasks[name]
         self._modified = datetime.now()
 
+    # -------------------------------------------------------------------------------------------- #
+    def get_changes(self) -> Tuple[List[JobComponent], List[JobComponent], List[int]]:
+        """Returns the tasks added and modified, and the ids of the tasks removed, since the
+        job was last persisted."""
+        return self._tracker.changes(self._tasks)
+
+    # -------------------------------------------------------------------------------------------- #
+    def clear_changes(self) -> None:
+        """Marks the tasks as persisted."""
+        self._tracker.reset(self._tasks)
+
     # -------------------------------------------------------------------------------------------- #
     def as_dto(self) -> JobDTO:
 
@@ -258,6 +282,7 @@ class Task(JobComponent):
     @parent.setter
     def parent(self, parent: Job) -> None:
         self._parent = parent
+        self._modified = datetime.now()
 
     # ------------------------------------------------------------------------------------------------ #
     def as_dto(self) -> TaskDTO:
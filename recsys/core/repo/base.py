@@ -47,6 +47,10 @@ class RepoABC(ABC):
     def get(self, id: str) -> Entity:
         """Returns an entity with the designated id"""
 
+    @abstractmethod
+    def get_page(self, offset: int, limit: int) -> dict:
+        """Returns up to limit entities in id order, starting at offset, keyed by id."""
+
     @abstractmethod
     def get_by_name_mode(self, name: str) -> Entity:
         """Returns an entity with the given name."""
@@ -67,6 +71,26 @@ class RepoABC(ABC):
     def print(self) -> None:
         """Prints the repository contents as a DataFrame."""
 
+    def _load(self, oid: str) -> Entity:
+        """Returns the entity with the oid from the context's identity map, reading it from
+        object storage and mapping it on a miss."""
+        entity = self._context.identity_map.get(oid)
+        if entity is None:
+            entity = self._oao.read(oid)
+            if isinstance(entity, Entity):
+                entity = self._context.identity_map.add(entity)
+        return entity
+
+    def _load_many(self, oids: list) -> dict:
+        """Returns the entities with the oids keyed by id, in the order of oids. Entities not in
+        the context's identity map are read in a single object storage session and mapped."""
+        identity_map = self._context.identity_map
+        missing = [oid for oid in oids if oid not in identity_map]
+        for entity in self._oao.read_many(missing).values():
+            identity_map.add(entity)
+        entities = [identity_map.get(oid) for oid in oids]
+        return {entity.id: entity for entity in entities if entity is not None}
+
     def _get_mode(self) -> str:
         dotenv.load_dotenv()
         return os.getenv("MODE")
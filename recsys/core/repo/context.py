@@ -17,35 +17,66 @@
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 """Context Module."""
+import os
+import threading
+from typing import Callable
+
 from dependency_injector import containers
 
+from recsys.core.dal.cache import EntityCache
 from recsys.core.dal.dao import DAO
 from recsys.core.dal.oao import OAO
+from recsys.core.database.object import ObjectDB
+from recsys.core.database.relational import Database
 from recsys.core.entity.base import Entity
 from recsys.core.entity.dataset import Dataset, DataFrame
 from recsys.core.entity.datasource import DataSource, DataSourceURL
 from recsys.core.entity.job import Task, Job
 from recsys.core.entity.file import File
 from recsys.core.entity.profile import Profile
+from .identity import IdentityMap
 
 
 # ------------------------------------------------------------------------------------------------ #
 #                                       CONTEXT                                                    #
 # ------------------------------------------------------------------------------------------------ #
 class Context:
+    """Transaction scope over the relational and object databases.
+
+    Args:
+        dal (DeclarativeContainer): Data access layer container providing the data access objects.
+        rdb (Database): Relational database. Defaults to the one provided by the dal.
+        odb (ObjectDB): Object database. Defaults to the one provided by the dal.
+        cache (EntityCache): Entity cache. Defaults to the one provided by the dal.
+    """
 
-    def __init__(self, dal: containers.DeclarativeContainer) -> None:
+    def __init__(
+        self,
+        dal: containers.DeclarativeContainer,
+        rdb: Database = None,
+        odb: ObjectDB = None,
+        cache: EntityCache = None,
+    ) -> None:
         self._dal = dal
-        self._rdb = dal.rdb()
-        self._odb = dal.odb()
+        self._rdb = dal.rdb() if rdb is None else rdb
+        self._odb = dal.odb() if odb is None else odb
+        self._cache = dal.entity_cache() if cache is None else cache
+        self._identity_map = IdentityMap()
 
     @property
     def in_transaction(self) -> bool:
         """Returns True if database transaction is extant."""
         return self._rdb.in_transaction
 
+    @property
+    def identity_map(self) -> IdentityMap:
+        """Returns the map of entities loaded in this context."""
+        return self._identity_map
+
     def begin(self) -> None:
-        """Begin a transaction on the context."""
+        """Begin a transaction on the context. Entities cached by earlier transactions may since
+        have been changed by other contexts, so they are discarded."""
+        self._cache.clear()
         self._rdb.begin()
         self._odb.begin()
 
@@ -53,16 +84,21 @@ class Context:
         """Rolls back the database to the state at last save."""
         self._rdb.rollback()
         self._odb.rollback()
+        self._clear()
 
     def save(self) -> None:
-        """Saves the context."""
+        """Saves the context. Cached entities and the mapped entities written in the transaction
+        are discarded; the other mapped entities remain for the life of the context."""
         self._rdb.save()
         self._odb.save()
+        self._cache.clear()
+        self._identity_map.evict_written()
 
     def close(self) -> None:
         """Saves the context."""
         self._rdb.close()
         self._odb.close()
+        self._clear()
 
     def get_dao(self, entity: type(Entity)) -> DAO:
         """Provides a data access object for the given entity."""
@@ -71,7 +107,57 @@ class Context:
                 Task: self._dal.task, Job: self._dal.job, Profile: self._dal.profile,
                 File: self._dal.file}
 
-        return daos[entity]()
+        return daos[entity](database=self._rdb)
 
     def get_oao(self) -> OAO:
-        return self._dal.object()
+        return self._dal.object(database=self._odb, cache=self._cache)
+
+    def _clear(self) -> None:
+        """Discards the cached and mapped entities."""
+        self._cache.clear()
+        self._identity_map.clear()
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     CONTEXT FACTORY                                              #
+# ------------------------------------------------------------------------------------------------ #
+class ContextFactory:
+    """Hands each worker thread or process its own Context.
+
+    A worker's first call builds a Context over new relational and object database connections,
+    its own entity cache and identity map, and returns the same Context on later calls. A
+    process forked from a worker gets a new Context rather than the connections it inherited.
+    Object store writes from all workers are serialized by the store's write lock. The cache is
+    emptied when a transaction begins and when it is saved, so a worker never reads cached
+    entities another worker has since changed. The identity map lasts until the context is
+    closed or rolled back, so it holds the entities of a worker's pipeline run.
+
+    Args:
+        dal (DeclarativeContainer): Data access layer container providing the data access objects.
+        rdb (Callable): Returns a new relational database.
+        odb (Callable): Returns a new object database.
+        entity_cache (Callable): Returns a new entity cache.
+    """
+
+    def __init__(
+        self, dal: containers.DeclarativeContainer, rdb: Callable, odb: Callable, entity_cache: Callable
+    ) -> None:
+        self._dal = dal
+        self._rdb = rdb
+        self._odb = odb
+        self._entity_cache = entity_cache
+        self._local = threading.local()
+
+    def get_context(self) -> Context:
+        """Returns the Context of the calling thread and process."""
+        if getattr(self._local, "pid", None) != os.getpid():
+            self._local.context = Context(self._dal, rdb=self._rdb(), odb=self._odb(), cache=self._entity_cache())
+            self._local.pid = os.getpid()
+        return self._local.context
+
+    def close(self) -> None:
+        """Closes the Context of the calling thread and process, if any. The next call to
+        get_context builds a new one."""
+        if getattr(self._local, "pid", None) == os.getpid():
+            self._local.context.close()
+        self._local.__dict__.clear()
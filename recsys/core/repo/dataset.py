@@ -38,7 +38,7 @@ class DatasetRepo(RepoABC):
         self._oao = self._context.get_oao()
 
     def __len__(self) -> int:
-        return len(self._dataset_dao.read_all())
+        return len(self._dataset_dao)
 
     def add(self, entity: Entity) -> Entity:
         """Adds an entity to the repository and returns the Entity with the id added."""
@@ -46,48 +46,71 @@ class DatasetRepo(RepoABC):
         dto = self._dataset_dao.create(entity.as_dto())
         entity.id = dto.id
 
-        for name, dataframe in entity.dataframes.items():
+        dataframes = list(entity.dataframes.values())
+        for dataframe in dataframes:
             dataframe.parent = entity
-            dto = self._dataframe_dao.create(dto=dataframe.as_dto())
+        dtos = self._dataframe_dao.create_many([dataframe.as_dto() for dataframe in dataframes])
+        for dataframe, dto in zip(dataframes, dtos):
             dataframe.id = dto.id
             entity.update_dataframe(dataframe)
 
         self._oao.create(entity)
+        entity.clear_changes()
+        self._context.identity_map.clean(entity)
         return entity
 
     def get(self, id: str) -> Entity:
         "Returns an entity with the designated id"
-        result = []
-        dto = self._dataset_dao.read(id)
-        if dto:
-            result = self._oao.read(dto.oid)
+        result = self._context.identity_map.get_by_id(Dataset, id)
+        if result is None:
+            result = []
+            dto = self._dataset_dao.read(id)
+            if dto:
+                result = self._load(dto.oid)
         return result
 
+    def get_page(self, offset: int, limit: int) -> dict:
+        """Returns up to limit entities in id order, starting at offset, keyed by id. The
+        metadata is read in one query and the entities in one object store session."""
+        dtos = self._dataset_dao.read_page(offset, limit)
+        return self._load_many([dto.oid for dto in dtos.values()])
+
     def get_by_name_mode(self, name: str, mode: str = None) -> Entity:
         result = []
         mode = mode or self._get_mode()
         dto = self._dataset_dao.read_by_name_mode(name, mode)
         if dto:
-            result = self._oao.read(dto.oid)
+            result = self._load(dto.oid)
         return result
 
     def update(self, entity: Entity) -> None:
-        """Updates an entity in the database."""
-        for dataframe in entity.dataframes.values():
-            self._dataframe_dao.update(dataframe.as_dto())
+        """Updates an entity in the database. Only the dataframes added, modified or removed since
+        the dataset was last persisted are written."""
+        added, modified, removed = entity.get_changes()
+        for dataframe in added:
+            dataframe.parent = entity
+        dtos = self._dataframe_dao.create_many([dataframe.as_dto() for dataframe in added])
+        for dataframe, dto in zip(added, dtos):
+            dataframe.id = dto.id
+        self._dataframe_dao.update_many([dataframe.as_dto() for dataframe in modified])
+        for id in removed:
+            self._dataframe_dao.delete(id)
 
         self._dataset_dao.update(dto=entity.as_dto())   # Update Dataset metadata
         self._oao.update(entity)  # Persist dataset in object storage
+        entity.clear_changes()
+        self._context.identity_map.clean(entity)
 
     def remove(self, id: str) -> None:
         """Removes an entity (and its children) from repository."""
         dto = self._dataset_dao.read(id)
-        dataset = self._oao.read(dto.oid)
+        dataset = self._load(dto.oid)
         for dataframe in dataset.dataframes.values():
             self._dataframe_dao.delete(dataframe.id)
 
         self._dataset_dao.delete(id)   # Delete Dataset metadata
         self._oao.delete(dataset.oid)  # Delete dataset from object storage
+        self._context.identity_map.remove(dataset.oid)
 
     def exists(self, id: str) -> bool:
         """Returns True if entity with id exists in the repository."""
@@ -96,8 +119,8 @@ class DatasetRepo(RepoABC):
     def print(self) -> None:
         """Prints the repository contents as a DataFrame."""
         dtos = self._dataset_dao.read_all()
-        for dto in dtos.values():
-            dataset = self._oao.read(dto.oid)
+        datasets = self._oao.read_many([dto.oid for dto in dtos.values()])
+        for dataset in datasets.values():
             print("\n\n")
             print(dataset)
             print(120 * "=")
@@ -38,7 +38,7 @@ class DataSourceRepo(RepoABC):
         self._oao = self._context.get_oao()
 
     def __len__(self) -> int:
-        return len(self._datasource_dao.read_all())
+        return len(self._datasource_dao)
 
     def add(self, entity: Entity) -> Entity:
         """Adds an entity to the repository and returns the Entity with the id added."""
@@ -53,41 +53,62 @@ class DataSourceRepo(RepoABC):
             entity.update_url(datasource_url)
 
         self._oao.create(entity)
+        entity.clear_changes()
+        self._context.identity_map.clean(entity)
         return entity
 
     def get(self, id: str) -> Entity:
         "Returns an entity with the designated id"
-        result = []
-        dto = self._datasource_dao.read(id)
-        if dto:
-            result = self._oao.read(dto.oid)
+        result = self._context.identity_map.get_by_id(DataSource, id)
+        if result is None:
+            result = []
+            dto = self._datasource_dao.read(id)
+            if dto:
+                result = self._load(dto.oid)
         return result
 
+    def get_page(self, offset: int, limit: int) -> dict:
+        """Returns up to limit entities in id order, starting at offset, keyed by id. The
+        metadata is read in one query and the entities in one object store session."""
+        dtos = self._datasource_dao.read_page(offset, limit)
+        return self._load_many([dto.oid for dto in dtos.values()])
+
     def get_by_name_mode(self, name: str, mode: str = None) -> Entity:
         result = []
         mode = mode or self._get_mode()
         dto = self._datasource_dao.read_by_name_mode(name, mode)
         if dto:
-            result = self._oao.read(dto.oid)
+            result = self._load(dto.oid)
         return result
 
     def update(self, entity: Entity) -> None:
-        """Updates an entity in the database."""
-        for datasource_url in entity.urls.values():
-            self._datasource_url_dao.update(datasource_url.as_dto())
+        """Updates an entity in the database. Only the urls added, modified or removed since the
+        datasource was last persisted are written."""
+        added, modified, removed = entity.get_changes()
+        for datasource_url in added:
+            datasource_url.parent = entity
+        dtos = self._datasource_url_dao.create_many([datasource_url.as_dto() for datasource_url in added])
+        for datasource_url, dto in zip(added, dtos):
+            datasource_url.id = dto.id
+        self._datasource_url_dao.update_many([datasource_url.as_dto() for datasource_url in modified])
+        for id in removed:
+            self._datasource_url_dao.delete(id)
 
         self._datasource_dao.update(dto=entity.as_dto())   # Update DataSource metadata
         self._oao.update(entity)  # Persist datasource in object storage
+        entity.clear_changes()
+        self._context.identity_map.clean(entity)
 
     def remove(self, id: str) -> None:
         """Removes an entity (and its children) from repository."""
         dto = self._datasource_dao.read(id)
-        datasource = self._oao.read(dto.oid)
+        datasource = self._load(dto.oid)
         for datasource_url in datasource.urls.values():
             self._datasource_url_dao.delete(datasource_url.id)
 
         self._datasource_dao.delete(id)   # Delete DataSource metadata
         self._oao.delete(datasource.oid)  # Delete datasource from object storage
+        self._context.identity_map.remove(datasource.oid)
 
     def exists(self, id: str) -> bool:
         """Returns True if entity with id exists in the repository."""
@@ -96,8 +117,8 @@ class DataSourceRepo(RepoABC):
     def print(self) -> None:
         """Prints the repository contents as a DataSourceURL."""
         dtos = self._datasource_dao.read_all()
-        for dto in dtos.values():
-            datasource = self._oao.read(dto.oid)
+        datasources = self._oao.read_many([dto.oid for dto in dtos.values()])
+        for datasource in datasources.values():
             print("\n\n")
             print(datasource)
             print(120 * "=")
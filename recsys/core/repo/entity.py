@@ -17,7 +17,6 @@
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 """Entity Repository. Serves as generic repository supporting basic CRUD functionality."""
-import pandas as pd
 
 from recsys.core.entity.base import Entity
 from .base import RepoABC
@@ -38,43 +37,50 @@ class Repo(RepoABC):
         self._oao = self._context.get_oao()
 
     def __len__(self) -> int:
-        return len(self.get_all())
+        return len(self._dao)
 
     def add(self, entity: Entity) -> Entity:
         """Adds an entity to the repository and returns the Entity with the id added."""
         dto = self._dao.create(dto=entity.as_dto())
         entity.id = dto.id
         self._oao.create(entity)
+        self._context.identity_map.clean(entity)
         return entity
 
     def get(self, id: str) -> Entity:
         "Returns an entity with the designated id"
-        dto = self._dao.read(id)
-        return self._oao.read(dto.oid)
+        entity = self._context.identity_map.get_by_id(self._entity, id)
+        if entity is None:
+            dto = self._dao.read(id)
+            entity = self._load(dto.oid)
+        return entity
 
     def get_all(self) -> dict:
-        entities = {}
         dtos = self._dao.read_all()
-        for dto in dtos.values():
-            entity = self._oao.read(oid=dto.oid)
-            entities[entity.id] = entity
-        return entities
+        return self._load_many([dto.oid for dto in dtos.values()])
+
+    def get_page(self, offset: int, limit: int) -> dict:
+        """Returns up to limit entities in id order, starting at offset, keyed by id."""
+        dtos = self._dao.read_page(offset, limit)
+        return self._load_many([dto.oid for dto in dtos.values()])
 
     def get_by_name_mode(self, name: str, mode: str = None) -> Entity:
         mode = mode or self._get_mode()
         dto = self._dao.read_by_name_mode(name, mode)
-        return self._oao.read(dto.oid)
+        return self._load(dto.oid)
 
     def update(self, entity: Entity) -> None:
         """Updates an entity in the database."""
         self._dao.update(dto=entity.as_dto())
-        self._aoa.update(entity)
+        self._oao.update(entity)
+        self._context.identity_map.clean(entity)
 
     def remove(self, id: str) -> None:
         """Removes an entity (and its children) from repository."""
         dto = self._dao.read(id)
         self._dao.delete(id)
-        self._aoa.delete(dto.oid)
+        self._oao.delete(dto.oid)
+        self._context.identity_map.remove(dto.oid)
 
     def exists(self, id: str) -> bool:
         """Returns True if entity with id exists in the repository."""
@@ -82,12 +88,8 @@ class Repo(RepoABC):
 
     def print(self) -> None:
         """Prints the repository contents as a DataFrame."""
-        df = pd.DataFrame()
-        entities = self.get_all()
-        for entity in entities.values():
-            data = entity.as_dto().as_dict()
-            entity_df = pd.DataFrame(data=data, index=[entity.id])
-            df = pd.concat([df, entity_df], axis=0)
+        df = self._dao.read_all_frame().set_index("id", drop=False)
+        df.index.name = None
         print(120 * "=")
         print(40 * " ", f"\t\t{self._entity.__name__} Repository")
         print(120 * "_")
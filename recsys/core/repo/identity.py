@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /recsys/core/repo/identity.py                                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Tuesday January 17th 2023 07:52:13 am                                               #
+# Modified   : Tuesday January 17th 2023 07:52:13 am                                               #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Identity Map Module."""
+from datetime import datetime
+from typing import Dict, List, Set, Tuple, Union
+
+from recsys.core.entity.base import Entity
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        IDENTITY MAP                                              #
+# ------------------------------------------------------------------------------------------------ #
+class IdentityMap:
+    """Maps each oid to the single in-memory instance of the entity within a context.
+
+    Repositories register entities as they are added or loaded, and serve repeated reads from the
+    map without touching the databases. Mutations are detected from the entity's modified
+    timestamp, which the entity setters and aggregate methods advance: an entity is dirty when
+    its timestamp differs from the one recorded when it was last loaded or persisted. The
+    entities persisted since the last call to evict_written are tracked, so they can be evicted.
+    """
+
+    def __init__(self) -> None:
+        self._entities: Dict[str, Entity] = {}
+        self._ids: Dict[Tuple[type, int], str] = {}
+        self._versions: Dict[str, datetime] = {}
+        self._written: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __contains__(self, oid: str) -> bool:
+        return oid in self._entities
+
+    @property
+    def dirty(self) -> List[Entity]:
+        """Returns the mapped entities modified since they were loaded or last persisted."""
+        return [entity for oid, entity in self._entities.items() if entity.modified != self._versions[oid]]
+
+    def get(self, oid: str) -> Union[Entity, None]:
+        """Returns the mapped entity with the oid, or None if it hasn't been loaded."""
+        return self._entities.get(oid)
+
+    def get_by_id(self, entity: type(Entity), id: int) -> Union[Entity, None]:
+        """Returns the mapped entity of the type with the id, or None if it hasn't been loaded."""
+        oid = self._ids.get((entity, id))
+        return None if oid is None else self._entities[oid]
+
+    def add(self, entity: Entity) -> Entity:
+        """Maps a loaded entity and returns the instance for its oid. If the oid is already
+        mapped, the mapped instance is returned and the entity passed in is discarded."""
+        mapped = self._entities.get(entity.oid)
+        if mapped is None:
+            mapped = entity
+            self._map(entity)
+        return mapped
+
+    def clean(self, entity: Entity) -> None:
+        """Maps the entity as persisted, i.e. not dirty, replacing any instance with its oid."""
+        self._map(entity)
+        self._written.add(entity.oid)
+
+    def is_dirty(self, entity: Entity) -> bool:
+        """Returns True if the entity is mapped and was modified since it was loaded or persisted."""
+        return entity.oid in self._versions and entity.modified != self._versions[entity.oid]
+
+    def remove(self, oid: str) -> None:
+        """Removes the entity with the oid from the map."""
+        entity = self._entities.pop(oid, None)
+        if entity is not None:
+            self._ids.pop((type(entity), entity.id), None)
+            del self._versions[oid]
+        self._written.discard(oid)
+
+    def evict_written(self) -> None:
+        """Removes the entities persisted since the last eviction from the map."""
+        for oid in list(self._written):
+            self.remove(oid)
+
+    def clear(self) -> None:
+        """Removes all entities from the map."""
+        self._entities.clear()
+        self._ids.clear()
+        self._versions.clear()
+        self._written.clear()
+
+    def _map(self, entity: Entity) -> None:
+        self._entities[entity.oid] = entity
+        self._ids[(type(entity), entity.id)] = entity.oid
+        self._versions[entity.oid] = entity.modified
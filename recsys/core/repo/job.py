@@ -38,55 +38,78 @@ class JobRepo(RepoABC):
         self._oao = self._context.get_oao()
 
     def __len__(self) -> int:
-        return len(self._job_dao.read_all())
+        return len(self._job_dao)
 
     def add(self, entity: Entity) -> Entity:
         """Adds an entity to the repository and returns the Entity with the id added."""
         dto = self._job_dao.create(entity.as_dto())
         entity.id = dto.id
 
-        for name, task in entity.tasks.items():
+        tasks = list(entity.tasks.values())
+        for task in tasks:
             task.parent = entity
-            dto = self._task_dao.create(dto=task.as_dto())
+        dtos = self._task_dao.create_many([task.as_dto() for task in tasks])
+        for task, dto in zip(tasks, dtos):
             task.id = dto.id
             entity.update_task(task)
 
         self._oao.create(entity)
+        entity.clear_changes()
+        self._context.identity_map.clean(entity)
         return entity
 
     def get(self, id: str) -> Entity:
         "Returns an entity with the designated id"
-        result = []
-        dto = self._job_dao.read(id)
-        if dto:
-            result = self._oao.read(dto.oid)
+        result = self._context.identity_map.get_by_id(Job, id)
+        if result is None:
+            result = []
+            dto = self._job_dao.read(id)
+            if dto:
+                result = self._load(dto.oid)
         return result
 
+    def get_page(self, offset: int, limit: int) -> dict:
+        """Returns up to limit entities in id order, starting at offset, keyed by id. The
+        metadata is read in one query and the entities in one object store session."""
+        dtos = self._job_dao.read_page(offset, limit)
+        return self._load_many([dto.oid for dto in dtos.values()])
+
     def get_by_name_mode(self, name: str, mode: str = None) -> Entity:
         result = []
         mode = mode or self._get_mode()
         dto = self._job_dao.read_by_name_mode(name, mode)
         if dto:
-            result = self._oao.read(dto.oid)
+            result = self._load(dto.oid)
         return result
 
     def update(self, entity: Entity) -> None:
-        """Updates an entity in the database."""
-        for task in entity.tasks.values():
-            self._task_dao.update(task.as_dto())
+        """Updates an entity in the database. Only the tasks added, modified or removed since the
+        job was last persisted are written."""
+        added, modified, removed = entity.get_changes()
+        for task in added:
+            task.parent = entity
+        dtos = self._task_dao.create_many([task.as_dto() for task in added])
+        for task, dto in zip(added, dtos):
+            task.id = dto.id
+        self._task_dao.update_many([task.as_dto() for task in modified])
+        for id in removed:
+            self._task_dao.delete(id)
 
         self._job_dao.update(dto=entity.as_dto())   # Update job metadata
         self._oao.update(entity)  # Persist job in object storage
+        entity.clear_changes()
+        self._context.identity_map.clean(entity)
 
     def remove(self, id: str) -> None:
         """Removes an entity (and its children) from repository."""
         dto = self._job_dao.read(id)
-        job = self._oao.read(dto.oid)
+        job = self._load(dto.oid)
         for task in job.tasks.values():
             self._task_dao.delete(task.id)
 
         self._job_dao.delete(id)   # Delete job metadata
         self._oao.delete(job.oid)  # Delete job from object storage
+        self._context.identity_map.remove(job.oid)
 
     def exists(self, id: str) -> bool:
         """Returns True if entity with id exists in the repository."""
@@ -95,8 +118,8 @@ class JobRepo(RepoABC):
     def print(self) -> None:
         """Prints the repository contents as a DataFrame."""
         dtos = self._job_dao.read_all()
-        for dto in dtos.values():
-            job = self._oao.read(dto.oid)
+        jobs = self._oao.read_many([dto.oid for dto in dtos.values()])
+        for job in jobs.values():
             print("\n\n")
             print(job)
             print(120 * "=")
@@ -18,10 +18,12 @@
 # ================================================================================================ #
 """Unit of Work Module"""
 from abc import ABC, abstractmethod
+from typing import Dict, Tuple
 
 from recsys.core.entity.base import Entity
 from recsys.core.repo.context import Context
 from recsys.core.repo.entity import Repo
+from recsys.core.repo.identity import IdentityMap
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -40,6 +42,18 @@ class UnitOfWorkABC(ABC):  # pragma: no cover
     def get_repo(self, name) -> Repo:
         """Returns an instantiated file repository."""
 
+    @abstractmethod
+    def register_new(self, name: str, entity: Entity) -> None:
+        """Records an entity to be added to the named repository on save."""
+
+    @abstractmethod
+    def register_dirty(self, name: str, entity: Entity) -> None:
+        """Records an entity to be updated in the named repository on save."""
+
+    @abstractmethod
+    def register_removed(self, name: str, entity: Entity) -> None:
+        """Records an entity to be removed from the named repository on save."""
+
     @abstractmethod
     def save(self):
         """Save changes."""
@@ -55,6 +69,11 @@ class UnitOfWorkABC(ABC):  # pragma: no cover
 class UnitOfWork(UnitOfWorkABC):
     """Unit of Work object containing all Entity repositories and the current context entity.
 
+    Changes registered through register_new, register_dirty and register_removed are deferred
+    until save, when each entity is written once, in that order. Registering the same entity
+    repeatedly collapses into a single write, and dirty entities unchanged since they were
+    loaded or last persisted are skipped.
+
     Args:
         context (Context): Contains the database context in terms of Database Access Objects.
 
@@ -64,6 +83,10 @@ class UnitOfWork(UnitOfWorkABC):
         self._context = context
         self._in_transaction = False
         self._repos = {}
+        self._current_job = None
+        self._new: Dict[str, Tuple[str, Entity]] = {}
+        self._dirty: Dict[str, Tuple[str, Entity]] = {}
+        self._removed: Dict[str, Tuple[str, Entity]] = {}
 
     def register(self, name: str, repo: type(Repo), entity: type(Entity) = None) -> None:
         self._begin()
@@ -72,12 +95,67 @@ class UnitOfWork(UnitOfWorkABC):
     def get_repo(self, name) -> Repo:
         return self._repos[name]
 
+    @property
+    def identity_map(self) -> IdentityMap:
+        """Returns the map of entities loaded in this unit of work."""
+        return self._context.identity_map
+
+    @property
+    def current_job(self) -> Entity:
+        """Returns the job of the pipeline running in this unit of work."""
+        return self._current_job
+
+    @current_job.setter
+    def current_job(self, job: Entity) -> None:
+        self._current_job = job
+
+    def register_new(self, name: str, entity: Entity) -> None:
+        """Records an entity to be added to the named repository on save."""
+        self._removed.pop(entity.oid, None)
+        self._new[entity.oid] = (name, entity)
+
+    def register_dirty(self, name: str, entity: Entity) -> None:
+        """Records an entity to be updated in the named repository on save. Entities pending
+        addition are written by the add, with their latest state."""
+        if entity.oid not in self._new and entity.oid not in self._removed:
+            self._dirty[entity.oid] = (name, entity)
+
+    def register_removed(self, name: str, entity: Entity) -> None:
+        """Records an entity to be removed from the named repository on save. Entities pending
+        addition are simply forgotten."""
+        self._dirty.pop(entity.oid, None)
+        if self._new.pop(entity.oid, None) is None:
+            self._removed[entity.oid] = (name, entity)
+
     def save(self) -> None:
+        """Writes the registered changes and commits them."""
+        self._flush()
         self._context.save()
 
     def rollback(self) -> None:
+        """Discards the registered changes and rolls back the context."""
+        self._clear()
         self._context.rollback()
 
+    def _flush(self) -> None:
+        """Writes new, dirty and removed entities, in that order, skipping dirty entities that
+        haven't changed since they were loaded or last persisted."""
+        identity_map = self._context.identity_map
+        for name, entity in self._new.values():
+            self._repos[name].add(entity)
+        for name, entity in self._dirty.values():
+            if entity.oid not in identity_map or identity_map.is_dirty(entity):
+                self._repos[name].update(entity)
+        for name, entity in self._removed.values():
+            self._repos[name].remove(entity.id)
+        self._clear()
+
+    def _clear(self) -> None:
+        """Forgets the registered changes."""
+        self._new.clear()
+        self._dirty.clear()
+        self._removed.clear()
+
     def _begin(self) -> None:
         """Begins a transaction if not already in one."""
         if not self._in_transaction:
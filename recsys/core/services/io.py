@@ -23,6 +23,7 @@ import logging
 import yaml
 import pickle
 import pandas as pd
+import pyarrow.feather as feather
 from typing import Any, Union, List
 
 # ------------------------------------------------------------------------------------------------ #
@@ -198,12 +199,38 @@ class PickleIO(IO):
                 f.close()
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                                        FEATHER                                                   #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class FeatherIO(IO):
+    """Reads and writes pandas DataFrames in the Arrow IPC (Feather V2) file format.
+
+    With memory_map=True, the file is memory-mapped and numeric columns without nulls are returned
+    as read-only, zero-copy views of the mapped file. This requires an uncompressed file written
+    as a single record batch, i.e. chunksize >= the number of rows.
+    """
+
+    @classmethod
+    def _read(cls, filepath: str, columns: List[str] = None, memory_map: bool = False, **kwargs) -> pd.DataFrame:
+        if memory_map:
+            table = feather.read_table(filepath, columns=columns, memory_map=True)
+            return table.to_pandas(split_blocks=True, self_destruct=False)
+        return feather.read_feather(filepath, columns=columns)
+
+    @classmethod
+    def _write(cls, filepath: str, data: pd.DataFrame, compression: str = "uncompressed", chunksize: int = None, **kwargs) -> None:
+        feather.write_feather(data, filepath, compression=compression, chunksize=chunksize)
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                                       IO SERVICE                                                 #
 # ------------------------------------------------------------------------------------------------ #
 class IOService:
 
-    __io = {"csv": CSVIO, "yaml": YamlIO, "yml": YamlIO, "pkl": PickleIO, "pickle": PickleIO, "xlsx": ExcelIO, "xls": ExcelIO}
+    __io = {"csv": CSVIO, "yaml": YamlIO, "yml": YamlIO, "pkl": PickleIO, "pickle": PickleIO, "xlsx": ExcelIO, "xls": ExcelIO,
+            "feather": FeatherIO, "arrow": FeatherIO}
     _logger = logging.getLogger(
         f"{__module__}.{__name__}",
     )
@@ -86,10 +86,12 @@ class Operator(ABC):
         return task
 
     def _teardown(self, task: Task) -> None:
-        """Sets task state and updates the job object."""
+        """Sets task state and registers the job as changed. The write is deferred until the
+        unit of work is saved, so a job's tasks are persisted once per pipeline."""
         # Set task state to COMPLETE
         task.state = STATES[-1]
         self._uow.current_job.update_task(task)
+        self._uow.register_dirty("job", self._uow.current_job)
 
     def _get_dataset(self) -> pd.DataFrame:
         """Retrieves a pandas DataFrame from the Dataset repository."""
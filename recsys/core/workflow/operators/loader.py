@@ -55,7 +55,7 @@ class FileLoader(Operator):
         self._teardown(task)
 
     def _put_file(self, file: File) -> None:
-        self._uow.file.create(file)
+        self._uow.file.add(file)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -114,9 +114,10 @@ class Pipeline:
         self._uow.current_job = job
 
     def _teardown(self) -> None:
-        """Updates job with final state and persists it."""
+        """Updates job with final state and persists it with the changes made by the operators."""
         self._uow.current_job.state = STATES[-1]
-        self._uow.job.update(self._uow.current_job)
+        self._uow.register_dirty("job", self._uow.current_job)
+        self._uow.save()
         self._logger.debug(f"Just updated the following job:\n{self._uow.current_job}")
 
     def as_job(self) -> Job:
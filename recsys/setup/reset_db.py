@@ -19,7 +19,7 @@
 """Drops all databases and tables, and brings state to zero."""
 from dependency_injector.wiring import Provide, inject
 
-from recsys.core.dal.dba import DBA, ODBA
+from recsys.core.dal.dba import DBA, ODBA, Migrator
 from recsys.containers import Recsys
 
 
@@ -93,6 +93,12 @@ def build_profile_table(task_table: DBA = Provide[Recsys.dba.profile]) -> None:
     assert task_table.exists()
 
 
+# ------------------------------------------------------------------------------------------------ #
+@inject
+def migrate_rdb(migrator: Migrator = Provide[Recsys.dba.migrator]) -> None:
+    migrator.migrate()
+
+
 # ------------------------------------------------------------------------------------------------ #
 @inject
 def build_object_db(odb: ODBA = Provide[Recsys.dba.object]) -> None:
@@ -116,6 +122,7 @@ def rebuild():
     build_job_table()
     build_task_table()
     build_profile_table()
+    migrate_rdb()
     build_object_db()
 
 
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /tests/test_core/test_dal/test_mapper.py                                            #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday January 16th 2023 09:27:54 am                                                #
+# Modified   : Monday January 16th 2023 09:27:54 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from dataclasses import fields
+from datetime import datetime
+import pytest
+import logging
+
+from recsys.core.dal.dto import TaskDTO
+from recsys.core.dal.mapper import RowMapper
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+TASK = TaskDTO(
+    id=1,
+    oid="task_1",
+    name="task",
+    description="Task mapped from a row.",
+    mode="test",
+    state="CREATED",
+    parent_id=2,
+    created=datetime.now(),
+    modified=datetime.now(),
+)
+
+
+def describe(columns: list) -> tuple:
+    """Returns a DB-API cursor description for the column names."""
+    return tuple((name, None, None, None, None, None, None) for name in columns)
+
+
+class TestRowMapper:  # pragma: no cover
+
+    # ============================================================================================ #
+    def test_order(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        mapper = RowMapper(TaskDTO)
+        columns = [field.name for field in fields(TaskDTO)]
+        row = tuple(getattr(TASK, name) for name in columns)
+        dto = mapper(describe(columns))(row)
+        assert dto == TASK
+
+        # Columns are bound by name, so a different column order yields the same DTO.
+        columns.reverse()
+        row = tuple(getattr(TASK, name) for name in columns)
+        dto = mapper(describe(columns))(row)
+        assert dto == TASK
+
+        # Extra columns are ignored.
+        dto = mapper(describe(columns + ["extra"]))(row + ("extra",))
+        assert dto == TASK
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_cache(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        mapper = RowMapper(TaskDTO)
+        columns = [field.name for field in fields(TaskDTO)]
+        assert mapper(describe(columns)) is mapper(describe(columns))
+        assert mapper(describe(columns)) is not mapper(describe(columns[::-1]))
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_missing(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        mapper = RowMapper(TaskDTO)
+        columns = [field.name for field in fields(TaskDTO) if field.name != "parent_id"]
+        with pytest.raises(ValueError):
+            mapper(describe(columns))
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /tests/test_core/test_dal/test_oao.py                                               #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday January 13th 2023 08:02:51 am                                                #
+# Modified   : Friday January 13th 2023 08:02:51 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+import pandas as pd
+
+from recsys.core.dal.cache import EntityCache
+from recsys.core.entity.dataset import Dataset
+from recsys.core.entity.file import File
+
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.oao
+class TestOAO:  # pragma: no cover
+
+    # ============================================================================================ #
+    def test_entity_cache(self, container, files, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        container.database.odb().drop()
+        oao = container.dal.object()
+        cache = oao.cache
+        cache.clear()
+        for file in files:
+            oao.create(file)
+
+        hits, misses = cache.hits, cache.misses
+        for file in files:
+            f1 = oao.read(file.oid)
+            f2 = oao.read(file.oid)
+            assert f1 == file
+            assert f2 is f1
+        assert cache.hits == hits + len(files)
+        assert cache.misses == misses + len(files)
+        assert len(cache) == len(files)
+
+        # Updates and deletes invalidate the cached entity.
+        f1 = oao.read(files[0].oid)
+        f1.task_id = 999
+        oao.update(f1)
+        f2 = oao.read(files[0].oid)
+        assert f2 is not f1
+        assert f2.task_id == 999
+
+        oao.delete(files[1].oid)
+        assert oao.read(files[1].oid) == []
+
+        # Rollback discards entities read or written in the transaction.
+        oao.begin()
+        f1 = oao.read(files[2].oid)
+        f1.task_id = 777
+        oao.update(f1)
+        assert oao.read(files[2].oid).task_id == 777
+        oao.rollback()
+        assert oao.read(files[2].oid).task_id != 777
+        container.database.odb().drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_entity_cache_eviction(self, files, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        cache = EntityCache(max_size=3)
+        for file in files:
+            cache.put(file.oid, file, 1000)
+        # Least recently used entities are evicted first.
+        assert len(cache) == 3
+        assert cache.get(files[0].oid) is None
+        assert cache.get(files[2].oid) is files[2]
+        cache.put(files[0].oid, files[0], 1000)
+        assert cache.get(files[3].oid) is None
+        assert cache.get(files[2].oid) is files[2]
+
+        # Byte-based eviction.
+        nbytes = cache.nbytes // len(cache)
+        cache = EntityCache(max_size=100, max_bytes=int(nbytes * 2.5))
+        for file in files:
+            cache.put(file.oid, file, 1000)
+        assert len(cache) == 2
+        assert cache.nbytes <= int(nbytes * 2.5)
+
+        cache.invalidate(files[4].oid)
+        assert cache.get(files[4].oid) is None
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.nbytes == 0
+
+        # Datasets aren't cached: their payloads load after the stored value is read.
+        dataset = Dataset(name="cached_dataset", datasource_id=1, stage="raw", mode="test",
+                          data=pd.DataFrame({"a": [1, 2, 3]}))
+        cache.put(dataset.oid, dataset, 1000)
+        assert cache.get(dataset.oid) is None
+
+        # A zero size disables the cache.
+        cache = EntityCache(max_size=0)
+        cache.put(files[0].oid, files[0], 1000)
+        assert cache.get(files[0].oid) is None
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_read_many(self, container, files, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        container.database.odb().drop()
+        oao = container.dal.object()
+        oao.cache.clear()
+        oao.create_many(files)
+        oids = [file.oid for file in files]
+
+        misses = oao.cache.misses
+        entities = oao.read_many(oids)
+        assert list(entities.keys()) == oids
+        assert oao.cache.misses == misses + len(files)
+        hits = oao.cache.hits
+        assert oao.read_many(oids) == entities
+        assert oao.cache.hits == hits + len(files)
+
+        for i, file in enumerate(files, start=1):
+            file.task_id = i + 500
+        oao.update_many(files)
+        for i, entity in enumerate(oao.read_many(oids).values(), start=1):
+            assert entity.task_id == i + 500
+        container.database.odb().drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_read_by(self, container, files, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        container.database.odb().drop()
+        oao = container.dal.object()
+        oao.create_many(files)
+
+        entities = oao.read_by(entity=File, datasource_id=2)
+        assert list(entities.keys()) == sorted([files[1].oid, files[4].oid])
+        assert oao.read_by_name_mode(files[2].name, "test") == files[2]
+        assert oao.read_by_name_mode(files[2].name, "test", entity=File) == files[2]
+        assert oao.read_by_name_mode("missing", "test") == []
+        container.database.odb().drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /tests/test_core/test_dal/test_schema.py                                            #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday January 15th 2023 10:03:21 am                                                #
+# Modified   : Sunday January 15th 2023 10:03:21 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+from recsys.core.dal.dba import DBA, Migrator
+from recsys.core.dal.sql.dataframe import DataFrameDDL
+from recsys.core.dal.sql.file import FileDDL
+from recsys.core.dal.sql.schema import SchemaVersionDDL
+from recsys.core.dal.sql.task import TaskDDL, TaskDML
+from recsys.core.database.relational import Database, SQLiteConnection
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+LOCATION = "tests/data/sqlite/schema.sqlite3"
+# SQLite doesn't re-prepare cached EXPLAIN statements after a schema change, so plans are read
+# through a connection without a statement cache.
+DATABASE = Database(connection=SQLiteConnection(location=LOCATION, cached_statements=0))
+LEGACY_TASK_TABLE = """CREATE TABLE IF NOT EXISTS task (id MEDIUMINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), mode VARCHAR(32) NOT NULL, state VARCHAR(32), parent_id MEDIUMINT NOT NULL, created DATETIME, modified DATETIME, UNIQUE(name, mode));"""
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+def explain(sql: str, args: tuple) -> str:
+    """Returns the SQLite query plan of a statement as a single string."""
+    rows = DATABASE.select_all(f"EXPLAIN QUERY PLAN {sql}", args)
+    return " ".join(row[-1] for row in rows)
+
+
+@pytest.mark.database
+class TestSchema:  # pragma: no cover
+
+    # ============================================================================================ #
+    def test_setup(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        for ddl in (SchemaVersionDDL(), TaskDDL(), DataFrameDDL(), FileDDL()):
+            dba = DBA(ddl=ddl, database=DATABASE)
+            dba.reset()
+            assert dba.exists()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_migrate(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        migrator = Migrator(database=DATABASE)
+        assert migrator.version == 0
+        assert migrator.migrate(target=1) == [1]
+        assert migrator.version == 1
+        assert migrator.migrate() == [2]
+        assert migrator.version == 2
+        # Migrating an up to date schema is a no-op.
+        assert migrator.migrate() == []
+        assert migrator.version == 2
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_explain(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        assert "USING INDEX ix_task_parent_id" in explain("SELECT * FROM task WHERE parent_id = %s;", (1,))
+        assert "USING INDEX ix_task_oid" in explain("SELECT * FROM task WHERE oid = %s;", ("task_1",))
+        assert "USING INDEX sqlite_autoindex_task_1" in explain(TaskDML.select_by_name_mode.sql, ("task", "test"))
+        assert "USING INDEX ix_dataframe_parent_id" in explain("SELECT * FROM dataframe WHERE parent_id = %s;", (1,))
+        assert "USING INDEX ix_file_task_id" in explain("SELECT * FROM file WHERE task_id = %s;", (1,))
+        assert "USING INDEX ix_file_datasource_id" in explain("SELECT * FROM file WHERE datasource_id = %s;", (1,))
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_legacy(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # A task table created before the indexes were added to the DDL.
+        DATABASE.drop(sql=TaskDDL.drop.sql)
+        DATABASE.drop(sql=SchemaVersionDDL.drop.sql)
+        DATABASE.create(sql=LEGACY_TASK_TABLE)
+        assert "SCAN task" in explain("SELECT * FROM task WHERE parent_id = %s;", (1,))
+
+        migrator = Migrator(database=DATABASE)
+        assert migrator.migrate() == [1, 2]
+        assert "USING INDEX ix_task_parent_id" in explain("SELECT * FROM task WHERE parent_id = %s;", (1,))
+        assert "USING INDEX ix_task_oid" in explain("SELECT * FROM task WHERE oid = %s;", ("task_1",))
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -408,3 +408,223 @@ class TestTaskDAO:  # pragma: no cover
 
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_create_many(self, container, jobs, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dao = self.get_dao(container)
+        dao.begin()
+        dtos = dao.create_many([task.as_dto() for task in jobs[2].tasks.values()])
+        ids = [dto.id for dto in dtos]
+        assert ids == list(range(ids[0], ids[0] + 5))
+        for dto in dtos:
+            assert dao.exists(dto.id)
+            assert dao.read(dto.id).name == dto.name
+
+        dao.rollback()
+
+        for id in ids:
+            assert not dao.exists(id)
+
+        assert dao.create_many([]) == []
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_update_many(self, container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dao = self.get_dao(container)
+        dao.begin()
+        dtos = dao.read_all()
+        for dto in dtos.values():
+            dto.state = "COMPLETE"
+        assert dao.update_many(list(dtos.values())) == len(dtos)
+
+        dao.rollback()
+
+        for dto in dao.read_all().values():
+            assert not dto.state == "COMPLETE"
+
+        dao.begin()
+        dao.update_many(list(dtos.values()))
+        dao.save()
+
+        for dto in dao.read_all().values():
+            assert dto.state == "COMPLETE"
+
+        # Rows not found in the database are an error.
+        dto = list(dtos.values())[0]
+        dto.id = 99999
+        with pytest.raises(mysql.connector.ProgrammingError):
+            dao.update_many([dto])
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_upsert(self, container, jobs, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dao = self.get_dao(container)
+        dao.begin()
+        dto = dao.read(8)
+        id = dto.id
+        dto.id = None
+        dto.state = "UPSERTED"
+        dto = dao.upsert(dto)
+        assert dto.id == id
+        assert dao.read(id).state == "UPSERTED"
+
+        dto = dao.upsert(jobs[3].tasks["task_1_job_4"].as_dto())
+        assert dto.id != id
+        assert dao.read(dto.id).name == "task_1_job_4"
+
+        dao.rollback()
+
+        assert not dao.read(id).state == "UPSERTED"
+        assert not dao.exists(dto.id)
+
+        with pytest.raises(mysql.connector.ProgrammingError):
+            dao.delete(8938)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_count(self, container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dao = self.get_dao(container)
+        assert dao.count() == 5
+        assert len(dao) == 5
+
+        dao.begin()
+        dao.delete(9)
+        assert len(dao) == 4
+        dao.rollback()
+        assert len(dao) == 5
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_iter_all(self, container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dao = self.get_dao(container)
+        dtos = dao.read_all()
+        streamed = list(dao.iter_all(batch_size=2))
+        assert len(streamed) == len(dtos)
+        for dto in streamed:
+            assert dto == dtos[dto.id]
+
+        for parent_id in {dto.parent_id for dto in dtos.values()}:
+            expected = dao.read_by_parent_id(parent_id)
+            streamed = {dto.id: dto for dto in dao.iter_by_parent_id(parent_id, batch_size=2)}
+            assert streamed == expected
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -16,18 +16,37 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
+import os
 import inspect
+import shelve
+import sqlite3
+import threading
+import multiprocessing
 from datetime import datetime
 import pytest
 import logging
+import numpy as np
+import pandas as pd
+from unittest import mock
+
+from recsys.core.database.backend import ShelveBackend, SQLiteBackend
+from recsys.core.database.object import ObjectDBConnection, ObjectDB, WriteLock
+from recsys.core.database.serializer import Serializer
+from recsys.core.entity.dataset import Dataset, DataFrame
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
+PERSISTENT_LOCATION = "tests/data/odb/persistent/recsys.object_db"
 # ------------------------------------------------------------------------------------------------ #
 double_line = f"\n{100 * '='}"
 single_line = f"\n{100 * '-'}"
 
 
+def insert(location: str, entity) -> None:
+    """Inserts an entity from a forked process."""
+    ObjectDB(connection=ObjectDBConnection(location=location, backend="shelve")).insert(entity)
+
+
 @pytest.mark.odb
 class TestODB:  # pragma: no cover
     # ============================================================================================ #
@@ -637,3 +656,724 @@ class TestODB:  # pragma: no cover
 
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_persistent_cursor(self, files, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        connection = ObjectDBConnection(location=PERSISTENT_LOCATION, persistent=True)
+        db = ObjectDB(connection=connection)
+        db.drop()
+
+        for file in files:
+            db.insert(file)
+            assert db.exists(file.oid)
+            assert connection.storage.is_open
+
+        db.begin()
+        for i, file in enumerate(files, start=1):
+            file.task_id = i + 200
+            db.update(file)
+        db.save()
+        assert connection.storage.is_open
+        db.close()
+        assert not connection.storage.is_open
+
+        # Reopen with a per-call cursor and confirm changes were flushed.
+        db = ObjectDB(connection=ObjectDBConnection(location=PERSISTENT_LOCATION, persistent=False))
+        for i, file in enumerate(files, start=1):
+            f2 = db.select(file.oid)
+            assert f2 == file
+            assert f2.task_id == i + 200
+        db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_dataframe_payload(self, container, datasets, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = container.database.odb()
+        db.drop()
+
+        for dataset in datasets:
+            db.insert(dataset)
+            for dataframe in dataset.dataframes.values():
+                assert os.path.exists(dataframe.payload_uri)
+
+        for i, dataset in enumerate(datasets, start=1):
+            d2 = db.select(dataset.oid)
+            for name, dataframe in d2.dataframes.items():
+                # Payloads are not read with the entity metadata.
+                assert not dataframe.is_loaded
+                assert dataframe.payload_uri == dataset.get_dataframe(name).payload_uri
+
+            # Metadata-only updates leave the payload files untouched.
+            mtimes = {name: os.path.getmtime(dataframe.payload_uri) for name, dataframe in d2.dataframes.items()}
+            d2.task_id = i + 300
+            db.update(d2)
+            for name, dataframe in d2.dataframes.items():
+                assert not dataframe.is_loaded
+                assert os.path.getmtime(dataframe.payload_uri) == mtimes[name]
+
+            d3 = db.select(dataset.oid)
+            assert d3.task_id == i + 300
+            for name, dataframe in d3.dataframes.items():
+                assert dataframe.data.equals(dataset.get_dataframe(name).data)
+
+        for dataset in datasets:
+            db.delete(dataset.oid)
+            for dataframe in dataset.dataframes.values():
+                assert not os.path.exists(dataframe.payload_uri)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_memory_mapped_payload(self, datasets, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        location = "tests/data/odb/memory_map/recsys.object_db"
+        db = ObjectDB(connection=ObjectDBConnection(location=location, persistent=True, memory_map=True))
+        db.drop()
+
+        for dataset in datasets:
+            db.insert(dataset)
+
+        for dataset in datasets:
+            d2 = db.select(dataset.oid)
+            for name, dataframe in d2.dataframes.items():
+                assert dataframe.memory_map
+                assert not dataframe.is_loaded
+                assert dataframe.data.equals(dataset.get_dataframe(name).data)
+                # Numeric columns are read-only views of the mapped payload file.
+                for column in dataframe.data.select_dtypes("number").columns:
+                    assert not dataframe.data[column].values.flags.writeable
+
+        db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_payload_files(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        location = "tests/data/odb/payload/recsys.object_db"
+        db = ObjectDB(connection=ObjectDBConnection(location=location, persistent=True))
+        db.drop()
+        dataset = Dataset(name=inspect.stack()[0][3], description="Payload files", datasource_id=1, stage="extract", mode="test")
+        # Arrow can't convert mixed-type object columns. These are pickled.
+        dataset.add_dataframe(DataFrame(name="mixed", data=pd.DataFrame({"a": [1, "x", 3.5]}), parent=dataset, stage="extract"))
+        dataset.add_dataframe(DataFrame(name="numeric", data=pd.DataFrame({"a": [1, 2, 3]}), parent=dataset, stage="extract"))
+        db.insert(dataset)
+        assert dataset.get_dataframe("mixed").payload_uri.endswith(".pkl")
+        assert dataset.get_dataframe("numeric").payload_uri.endswith(".arrow")
+        directory = os.path.dirname(dataset.get_dataframe("numeric").payload_uri)
+
+        # Payloads changed in place are saved. The replaced file is removed once the write is committed.
+        d2 = db.select(dataset.oid)
+        d2.get_dataframe("numeric").data.loc[0, "a"] = 100
+        uris = {name: dataframe.payload_uri for name, dataframe in d2.dataframes.items()}
+        with mock.patch.object(SQLiteBackend, "commit", side_effect=sqlite3.OperationalError("disk I/O error")):
+            with pytest.raises(sqlite3.OperationalError):
+                db.update(d2)
+        assert os.path.exists(uris["numeric"])
+        db.update(d2)
+        assert not os.path.exists(uris["numeric"])
+        assert d2.get_dataframe("mixed").payload_uri == uris["mixed"]
+        assert sorted(os.listdir(directory)) == sorted(os.path.basename(df.payload_uri) for df in d2.dataframes.values())
+
+        d3 = db.select(dataset.oid)
+        assert d3.get_dataframe("numeric").data["a"].tolist() == [100, 2, 3]
+        assert d3.get_dataframe("mixed").data["a"].tolist() == [1, "x", 3.5]
+
+        db.delete(dataset.oid)
+        assert os.listdir(directory) == []
+        db.close()
+        db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_sqlite_backend(self, files, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        location = "tests/data/odb/sqlite/recsys.object_db"
+        writer = ObjectDB(connection=ObjectDBConnection(location=location, persistent=True, backend="sqlite"))
+        reader = ObjectDB(connection=ObjectDBConnection(location=location, persistent=True, backend="sqlite"))
+        writer.drop()
+
+        writer.begin()
+        for file in files:
+            writer.insert(file)
+            # Uncommitted writes are invisible to other readers.
+            assert not reader.exists(file.oid)
+        writer.save()
+
+        # The transaction is visible in full once committed.
+        for file in files:
+            assert reader.select(file.oid) == file
+
+        writer.begin()
+        for file in files:
+            writer.delete(file.oid)
+        writer.rollback()
+        for file in files:
+            assert reader.exists(file.oid)
+
+        # A persistent handle is usable from other threads.
+        found = []
+        thread = threading.Thread(target=lambda: found.extend(reader.exists(file.oid) for file in files))
+        thread.start()
+        thread.join()
+        assert found == [True] * len(files)
+
+        reader.close()
+        writer.close()
+        writer.drop()
+        assert not writer.database_exists()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_shelve_migration(self, files, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        location = "tests/data/odb/migration/recsys.object_db"
+        legacy = ShelveBackend(location)
+        legacy.drop()
+        # A legacy store holds entities pickled by shelve itself, without a secondary index.
+        os.makedirs(os.path.dirname(location), exist_ok=True)
+        with shelve.open(location) as shelf:
+            for file in files:
+                shelf[file.oid] = file
+
+        odb = ObjectDB(connection=ObjectDBConnection(location=location, backend="sqlite"))
+        odb.drop()
+        assert not odb.database_exists()
+        for file in files:
+            assert odb.select(file.oid) == file
+        assert odb.database_exists()
+        assert odb.find(entity="File", name=files[0].name) == [files[0].oid]
+
+        # The migration runs once. Entities deleted from the new store stay deleted.
+        odb.delete(files[0].oid)
+        odb = ObjectDB(connection=ObjectDBConnection(location=location, backend="sqlite"))
+        assert not odb.exists(files[0].oid)
+
+        # Opened with the shelve backend, the legacy store is indexed once.
+        shelf = ObjectDB(connection=ObjectDBConnection(location=location, backend="shelve"))
+        assert shelf.find(entity="File", name=files[0].name) == [files[0].oid]
+        assert shelf.select(files[0].oid) == files[0]
+
+        # The shelve backend reads legacy values as well.
+        legacy.open()
+        assert legacy[files[1].oid] == files[1]
+        assert legacy.read(files[1].oid)[1] is None
+        legacy.close()
+
+        odb.drop()
+        legacy.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_transaction_cache(self, files, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        connection = ObjectDBConnection(location=PERSISTENT_LOCATION, persistent=True)
+        db = ObjectDB(connection=connection)
+        db.drop()
+        for file in files:
+            db.insert(file)
+
+        # Only written oids are staged; deletes are tombstones.
+        db.begin()
+        files[0].task_id = 500
+        db.update(files[0])
+        db.delete(files[1].oid)
+        assert connection.cache.changes == {files[0].oid: files[0], files[1].oid: None}
+        assert not db.exists(files[1].oid)
+        assert db.select(files[1].oid) == []
+        assert db.select(files[2].oid) == files[2]
+
+        # Rollback discards the cache.
+        db.rollback()
+        assert connection.cache.changes == {}
+        assert db.exists(files[1].oid)
+        assert db.select(files[0].oid).task_id != 500
+
+        db.begin()
+        db.update(files[0])
+        db.delete(files[1].oid)
+        db.save()
+        assert connection.cache.changes == {}
+        assert db.select(files[0].oid).task_id == 500
+        assert not db.exists(files[1].oid)
+        db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_select_insert_update_many(self, container, files, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = container.database.odb()
+        db.drop()
+        oids = [file.oid for file in files]
+
+        db.insert_many(files)
+        entities = db.select_many(oids + ["file_missing_test"])
+        assert list(entities.keys()) == oids
+        for file in files:
+            assert entities[file.oid] == file
+
+        # Nothing is written if any entity already exists.
+        with pytest.raises(FileExistsError):
+            db.insert_many(files)
+
+        for i, file in enumerate(files, start=1):
+            file.task_id = i + 400
+        db.update_many(files)
+        for i, entity in enumerate(db.select_many(oids).values(), start=1):
+            assert entity.task_id == i + 400
+
+        # Transactions see their own uncommitted changes.
+        db.begin()
+        db.delete(files[0].oid)
+        files[1].task_id = 999
+        db.update_many(files[1:2])
+        entities = db.select_many(oids)
+        assert files[0].oid not in entities
+        assert entities[files[1].oid].task_id == 999
+        db.rollback()
+        assert len(db.select_many(oids)) == len(files)
+        db.drop()
+        with pytest.raises(FileNotFoundError):
+            db.update_many(files)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_serializer(self, files, datasets, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        for compression in ["none", "zlib", "zstd", "lz4"]:
+            serializer = Serializer(protocol=5, compression=compression, threshold=1024)
+            for dataset in datasets:
+                data = serializer.dumps(dataset)
+                assert serializer.loads(data) == dataset
+            # Values below the threshold are not compressed.
+            assert serializer.loads(serializer.dumps(files[0])) == files[0]
+            assert serializer.dumps(files[0])[:1] == b"\x00"
+
+        # Out-of-band buffers are compressed with the pickle stream.
+        serializer = Serializer(protocol=5, compression="zlib", threshold=0)
+        data = serializer.dumps(datasets[0])
+        assert len(data) < len(Serializer(protocol=5).dumps(datasets[0]))
+
+        location = "tests/data/odb/serializer/recsys.object_db"
+        db = ObjectDB(connection=ObjectDBConnection(location=location, persistent=True, serializer=serializer))
+        db.drop()
+        for file in files:
+            db.insert(file)
+        for file in files:
+            assert db.select(file.oid) == file
+        db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_serializer_writable(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = pd.DataFrame({"a": np.arange(10000, dtype=np.int64), "b": np.linspace(0, 1, 10000)})
+        for compression in ["none", "zlib"]:
+            serializer = Serializer(protocol=5, compression=compression, threshold=1024)
+            loaded = serializer.loads(serializer.dumps(data))
+            assert loaded.equals(data)
+            # Arrays loaded from out-of-band buffers are writable.
+            loaded.loc[0, "a"] = -1
+            loaded["b"] *= 2
+            assert loaded.loc[0, "a"] == -1
+            assert loaded["b"].iloc[-1] == 2
+            assert data.loc[0, "a"] == 0
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_secondary_index(self, files, datasets, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        location = "tests/data/odb/index/recsys.object_db"
+        for backend in ["sqlite", "shelve"]:
+            db = ObjectDB(connection=ObjectDBConnection(location=location, persistent=True, backend=backend))
+            db.drop()
+            for dataset in datasets:
+                db.insert(dataset)
+            for file in files:
+                db.insert(file)
+
+            assert db.find(entity=Dataset, stage="extract", mode="test") == sorted(dataset.oid for dataset in datasets)
+            assert db.find(entity="File", datasource_id=1) == sorted([files[0].oid, files[3].oid])
+            assert db.find(task_id=files[2].task_id) == [files[2].oid]
+            assert len(db.find(mode="test")) == len(datasets) + len(files)
+            with pytest.raises(ValueError):
+                db.find(uri="x")
+
+            # Updates and deletes maintain the index.
+            datasets[0].task_id = 701
+            db.update(datasets[0])
+            assert db.find(entity=Dataset, task_id=701) == [datasets[0].oid]
+            db.delete(files[0].oid)
+            assert db.find(entity="File", datasource_id=1) == [files[3].oid]
+
+            # Transactions see their uncommitted changes.
+            db.begin()
+            db.insert(files[0])
+            db.delete(files[3].oid)
+            assert db.find(entity="File", datasource_id=1) == [files[0].oid]
+            db.rollback()
+            assert db.find(entity="File", datasource_id=1) == [files[3].oid]
+
+            db.reindex()
+            assert db.find(entity=Dataset, task_id=701) == [datasets[0].oid]
+            db.close()
+            db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_scan(self, files, datasets, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        location = "tests/data/odb/scan/recsys.object_db"
+        for backend in ["sqlite", "shelve"]:
+            connection = ObjectDBConnection(location=location, persistent=False, backend=backend)
+            db = ObjectDB(connection=connection)
+            db.drop()
+            db.insert_many(datasets)
+            db.insert_many(files)
+
+            oids = sorted(dataset.oid for dataset in datasets)
+            assert sorted(db.scan(prefix="dataset_", batch_size=2, keys_only=True)) == oids
+            assert sorted(entity.oid for entity in db.scan(prefix="dataset_", batch_size=2)) == oids
+            assert len(list(db.scan(batch_size=3))) == len(datasets) + len(files)
+            for oid, headers in db.scan(prefix="file_", headers=True):
+                assert headers["entity"] == "File"
+                assert headers["mode"] == "test"
+            assert list(db.scan(prefix="job_")) == []
+
+            # The scan is lazy: a closed generator leaves the store closed.
+            items = db.scan(batch_size=1)
+            assert next(items) is not None
+            items.close()
+            assert not connection.storage.is_open
+
+            # Transactions see their uncommitted changes.
+            db.begin()
+            db.delete(files[0].oid)
+            assert files[0].oid not in list(db.scan(prefix="file_", keys_only=True))
+            db.rollback()
+            assert files[0].oid in list(db.scan(prefix="file_", keys_only=True))
+            db.close()
+            db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_write_lock(self, files, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # The shelve backend has no concurrency control of its own, so only the write
+        # lock keeps forked writers from losing each other's entities.
+        location = "tests/data/odb/locked/recsys.object_db"
+        db = ObjectDB(connection=ObjectDBConnection(location=location, backend="shelve"))
+        db.drop()
+
+        context = multiprocessing.get_context("fork")
+        processes = [context.Process(target=insert, args=(location, file)) for file in files]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            assert process.exitcode == 0
+
+        for file in files:
+            assert db.exists(file.oid)
+        assert os.path.exists(WriteLock(location).filepath)
+        db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /tests/test_core/test_database/test_pool.py                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday January 14th 2023 11:42:08 am                                              #
+# Modified   : Saturday January 14th 2023 11:42:08 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import sqlite3
+import threading
+import time
+from datetime import datetime
+import pytest
+import logging
+
+from recsys.core.database.base import Connection
+from recsys.core.database.pool import ConnectionPool
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+def connect():
+    return sqlite3.connect(":memory:", check_same_thread=False)
+
+
+class SQLiteStandIn(Connection):
+    def begin(self) -> None:
+        self._connection.execute("BEGIN")
+        self._in_transaction = True
+
+    def _create(self):
+        return connect()
+
+
+@pytest.mark.connection
+class TestConnectionPool:  # pragma: no cover
+    # ============================================================================================ #
+    def test_reuse(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        pool = ConnectionPool(factory=connect, max_size=2)
+        cnx1 = pool.acquire()
+        cnx2 = pool.acquire()
+        assert cnx1 is cnx2
+        pool.release()
+        assert pool.stats["checked_out"] == 1
+        pool.release()
+        assert pool.stats["checked_out"] == 0
+        assert pool.stats["idle"] == 1
+        # The idle connection is reused rather than a new one created.
+        assert pool.acquire() is cnx1
+        assert pool.stats["created"] == 1
+        pool.release()
+        pool.close()
+        assert pool.size == 0
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_max_size(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        pool = ConnectionPool(factory=connect, max_size=1, timeout=0.1)
+        acquired = threading.Event()
+        done = threading.Event()
+
+        def hold():
+            pool.acquire()
+            acquired.set()
+            done.wait()
+            pool.release()
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        acquired.wait()
+        with pytest.raises(TimeoutError):
+            pool.acquire()
+        done.set()
+        thread.join()
+        assert pool.acquire() is not None
+        assert pool.size == 1
+        pool.release()
+        pool.close()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_eviction(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        pool = ConnectionPool(factory=connect, max_size=2, max_idle=0.05, ping_interval=0)
+        cnx = pool.acquire()
+        pool.release()
+        time.sleep(0.1)
+        # Idle too long: closed and replaced.
+        assert pool.acquire() is not cnx
+        assert pool.stats["created"] == 2
+        pool.release()
+
+        # A broken connection fails the health check and is replaced.
+        cnx = pool.acquire()
+        pool.release()
+        cnx.close()
+        cnx2 = pool.acquire()
+        assert cnx2 is not cnx
+        assert cnx2.execute("SELECT 1").fetchone() == (1,)
+        assert pool.size == 1
+        pool.release()
+
+        # Discarded connections free their slot.
+        pool.acquire()
+        pool.release(discard=True)
+        assert pool.size == 0
+        pool.close()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_threads(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        pool = ConnectionPool(factory=connect, max_size=3, timeout=5)
+        errors = []
+
+        def work(i):
+            try:
+                for _ in range(20):
+                    cnx = pool.acquire()
+                    assert pool.acquire() is cnx
+                    assert cnx.execute("SELECT ?", (i,)).fetchone() == (i,)
+                    pool.release()
+                    pool.release()
+            except Exception as err:  # pragma: no cover
+                errors.append(err)
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+        assert pool.size <= 3
+        assert pool.stats["checked_out"] == 0
+        pool.close()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_pooled_connection(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        connection = SQLiteStandIn(pool_size=2)
+        connection.open()
+        cnx = connection._connection
+        connection.begin()
+        connection.close()
+        assert not connection.is_open
+        assert not connection.in_transaction
+        assert connection.pool.stats["idle"] == 1
+        connection.open()
+        assert connection._connection is cnx
+
+        # Each thread gets its own connection.
+        other = []
+        thread = threading.Thread(target=lambda: (connection.open(), other.append(connection._connection), connection.close()))
+        thread.start()
+        thread.join()
+        assert other[0] is not cnx
+        assert connection.is_open
+        connection.close()
+        assert connection.pool.size == 2
+        connection.pool.close()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
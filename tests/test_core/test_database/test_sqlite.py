@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /tests/test_core/test_database/test_sqlite.py                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday January 15th 2023 11:02:51 am                                                #
+# Modified   : Sunday January 15th 2023 11:02:51 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import time
+from dataclasses import fields
+from datetime import datetime
+import pytest
+import logging
+import mysql.connector
+import pandas as pd
+
+from recsys.core.dal.dao import DAO, DataSourceURLDAO, TaskDAO
+from recsys.core.dal.dba import DBA
+from recsys.core.dal.dto import DataSourceURLDTO, TaskDTO
+from recsys.core.dal.sql.database import DatabaseDDL
+from recsys.core.dal.sql.datasource_url import DataSourceURLDDL, DataSourceURLDML
+from recsys.core.dal.sql.task import TaskDDL, TaskDML
+from recsys.core.database.dialect import SQLiteDialect
+from recsys.core.database.relational import Database, SQLiteConnection
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+LOCATION = "tests/data/sqlite/recsys.sqlite3"
+DATABASE = Database(connection=SQLiteConnection(location=LOCATION))
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+def get_dao() -> DAO:
+    return TaskDAO(dml=TaskDML(), database=DATABASE)
+
+
+@pytest.mark.database
+class TestSQLite:  # pragma: no cover
+    # ============================================================================================ #
+    def test_setup(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dba = DBA(ddl=TaskDDL(), database=DATABASE)
+        dba.reset()
+        assert dba.exists()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_render(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dialect = SQLiteDialect()
+        sql = dialect.render(TaskDDL.create.sql)
+        assert "INTEGER PRIMARY KEY AUTOINCREMENT" in sql
+        assert "AUTO_INCREMENT" not in sql
+        assert dialect.render(TaskDDL.exists.sql) == "SELECT COUNT(name) FROM sqlite_master WHERE type = 'table' AND name = 'task';"
+        assert dialect.render(DatabaseDDL.create.sql) == "SELECT 1;"
+        sql = dialect.render(TaskDML.upsert.sql)
+        assert "ON CONFLICT DO UPDATE SET oid = excluded.oid" in sql
+        assert "LAST_INSERT_ID" not in sql
+        assert sql.endswith("RETURNING id;")
+        assert "%s" not in dialect.render(TaskDML.insert.sql)
+        # Rendered statements are cached, so the driver sees the same string each time.
+        assert dialect.render(TaskDML.insert.sql) is dialect.render(TaskDML.insert.sql)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_dao(self, jobs, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dao = get_dao()
+        dtos = [task.as_dto() for job in jobs for task in job.tasks.values()]
+        for i, dto in enumerate(dtos):
+            dto.parent_id = i % 5 + 1
+        dto = dao.create(dtos[0])
+        assert dto.id == 1
+        dtos = dao.create_many(dtos[1:])
+        assert [dto.id for dto in dtos] == list(range(2, 26))
+        assert len(dao) == 25
+
+        dto = dao.read(5)
+        assert dto.name == dtos[3].name
+        assert isinstance(dto.created, datetime)
+        dto.state = "COMPLETE"
+        assert dao.update(dto) == 1
+        assert dao.read(5).state == "COMPLETE"
+        # Rows matched, not rows changed, are reported.
+        assert dao.update(dto) == 1
+
+        dto.state = "UPSERTED"
+        dto = dao.upsert(dto)
+        assert dto.id == 5
+        assert dao.read(5).state == "UPSERTED"
+
+        assert sum(1 for _ in dao.iter_all(batch_size=4)) == 25
+
+        dao.delete(5)
+        assert not dao.exists(5)
+        assert len(dao) == 24
+        dto.id = 99
+        with pytest.raises(mysql.connector.ProgrammingError):
+            dao.update(dto)
+        with pytest.raises(mysql.connector.ProgrammingError):
+            dao.delete(99)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_transaction(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dao = get_dao()
+        dao.begin()
+        dao.delete(6)
+        assert not dao.exists(6)
+        dao.rollback()
+        assert dao.exists(6)
+
+        dao.begin()
+        dao.delete(6)
+        dao.save()
+        assert not dao.exists(6)
+        dao.close()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_prepared_statement(self, jobs, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        statement = DATABASE.prepare(TaskDML.insert)
+        assert statement is DATABASE.prepare(TaskDML.insert)
+        assert "%s" not in statement.sql
+        assert statement.parameters[:2] == ("oid", "name")
+        for task in jobs[0].tasks.values():
+            dto = task.as_dto()
+            for command in (TaskDML.insert, TaskDML.upsert, TaskDML.update):
+                assert DATABASE.prepare(command).bind(dto) == command(dto).args
+        assert DATABASE.prepare(TaskDML.select).parameters == ("id",)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_read_page(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dao = get_dao()
+        ids = list(dao.read_all().keys())
+        assert len(ids) > 3
+        page = dao.read_page(offset=1, limit=2)
+        assert list(page.keys()) == ids[1:3]
+        assert all(isinstance(dto, TaskDTO) for dto in page.values())
+        assert list(dao.read_page(offset=len(ids) - 1, limit=10).keys()) == ids[-1:]
+        assert dao.read_page(offset=len(ids), limit=10) == {}
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_group_commit(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        writer = Database(connection=SQLiteConnection(location=LOCATION), group_size=3, group_window=60)
+        reader = Database(connection=SQLiteConnection(location=LOCATION))
+        writer.create("CREATE TABLE IF NOT EXISTS grouped (id INTEGER PRIMARY KEY, value INT);")
+        writer.delete("DELETE FROM grouped;")
+        assert writer.pending == 2
+
+        def visible() -> int:
+            return reader.count("SELECT * FROM grouped")
+
+        # The third statement completes the group.
+        writer.insert("INSERT INTO grouped (value) VALUES (%s);", (1,))
+        assert writer.pending == 0
+        assert visible() == 1
+
+        # Statements in an open group aren't visible to other connections until it is committed.
+        writer.insert("INSERT INTO grouped (value) VALUES (%s);", (2,))
+        writer.insert("INSERT INTO grouped (value) VALUES (%s);", (3,))
+        assert writer.pending == 2
+        assert visible() == 1
+
+        # Reads don't count towards the group.
+        assert writer.count("SELECT * FROM grouped") == 3
+        assert writer.exists("SELECT EXISTS(SELECT 1 FROM grouped WHERE value = %s);", (3,))
+        assert writer.pending == 2
+        assert visible() == 1
+        writer.flush()
+        assert writer.pending == 0
+        assert visible() == 3
+
+        # Beginning a transaction commits the pending group, so a rollback can't discard it.
+        writer.insert("INSERT INTO grouped (value) VALUES (%s);", (4,))
+        writer.begin()
+        writer.insert("INSERT INTO grouped (value) VALUES (%s);", (5,))
+        writer.rollback()
+        assert visible() == 4
+
+        # An elapsed window commits the group with the next statement.
+        writer = Database(connection=SQLiteConnection(location=LOCATION), group_size=100, group_window=0.05)
+        writer.insert("INSERT INTO grouped (value) VALUES (%s);", (6,))
+        assert visible() == 4
+        time.sleep(0.1)
+        writer.insert("INSERT INTO grouped (value) VALUES (%s);", (7,))
+        assert writer.pending == 0
+        assert visible() == 6
+
+        # Closing commits the pending group.
+        writer.insert("INSERT INTO grouped (value) VALUES (%s);", (8,))
+        writer.close()
+        assert visible() == 7
+        writer.drop("DROP TABLE grouped;")
+        reader.close()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_read_all_frame(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dao = get_dao()
+        dtos = dao.read_all()
+        frame = dao.read_all_frame()
+        assert isinstance(frame, pd.DataFrame)
+        assert list(frame.columns) == [field.name for field in fields(TaskDTO)]
+        assert list(frame["id"]) == list(dtos.keys())
+        assert list(frame["name"]) == [dto.name for dto in dtos.values()]
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_datasource_url(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dba = DBA(ddl=DataSourceURLDDL(), database=DATABASE)
+        dba.reset()
+        dao = DataSourceURLDAO(dml=DataSourceURLDML(), database=DATABASE)
+        dto = DataSourceURLDTO(
+            id=None,
+            oid="datasource_url_1",
+            name="ratings",
+            description="MovieLens ratings.",
+            url="https://files.grouplens.org/datasets/movielens/ml-25m.zip",
+            mode="test",
+            parent_id=3,
+            created=datetime.now(),
+            modified=datetime.now(),
+        )
+        dto = dao.create(dto)
+        dto2 = dao.read(dto.id)
+        assert dto2.parent_id == 3
+        assert dto2.url == dto.url
+        assert list(dao.read_by_parent_id(3).keys()) == [dto.id]
+        dba.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
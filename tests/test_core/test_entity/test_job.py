@@ -17,6 +17,7 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 import inspect
+import pickle
 import pandas as pd
 from datetime import datetime
 import pytest
@@ -571,3 +572,63 @@ class TestJob:  # pragma: no cover
 
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_changes(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        job = Job(name=inspect.stack()[0][3], mode='test')
+        for i in range(1, 4):
+            job.add_task(job.create_task(name=f"task_{i}", description=f"Task {i}"))
+
+        # Tasks not yet persisted are added.
+        added, modified, removed = job.get_changes()
+        assert added == list(job.tasks.values())
+        assert modified == removed == []
+
+        # Simulate persistence, then change one task, add one and remove one.
+        for i, task in enumerate(job.tasks.values(), start=1):
+            task.id = i
+        job.clear_changes()
+        assert job.get_changes() == ([], [], [])
+
+        task = job.get_task("task_2")
+        task.state = "COMPLETE"
+        job.update_task(task)
+        new = job.create_task(name="task_4", description="Task 4")
+        job.add_task(new)
+        job.remove_task("task_3")
+        assert job.get_changes() == ([new], [task], [3])
+
+        # A job read from storage, including one pickled without a tracker, holds no changes.
+        new.id = 4
+        job.clear_changes()
+        assert pickle.loads(pickle.dumps(job)).get_changes() == ([], [], [])
+        state = job.__dict__.copy()
+        del state["_tracker"]
+        legacy = Job.__new__(Job)
+        legacy.__setstate__(state)
+        assert legacy.get_changes() == ([], [], [])
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -17,6 +17,7 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 import inspect
+import threading
 from datetime import datetime
 import pytest
 import logging
@@ -30,6 +31,7 @@ from recsys.core.entity.profile import Profile
 from recsys.core.dal.dao import DatasetDAO, DataFrameDAO, FileDAO, JobDAO, TaskDAO, DataSourceDAO, DataSourceURLDAO, ProfileDAO
 from recsys.core.dal.dto import DataFrameDTO
 from recsys.core.repo.context import Context
+from recsys.core.repo.job import JobRepo
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
@@ -245,3 +247,137 @@ class TestContext:  # pragma: no cover
 
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_context_factory(self, container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        container.dba.job().reset()
+        container.dba.task().reset()
+        container.dba.object().reset()
+        factory = container.repo.context_factory()
+        contexts = {}
+
+        def work(i: int) -> None:
+            context = factory.get_context()
+            assert factory.get_context() is context
+            repo = JobRepo(context)
+            job = Job(name=f"worker_job_{i}", description=f"Job persisted by worker {i}", mode="test")
+            for j in range(1, 4):
+                job.add_task(job.create_task(name=f"task_{j}_worker_{i}", description=f"Task {j}"))
+            context.begin()
+            repo.add(job)
+            context.save()
+            contexts[i] = context
+            factory.close()
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(1, 5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Each worker had its own context and connections.
+        assert len(contexts) == 4
+        assert len({id(context) for context in contexts.values()}) == 4
+        assert len({id(context.get_dao(Job)._database) for context in contexts.values()}) == 4
+
+        # Every worker's job and tasks were persisted.
+        repo = JobRepo(factory.get_context())
+        assert len(repo) == 4
+        for i in range(1, 5):
+            job = repo.get_by_name_mode(name=f"worker_job_{i}", mode="test")
+            assert len(job.tasks) == 3
+        factory.close()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_no_lost_update(self, container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        container.dba.job().reset()
+        container.dba.task().reset()
+        container.dba.object().reset()
+        database = container.database
+        a, b = [Context(container.dal, rdb=database.worker_rdb(), odb=database.worker_odb(),
+                        cache=database.worker_entity_cache()) for _ in range(2)]
+        repo_a, repo_b = JobRepo(a), JobRepo(b)
+
+        job = Job(name="shared_job", description="Job updated by two contexts", mode="test")
+        job.add_task(job.create_task(name="shared_task", description="Task updated by context b"))
+        a.begin()
+        repo_a.add(job)
+        a.save()
+
+        # Context a caches the job, then context b updates one of its tasks.
+        a.begin()
+        a.get_oao().read(job.oid)
+        a.save()
+        b.begin()
+        job_b = repo_b.get(job.id)
+        task = job_b.get_task("shared_task")
+        task.state = "COMPLETE"
+        job_b.update_task(task)
+        repo_b.update(job_b)
+        b.save()
+
+        # Context a's next transaction sees b's change, so its update doesn't overwrite it.
+        a.begin()
+        job_a = repo_a.get(job.id)
+        assert job_a.get_task("shared_task").state == "COMPLETE"
+        job_a.state = "COMPLETE"
+        repo_a.update(job_a)
+        a.save()
+
+        b.begin()
+        job_b = repo_b.get(job.id)
+        assert job_b.state == "COMPLETE"
+        assert job_b.get_task("shared_task").state == "COMPLETE"
+        b.save()
+        a.close()
+        b.close()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
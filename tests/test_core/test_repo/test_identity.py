@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems: Towards Deep Learning State-of-the-Art                         #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /tests/test_core/test_repo/test_identity.py                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Recommender-Systems                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Tuesday January 17th 2023 09:14:36 am                                               #
+# Modified   : Tuesday January 17th 2023 09:14:36 am                                               #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+from recsys.core.entity.job import Job, Task
+from recsys.core.repo.identity import IdentityMap
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+def build_job(id: int) -> Job:
+    job = Job(name=f"job_name_{id}", description=f"Description for Job # {id}", mode="test")
+    job.id = id
+    return job
+
+
+@pytest.mark.uow
+class TestIdentityMap:  # pragma: no cover
+
+    # ============================================================================================ #
+    def test_map(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        identity_map = IdentityMap()
+        job = build_job(1)
+        assert identity_map.add(job) is job
+        assert job.oid in identity_map
+        assert identity_map.get(job.oid) is job
+        assert identity_map.get_by_id(Job, 1) is job
+        assert identity_map.get_by_id(Task, 1) is None
+
+        # A second copy of the same entity resolves to the mapped instance.
+        copy = build_job(1)
+        assert identity_map.add(copy) is job
+        assert len(identity_map) == 1
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_dirty(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        identity_map = IdentityMap()
+        jobs = [build_job(i) for i in range(1, 4)]
+        for job in jobs:
+            identity_map.add(job)
+        assert identity_map.dirty == []
+
+        jobs[1].state = "IN-PROGRESS"
+        assert identity_map.is_dirty(jobs[1])
+        assert not identity_map.is_dirty(jobs[0])
+        assert identity_map.dirty == [jobs[1]]
+
+        # Persisting an entity marks it clean.
+        identity_map.clean(jobs[1])
+        assert identity_map.dirty == []
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_remove(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        identity_map = IdentityMap()
+        jobs = [build_job(i) for i in range(1, 4)]
+        for job in jobs:
+            identity_map.add(job)
+        identity_map.remove(jobs[0].oid)
+        assert jobs[0].oid not in identity_map
+        assert identity_map.get_by_id(Job, 1) is None
+        assert len(identity_map) == 2
+        identity_map.clear()
+        assert len(identity_map) == 0
+        assert identity_map.dirty == []
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_evict_written(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        identity_map = IdentityMap()
+        jobs = [build_job(i) for i in range(1, 4)]
+        for job in jobs:
+            identity_map.add(job)
+        # Entities persisted are evicted; entities only loaded remain mapped.
+        identity_map.clean(jobs[0])
+        identity_map.evict_written()
+        assert jobs[0].oid not in identity_map
+        assert identity_map.get(jobs[1].oid) is jobs[1]
+        assert len(identity_map) == 2
+
+        # Eviction only covers entities persisted since the last one.
+        identity_map.evict_written()
+        assert len(identity_map) == 2
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
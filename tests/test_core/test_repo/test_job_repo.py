@@ -431,6 +431,155 @@ class TestJobRepo:  # pragma: no cover
             )
         )
 
+    # ============================================================================================ #
+    def test_get_page(self, container, context, jobs, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\n\tStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        # ---------------------------------------------------------------------------------------- #
+        repo = JobRepo(context)
+        for job in jobs:
+            repo.add(job)
+
+        page = repo.get_page(offset=0, limit=2)
+        assert list(page.keys()) == [1, 2]
+        for id, job in page.items():
+            assert isinstance(job, Job)
+            assert job == repo.get(id)
+            assert len(job.tasks) == 5
+
+        page = repo.get_page(offset=2, limit=2)
+        assert list(page.keys()) == [3, 4]
+
+        page = repo.get_page(offset=4, limit=2)
+        assert list(page.keys()) == [5]
+
+        assert repo.get_page(offset=5, limit=2) == {}
+
+        self.reset_db(container)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+
+    # ============================================================================================ #
+    def test_identity_map(self, container, context, jobs, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\n\tStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        # ---------------------------------------------------------------------------------------- #
+        repo = JobRepo(context)
+        for job in jobs:
+            repo.add(job)
+        context.close()
+
+        # Each read of a job within the context returns the same instance.
+        j1 = repo.get(2)
+        assert repo.get(2) is j1
+        assert repo.get_by_name_mode(name="job_name_2") is j1
+        assert repo.get_page(offset=1, limit=1)[2] is j1
+
+        j1.state = "IN-PROGRESS"
+        assert context.identity_map.dirty == [j1]
+        repo.update(j1)
+        assert context.identity_map.dirty == []
+
+        # Closing the context discards the map.
+        context.close()
+        assert repo.get(2) is not j1
+        assert repo.get(2) == j1
+
+        self.reset_db(container)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+
+    # ============================================================================================ #
+    def test_partial_update(self, container, context, jobs, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\n\tStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        # ---------------------------------------------------------------------------------------- #
+        repo = JobRepo(context)
+        task_dao = context.get_dao(Task)
+        job = jobs[0]
+        repo.add(job)
+        context.save()
+
+        # Flipping one task's state writes that task's row only.
+        written = []
+        update_many = repo._task_dao.update_many
+        repo._task_dao.update_many = lambda dtos: written.extend(dtos) or update_many(dtos)
+        task = job.get_task("task_3_job_1")
+        task.state = "COMPLETE"
+        job.update_task(task)
+        repo.update(job)
+        assert [dto.id for dto in written] == [task.id]
+
+        # Added and removed tasks are inserted and deleted.
+        new = job.create_task(name="task_6_job_1", description="Description for task 6 of job 1")
+        job.add_task(new)
+        removed = job.get_task("task_1_job_1")
+        job.remove_task(removed.name)
+        repo.update(job)
+        assert new.id is not None
+        assert task_dao.exists(new.id)
+        assert not task_dao.exists(removed.id)
+        assert task_dao.read(task.id).state == "COMPLETE"
+        assert job.get_changes() == ([], [], [])
+
+        self.reset_db(container)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+
     # ============================================================================================ #
     def test_print(self, context, jobs, caplog):
         start = datetime.now()
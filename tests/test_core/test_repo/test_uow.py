@@ -164,3 +164,67 @@ class TestUOW:  # pragma: no cover
 
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_deferred_flush(self, container, jobs, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        uow = self.test_reset(container)
+        container.dba.job().reset()
+        container.dba.task().reset()
+        repo = uow.get_repo("job")
+        updates = []
+        update = repo.update
+        repo.update = lambda entity: updates.append(entity.oid) or update(entity)
+
+        # New entities are written on save, not when registered.
+        for job in jobs[:4]:
+            uow.register_new("job", job)
+        assert len(repo) == 0
+        uow.save()
+        assert len(repo) == 4
+
+        # Repeated changes to the same entity collapse into a single write, and
+        # registered entities that haven't changed since they were loaded aren't
+        # written at all. Saving ends the scope of loaded entities, so reload them.
+        job = repo.get(jobs[0].id)
+        for task in job.tasks.values():
+            task.state = "COMPLETE"
+            job.update_task(task)
+            uow.register_dirty("job", job)
+        uow.register_dirty("job", repo.get(jobs[1].id))
+        uow.save()
+        assert updates == [job.oid]
+
+        # Removals are written on save. An entity added and removed before the
+        # save is never written.
+        uow.register_removed("job", jobs[2])
+        uow.register_new("job", jobs[4])
+        uow.register_removed("job", jobs[4])
+        assert repo.exists(jobs[2].id)
+        uow.save()
+        assert not repo.exists(jobs[2].id)
+        assert len(repo) == 3
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)